@@ -10,7 +10,7 @@ import gradio as gr
 import pandas as pd
 from plotly.io import show
 
-from src.utils.graphics import create_dashboard_from_json
+from src.utils.graphics import render_dashboard_from_json
 
 
 
@@ -34,8 +34,8 @@ if gr.NO_RELOAD:
     from src.back.graphs import get_main_graph
     main_graph = get_main_graph()
 
-def invoke_graph(user_query: str, n_phrases: int) -> Dict[str, Any]:
-    return main_graph.invoke({
+async def invoke_graph(user_query: str, n_phrases: int) -> Dict[str, Any]:
+    return await main_graph.ainvoke({
         'user_query': user_query,
         'n_phrases': n_phrases,
     })
@@ -58,7 +58,7 @@ def show_results(graph_response) -> Dict:
     """
     
     global_ok = graph_response.get('global_execution_ok')
-    has_graphics = graph_response.get('graphics_json') is not None
+    has_graphics = graph_response.get('graphics_data') is not None
     
     return {
         user_query_input_section: gr.update(visible=False),
@@ -84,7 +84,7 @@ def show_results(graph_response) -> Dict:
             and has_graphics
         )),
         graphic_plot: (
-            create_dashboard_from_json(graph_response['graphics_json'], 800, None)
+            render_dashboard_from_json(graph_response['graphics_data'], 800, None)
             if has_graphics else
             None
         ),
@@ -0,0 +1,42 @@
+"""Logging configuration shared by the graphs package.
+
+Every module of the package logs through a child of the `graphs` logger,
+which is configured once here instead of calling `logging.basicConfig`
+on each module import.
+"""
+
+import logging
+
+
+_ROOT_LOGGER_NAME = 'graphs'
+_LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+
+def _configure_root_logger() -> logging.Logger:
+    """Attaches a single stream handler to the package root logger."""
+    root_logger = logging.getLogger(_ROOT_LOGGER_NAME)
+
+    if not root_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+        root_logger.addHandler(handler)
+        root_logger.setLevel(logging.INFO)
+        root_logger.propagate = False
+
+    return root_logger
+
+
+_configure_root_logger()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Returns a named child of the package root logger.
+
+    Args:
+        name: The logger name relative to the package, e.g. 'conclusions'.
+
+    Returns:
+        The `graphs.<name>` logger.
+    """
+    return logging.getLogger(f'{_ROOT_LOGGER_NAME}.{name}')
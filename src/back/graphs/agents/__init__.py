@@ -15,11 +15,15 @@ from .generators import (
     OnFailResponseGenerator,
 )
 from .graders import (
+    GRADER_REGISTRY,
     AnswerGrader,
+    BatchRetrievalGrader,
     BusinessRelevanceGrader,
+    CompositeGrader,
     GlobalRetrievalGrader,
     HallucinationGrader,
     RetrievalGrader,
+    get_grader,
 )
 from .retrievals import (
     BusinessLogicRetriever,
@@ -28,13 +32,16 @@ from .retrievals import (
 
 
 __all__ = [
+    'GRADER_REGISTRY',
     'AnswerGrader',
     'BaseAgent',
     'BaseRetrievalAgent',
+    'BatchRetrievalGrader',
     'BusinessLogicRetriever',
     'BusinessLogicSummarizer',
     'BusinessRelevanceGrader',
     'ChunkSummaryGenerator',
+    'CompositeGrader',
     'DbSchemaExtractor',
     'GlobalContextGenerator',
     'GlobalRetrievalGrader',
@@ -45,4 +52,5 @@ __all__ = [
     'NoRelevantContextGenerator',
     'OnFailResponseGenerator',
     'RetrievalGrader',
+    'get_grader',
 ]
\ No newline at end of file
@@ -1,14 +1,46 @@
 
-from typing import Dict, Optional, Sequence, Type, Union
-from pydantic import BaseModel
+from __future__ import annotations
+
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Literal, Optional, Sequence, Type, Union
 from langchain_core.language_models import BaseChatModel
-from langchain_core.runnables import RunnableSequence
-from langchain.tools import BaseTool
+from langchain_core.runnables import RunnableLambda
+from langchain_core.utils.function_calling import convert_to_openai_function
+from pydantic import BaseModel, TypeAdapter
 
-from ..prompts import BasePrompt
-from ..models import llm_retrievals
+from .. import models
 from ..pydantic_models import create_retriever_input_class
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableSequence
+    from langchain.tools import BaseTool
+
+    from ..prompts import BasePrompt
+
+
+
+def _is_pydantic_class(value) -> bool:
+    """Checks whether a structured output schema is a pydantic model class."""
+    return isinstance(value, type) and issubclass(value, BaseModel)
+
+
+@lru_cache(maxsize= None)
+def _get_openai_function(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """Converts a result model to its OpenAI function schema once per model."""
+    return convert_to_openai_function(schema)
+
+
+@lru_cache(maxsize= None)
+def _get_schema_properties(schema: Type[BaseModel]) -> FrozenSet[str]:
+    """Returns the JSON schema property names of a result model, generated once per model."""
+    return frozenset(schema.model_json_schema()['properties'])
+
+
+@lru_cache(maxsize= None)
+def _get_type_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Builds the validator of a result model once per model."""
+    return TypeAdapter(schema)
+
 
 
 class BaseAgent:
@@ -18,8 +50,46 @@ class BaseAgent:
     This class encapsulates a Large Language Model (LLM), a structured output schema,
     and a prompt constructor. It is designed to work with a unified prompt class
     that can handle both system-only and system-and-human prompts.
+
+    The default LLMs of every agent share a single pooled HTTP client, so
+    concurrent agents reuse open connections to the model endpoint.
+
+    Agents that define a `_prompt_cache_key` send it with every request, so the
+    provider routes calls sharing the same static system prompt to the same
+    prefix cache.
     """
 
+    _default_llm: Optional[str] = None
+    _default_fast_llm: Optional[str] = None
+    _fast_structured_output: bool = False
+    _prompt_cache_key: Optional[str] = None
+
+    @classmethod
+    def _get_default_llm(
+        cls,
+        precision: Literal['fast', 'accurate'] = 'accurate'
+    ) -> Optional[BaseChatModel]:
+        """
+        Returns the default LLM of the agent for the requested precision.
+
+        Agents without a fast variant fall back to their accurate default LLM.
+        The defaults are stored as names of the `models` package, so each chat
+        model is only built when the first agent using it is created.
+
+        Raises:
+            ValueError: If `precision` is not 'fast' or 'accurate'.
+        """
+        if precision not in ('fast', 'accurate'):
+            raise ValueError("'precision' must be either 'fast' or 'accurate'.")
+
+        if precision == 'fast' and cls._default_fast_llm is not None:
+            return getattr(models, cls._default_fast_llm)
+
+        if cls._default_llm is None:
+            return None
+
+        return getattr(models, cls._default_llm)
+
     def __init__(
         self,
         llm: BaseChatModel,
@@ -66,6 +136,7 @@ class BaseAgent:
         if not isinstance(value, BaseChatModel):
             raise TypeError("llm must be an instance of BaseChatModel.")
         self._llm = value
+        self._reset_runnable()
 
 
     @property
@@ -77,6 +148,7 @@ class BaseAgent:
     def prompt_constructor(self, value: BasePrompt):
         """Sets the prompt constructor instance."""
         self._prompt_constructor = value
+        self._reset_runnable()
 
 
     @property
@@ -88,6 +160,19 @@ class BaseAgent:
     def structured_output(self, value: Optional[Union[BaseModel, Dict, Type]]):
         """Sets the structured output schema."""
         self._structured_output = value
+        self._reset_runnable()
+
+
+    @property
+    def structured_output_properties(self) -> FrozenSet[str]:
+        """
+        Gets the property names of the structured output schema.
+
+        The JSON schema of a model is only generated once per model class.
+        """
+        if _is_pydantic_class(self._structured_output):
+            return _get_schema_properties(self._structured_output)
+        return frozenset(self._structured_output.model_json_schema()['properties'])
 
 
     @property
@@ -99,27 +184,85 @@ class BaseAgent:
     def tools(self, value: Optional[Sequence[BaseTool]]):
         """Sets the sequence of tools."""
         self._tools = value
+        self._reset_runnable()
 
 
+    @cached_property
+    def runnable(self) -> RunnableSequence:
+        """
+        The LangChain runnable of the agent, built once and shared by every node
+        and edge using the agent until one of its components is replaced.
+        """
+        return self._build_runnable()
+
     def get_runnable(self) -> RunnableSequence:
         """
-        Creates and returns a LangChain runnable.
+        Returns the LangChain runnable of the agent, building it on the first call.
+        """
+        return self.runnable
+
+    def _reset_runnable(self) -> None:
+        """Discards the cached runnable, so it is rebuilt on next access."""
+        self.__dict__.pop('runnable', None)
+
+    def _build_runnable(self) -> RunnableSequence:
+        """
+        Creates a LangChain runnable.
 
         The runnable chains the prompt, the LLM, and either a structured output parser or tool binding.
         """
+        llm = self._get_prompt_cached_llm()
+
         if self._structured_output is not None:
-            llm_chain = self._llm.with_structured_output(self._structured_output)
+            if self._fast_structured_output and _is_pydantic_class(self._structured_output):
+                llm_chain = self._get_fast_structured_chain(llm, self._structured_output)
+            else:
+                llm_chain = llm.with_structured_output(self._structured_output)
 
         elif self._tools is not None:
-            llm_chain = self._llm.bind_tools(self._tools)
+            llm_chain = llm.bind_tools(self._tools)
 
         else:
-            llm_chain = self._llm
+            llm_chain = llm
         
 
         return self._prompt_constructor() | llm_chain
 
 
+    def _get_prompt_cached_llm(self) -> BaseChatModel:
+        """
+        Returns the agent LLM configured with its prompt cache key, if any.
+
+        The key travels in the request body, so it is only applied to chat models
+        exposing an `extra_body` field (OpenAI and Azure OpenAI). A shallow copy
+        is returned to keep the shared default LLM and its HTTP client untouched.
+        """
+        if self._prompt_cache_key is None or 'extra_body' not in type(self._llm).model_fields:
+            return self._llm
+
+        extra_body = {**(self._llm.extra_body or {}), 'prompt_cache_key': self._prompt_cache_key}
+        return self._llm.model_copy(update= {'extra_body': extra_body})
+
+
+    def _get_fast_structured_chain(
+        self,
+        llm: BaseChatModel,
+        schema: Type[BaseModel]
+    ) -> RunnableSequence:
+        """
+        Builds a structured output chain that bypasses the LangChain pydantic parser.
+
+        The LLM is bound to the JSON schema of `schema`, so it returns plain dict
+        arguments. The schema is not sent in strict mode, so the arguments are
+        always validated through a `TypeAdapter` built once per model, which
+        rejects missing fields and coerces or rejects mistyped values.
+        """
+        return (
+            llm.with_structured_output(_get_openai_function(schema))
+            | RunnableLambda(_get_type_adapter(schema).validate_python)
+        )
+
+
 
 class BaseRetrievalAgent(BaseAgent):
     """
@@ -131,7 +274,7 @@ class BaseRetrievalAgent(BaseAgent):
     parameters, ensuring a consistent and predictable state.
     """
 
-    _default_llm = llm_retrievals
+    _default_llm = 'llm_retrievals'
     _default_max_subqueries = 5
 
     @staticmethod
@@ -166,7 +309,7 @@ class BaseRetrievalAgent(BaseAgent):
             self._max_subqueries = max_subqueries
         
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(),
             prompt_constructor= prompt_constructor,
             structured_output= self._get_structured_output(self._max_subqueries),
         )
@@ -1,13 +1,15 @@
 
-from typing import Dict, Optional, Type, Union
-from pydantic import BaseModel
-from langchain_core.language_models import BaseChatModel
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Type, Union
 
 from .base import BaseAgent
-from ..models import llm_classifiers
-from ..prompts import LanguageClassifierPrompt
 from ..pydantic_models import LanguageClassifierResult
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from langchain_core.language_models import BaseChatModel
+
 
 
 class LanguageClassifier(BaseAgent):
@@ -19,8 +21,10 @@ class LanguageClassifier(BaseAgent):
     for language classification tasks out of the box.
     """
 
-    _default_llm = llm_classifiers
+    _default_llm = 'llm_classifiers'
+    _default_fast_llm = 'llm_classifiers_fast'
     _default_structured_output = LanguageClassifierResult
+    _fast_structured_output = True
 
     def __init__(
         self,
@@ -28,6 +32,7 @@ class LanguageClassifier(BaseAgent):
         system_prompt: Optional[str] = None,
         human_message: Optional[str] = None,
         structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
     ):
         """
         Initializes the LanguageClassifier agent.
@@ -42,9 +47,13 @@ class LanguageClassifier(BaseAgent):
             structured_output: The schema that defines the expected output structure.
                     Defaults to a predefined result schema for language classification
                     if not provided.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller classifier model and 'accurate' the standard one.
         """
+        from ..prompts import LanguageClassifierPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(precision),
             prompt_constructor= LanguageClassifierPrompt(
                 system_prompt= system_prompt,
                 human_message= human_message,
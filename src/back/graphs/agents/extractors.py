@@ -1,13 +1,15 @@
 
-from typing import Dict, Optional, Type, Union
-from pydantic import BaseModel
-from langchain_core.language_models import BaseChatModel
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Type, Union
 
 from .base import BaseAgent
-from ..models import llm_retrievals
-from ..prompts import DbSchemaExtractorPrompt
 from ..pydantic_models import DbSchemaExtractionResult
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from langchain_core.language_models import BaseChatModel
+
 
 
 class DbSchemaExtractor(BaseAgent):
@@ -21,7 +23,8 @@ class DbSchemaExtractor(BaseAgent):
     pipelines.
     """
 
-    _default_llm = llm_retrievals
+    _default_llm = 'llm_retrievals'
+    _default_fast_llm = 'llm_classifiers_fast'
     _default_structured_output = DbSchemaExtractionResult
 
     def __init__(
@@ -29,6 +32,7 @@ class DbSchemaExtractor(BaseAgent):
         llm: Optional[BaseChatModel] = None,
         system_prompt: Optional[str] = None,
         structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
     ):
         """
         Initializes the LanguageClassifier agent.
@@ -40,9 +44,13 @@ class DbSchemaExtractor(BaseAgent):
                     a predefined message if not provided.
             structured_output: The schema that defines the expected output structure.
                     Defaults to a predefined result schema for DB Schema extraction.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller classifier model and 'accurate' the standard retrievals one.
         """
+        from ..prompts import DbSchemaExtractorPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(precision),
             prompt_constructor= DbSchemaExtractorPrompt(
                 system_prompt= system_prompt,
             ),
@@ -1,18 +1,9 @@
 
-from typing import Dict, Optional, Type, Union
-from pydantic import BaseModel
-from langchain_core.language_models import BaseChatModel
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
 
 from .base import BaseAgent
-from ..models import llm_generators
-from ..prompts import (
-    OnFailResponseGeneratorPrompt,
-    ChunkSummaryGeneratorPrompt,
-    BusinessLogicSummarizerPrompt,
-    MdlSummarizerPrompt,
-    GlobalContextGeneratorPrompt,
-    NoRelevantContextGeneratorPrompt,
-)
 from ..pydantic_models import (
     OnFailResponseGeneratorResult,
     ChunkSummaryGeneratorResult,
@@ -22,6 +13,10 @@ from ..pydantic_models import (
     NoRelevantContextGeneratorResult,
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from langchain_core.language_models import BaseChatModel
+
 
 
 class OnFailResponseGenerator(BaseAgent):
@@ -32,7 +27,7 @@ class OnFailResponseGenerator(BaseAgent):
     for response generation.
     """
 
-    _default_llm = llm_generators
+    _default_llm = 'llm_generators'
     _default_structured_output = OnFailResponseGeneratorResult
 
     def __init__(
@@ -50,8 +45,10 @@ class OnFailResponseGenerator(BaseAgent):
             structured_output: The schema for the output. Defaults to a predefined
                     result schema for natural language output.
         """
+        from ..prompts import OnFailResponseGeneratorPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(),
             prompt_constructor= OnFailResponseGeneratorPrompt(
                 system_prompt= system_prompt,
             ),
@@ -69,7 +66,7 @@ class ChunkSummaryGenerator(BaseAgent):
     is returned in a consistent format.
     """
 
-    _default_llm = llm_generators
+    _default_llm = 'llm_generators'
     _default_structured_output = ChunkSummaryGeneratorResult
 
     def __init__(
@@ -87,8 +84,10 @@ class ChunkSummaryGenerator(BaseAgent):
             structured_output: The schema for the output. Defaults to a predefined
                     result schema for chunk summaries.
         """
+        from ..prompts import ChunkSummaryGeneratorPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(),
             prompt_constructor= ChunkSummaryGeneratorPrompt(
                 system_prompt= system_prompt,
             ),
@@ -105,7 +104,7 @@ class BusinessLogicSummarizer(BaseAgent):
     by using a dedicated prompt and a structured output schema for the results.
     """
 
-    _default_llm = llm_generators
+    _default_llm = 'llm_generators'
     _default_structured_output = BusinessLogicSummarizerResult
 
     def __init__(
@@ -123,8 +122,10 @@ class BusinessLogicSummarizer(BaseAgent):
             structured_output: The schema for the output. Defaults to a predefined
                     result schema for business logic summaries.
         """
+        from ..prompts import BusinessLogicSummarizerPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(),
             prompt_constructor= BusinessLogicSummarizerPrompt(
                 system_prompt= system_prompt,
             ),
@@ -141,7 +142,7 @@ class MdlSummarizer(BaseAgent):
     a specific prompt and output schema tailored for the task.
     """
 
-    _default_llm = llm_generators
+    _default_llm = 'llm_generators'
     _default_structured_output = MdlSummarizerResult
 
     def __init__(
@@ -159,8 +160,10 @@ class MdlSummarizer(BaseAgent):
             structured_output: The schema for the output. Defaults to a predefined
                     result schema for MDL summaries.
         """
+        from ..prompts import MdlSummarizerPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(),
             prompt_constructor= MdlSummarizerPrompt(
                 system_prompt= system_prompt,
             ),
@@ -177,7 +180,7 @@ class GlobalContextGenerator(BaseAgent):
     global context using a dedicated prompt and structured output schema.
     """
 
-    _default_llm = llm_generators
+    _default_llm = 'llm_generators'
     _default_structured_output = GlobalContextGeneratorResult
 
     def __init__(
@@ -195,8 +198,10 @@ class GlobalContextGenerator(BaseAgent):
             structured_output: The schema for the output. Defaults to a predefined
                     result schema for global context generation.
         """
+        from ..prompts import GlobalContextGeneratorPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(),
             prompt_constructor= GlobalContextGeneratorPrompt(
                 system_prompt= system_prompt,
             ),
@@ -213,7 +218,7 @@ class NoRelevantContextGenerator(BaseAgent):
     for situations where a search or retrieval process yields no results.
     """
 
-    _default_llm = llm_generators
+    _default_llm = 'llm_generators'
     _default_structured_output = NoRelevantContextGeneratorResult
 
     def __init__(
@@ -231,8 +236,10 @@ class NoRelevantContextGenerator(BaseAgent):
             structured_output: The schema for the output. Defaults to a predefined
                     result schema for generating no-context responses.
         """
+        from ..prompts import NoRelevantContextGeneratorPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(),
             prompt_constructor= NoRelevantContextGeneratorPrompt(
                 system_prompt= system_prompt,
             ),
@@ -1,26 +1,24 @@
 
-from typing import Dict, Optional, Type, Union
-from pydantic import BaseModel
-from langchain_core.language_models import BaseChatModel
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Literal, Optional, Type, Union
 
 
 from .base import BaseAgent
-from ..models import llm_graders
-from ..prompts import (
-    BusinessRelevanceGraderPrompt,
-    RetrievalGraderPrompt,
-    HallucinationGraderPrompt,
-    AnswerGraderPrompt,
-    GlobalRetrievalGraderPrompt,
-)
 from ..pydantic_models import (
+    BatchRetrievalGraderResult,
     BusinessRelevanceGraderResult,
+    CompositeGraderResult,
     RetrievalGraderResult,
     GlobalRetrievalGraderResult,
     HallucinationGraderResult,
     AnswerGraderResult,
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from langchain_core.language_models import BaseChatModel
+
 
 
 class BusinessRelevanceGrader(BaseAgent):
@@ -32,8 +30,11 @@ class BusinessRelevanceGrader(BaseAgent):
     to the given question.
     """
 
-    _default_llm = llm_graders
+    _default_llm = 'llm_graders'
+    _default_fast_llm = 'llm_graders_fast'
     _default_structured_output = BusinessRelevanceGraderResult
+    _fast_structured_output = True
+    _prompt_cache_key = 'business_relevance_grader_v1'
 
     def __init__(
         self,
@@ -41,6 +42,7 @@ class BusinessRelevanceGrader(BaseAgent):
         system_prompt: Optional[str] = None,
         human_message: Optional[str] = None,
         structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
     ):
         """
         Initializes the business relevance grader agent.
@@ -50,9 +52,13 @@ class BusinessRelevanceGrader(BaseAgent):
             system_prompt: The system message. Defaults to a predefined message.
             human_message: The human message. Defaults to a predefined message.
             structured_output: The output schema. Defaults to a predefined result schema.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller grader model and 'accurate' the standard one.
         """
+        from ..prompts import BusinessRelevanceGraderPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(precision),
             prompt_constructor= BusinessRelevanceGraderPrompt(
                 system_prompt= system_prompt,
                 human_message= human_message,
@@ -71,8 +77,11 @@ class RetrievalGrader(BaseAgent):
     to the given question.
     """
 
-    _default_llm = llm_graders
+    _default_llm = 'llm_graders'
+    _default_fast_llm = 'llm_graders_fast'
     _default_structured_output = RetrievalGraderResult
+    _fast_structured_output = True
+    _prompt_cache_key = 'retrieval_grader_v1'
 
     def __init__(
         self,
@@ -80,6 +89,7 @@ class RetrievalGrader(BaseAgent):
         system_prompt: Optional[str] = None,
         human_message: Optional[str] = None,
         structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
     ):
         """
         Initializes the retrieval grader agent.
@@ -89,9 +99,13 @@ class RetrievalGrader(BaseAgent):
             system_prompt: The system message. Defaults to a predefined message.
             human_message: The human message. Defaults to a predefined message.
             structured_output: The output schema. Defaults to a predefined result schema.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller grader model and 'accurate' the standard one.
         """
+        from ..prompts import RetrievalGraderPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(precision),
             prompt_constructor= RetrievalGraderPrompt(
                 system_prompt= system_prompt,
                 human_message= human_message,
@@ -101,6 +115,53 @@ class RetrievalGrader(BaseAgent):
 
 
 
+class BatchRetrievalGrader(BaseAgent):
+    """
+    An agent for grading the relevance of several retrieved documents in a single call.
+
+    This class specializes `BaseAgent` with a default LLM, a dedicated prompt constructor,
+    and a structured output schema that returns one relevance grade per labeled
+    document, so the system prompt and request overhead are paid once per batch.
+    """
+
+    _default_llm = 'llm_graders'
+    _default_fast_llm = 'llm_graders_fast'
+    _default_structured_output = BatchRetrievalGraderResult
+    _fast_structured_output = True
+    _prompt_cache_key = 'batch_retrieval_grader_v1'
+
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        system_prompt: Optional[str] = None,
+        human_message: Optional[str] = None,
+        structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
+    ):
+        """
+        Initializes the batched retrieval grader agent.
+
+        Args:
+            llm: The LangChain chat model. Defaults to a predefined grader model.
+            system_prompt: The system message. Defaults to a predefined message.
+            human_message: The human message. Defaults to a predefined message.
+            structured_output: The output schema. Defaults to a predefined result schema.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller grader model and 'accurate' the standard one.
+        """
+        from ..prompts import BatchRetrievalGraderPrompt
+
+        super().__init__(
+            llm= llm or self._get_default_llm(precision),
+            prompt_constructor= BatchRetrievalGraderPrompt(
+                system_prompt= system_prompt,
+                human_message= human_message,
+            ),
+            structured_output= structured_output or self._default_structured_output
+        )
+
+
+
 class HallucinationGrader(BaseAgent):
     """
     An agent for grading a generated answer for hallucinations against its source documents.
@@ -110,8 +171,11 @@ class HallucinationGrader(BaseAgent):
     by the provided context.
     """
 
-    _default_llm = llm_graders
+    _default_llm = 'llm_graders'
+    _default_fast_llm = 'llm_graders_fast'
     _default_structured_output = HallucinationGraderResult
+    _fast_structured_output = True
+    _prompt_cache_key = 'hallucination_grader_v1'
 
     def __init__(
         self,
@@ -119,6 +183,7 @@ class HallucinationGrader(BaseAgent):
         system_prompt: Optional[str] = None,
         human_message: Optional[str] = None,
         structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
     ):
         """
         Initializes the hallucination grader agent.
@@ -128,9 +193,13 @@ class HallucinationGrader(BaseAgent):
             system_prompt: The system message. Defaults to a predefined message.
             human_message: The human message. Defaults to a predefined message.
             structured_output: The output schema. Defaults to a predefined result schema.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller grader model and 'accurate' the standard one.
         """
+        from ..prompts import HallucinationGraderPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(precision),
             prompt_constructor= HallucinationGraderPrompt(
                 system_prompt= system_prompt,
                 human_message= human_message,
@@ -149,8 +218,11 @@ class AnswerGrader(BaseAgent):
     to the original query.
     """
 
-    _default_llm = llm_graders
+    _default_llm = 'llm_graders'
+    _default_fast_llm = 'llm_graders_fast'
     _default_structured_output = AnswerGraderResult
+    _fast_structured_output = True
+    _prompt_cache_key = 'answer_grader_v1'
 
     def __init__(
         self,
@@ -158,6 +230,7 @@ class AnswerGrader(BaseAgent):
         system_prompt: Optional[str] = None,
         human_message: Optional[str] = None,
         structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
     ):
         """
         Initializes the answer grader agent.
@@ -167,9 +240,13 @@ class AnswerGrader(BaseAgent):
             system_prompt: The system message. Defaults to a predefined message.
             human_message: The human message. Defaults to a predefined message.
             structured_output: The output schema. Defaults to a predefined result schema.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller grader model and 'accurate' the standard one.
         """
+        from ..prompts import AnswerGraderPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(precision),
             prompt_constructor= AnswerGraderPrompt(
                 system_prompt= system_prompt,
                 human_message= human_message,
@@ -179,6 +256,53 @@ class AnswerGrader(BaseAgent):
 
 
 
+class CompositeGrader(BaseAgent):
+    """
+    An agent for grading a generated answer for hallucinations and question relevance at once.
+
+    This class specializes `BaseAgent` with a default LLM, a dedicated prompt constructor,
+    and a structured output schema that returns both the `grounded` and `addresses`
+    judgments in a single call, halving the grading calls per generated summary.
+    """
+
+    _default_llm = 'llm_graders'
+    _default_fast_llm = 'llm_graders_fast'
+    _default_structured_output = CompositeGraderResult
+    _fast_structured_output = True
+    _prompt_cache_key = 'composite_grader_v1'
+
+    def __init__(
+        self,
+        llm: Optional[BaseChatModel] = None,
+        system_prompt: Optional[str] = None,
+        human_message: Optional[str] = None,
+        structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
+    ):
+        """
+        Initializes the composite grader agent.
+
+        Args:
+            llm: The LangChain chat model. Defaults to a predefined grader model.
+            system_prompt: The system message. Defaults to a predefined message.
+            human_message: The human message. Defaults to a predefined message.
+            structured_output: The output schema. Defaults to a predefined result schema.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller grader model and 'accurate' the standard one.
+        """
+        from ..prompts import CompositeGraderPrompt
+
+        super().__init__(
+            llm= llm or self._get_default_llm(precision),
+            prompt_constructor= CompositeGraderPrompt(
+                system_prompt= system_prompt,
+                human_message= human_message,
+            ),
+            structured_output= structured_output or self._default_structured_output
+        )
+
+
+
 class GlobalRetrievalGrader(BaseAgent):
     """
     An agent for grading the relevance of global business context against a user's query.
@@ -188,14 +312,18 @@ class GlobalRetrievalGrader(BaseAgent):
     to the given question.
     """
 
-    _default_llm = llm_graders
+    _default_llm = 'llm_graders'
+    _default_fast_llm = 'llm_graders_fast'
     _default_structured_output = GlobalRetrievalGraderResult
+    _fast_structured_output = True
+    _prompt_cache_key = 'global_retrieval_grader_v1'
 
     def __init__(
         self,
         llm: Optional[BaseChatModel] = None,
         system_prompt: Optional[str] = None,
         structured_output: Optional[Union[BaseModel, Dict, Type]] = None,
+        precision: Literal['fast', 'accurate'] = 'fast',
     ):
         """
         Initializes the retrieval grader agent.
@@ -204,12 +332,54 @@ class GlobalRetrievalGrader(BaseAgent):
             llm: The LangChain chat model. Defaults to a predefined grader model.
             system_prompt: The system message. Defaults to a predefined message.
             structured_output: The output schema. Defaults to a predefined result schema.
+            precision: Which default LLM to use when `llm` is not provided. 'fast' selects
+                    the smaller grader model and 'accurate' the standard one.
         """
+        from ..prompts import GlobalRetrievalGraderPrompt
+
         super().__init__(
-            llm= llm or self._default_llm,
+            llm= llm or self._get_default_llm(precision),
             prompt_constructor= GlobalRetrievalGraderPrompt(
                 system_prompt= system_prompt,
             ),
             structured_output= structured_output or self._default_structured_output
         )
 
+
+
+
+GRADER_REGISTRY: Dict[str, Type[BaseAgent]] = {
+    'business_relevance': BusinessRelevanceGrader,
+    'retrieval': RetrievalGrader,
+    'batch_retrieval': BatchRetrievalGrader,
+    'global_retrieval': GlobalRetrievalGrader,
+    'hallucination': HallucinationGrader,
+    'answer': AnswerGrader,
+    'composite': CompositeGrader,
+}
+"""Maps a grader tag to its agent class, so callers dispatch with a lookup instead of branching."""
+
+
+
+def get_grader(tag: str) -> BaseAgent:
+    """
+    Builds a new default grader agent for a grader tag.
+
+    Every caller gets its own instance, so reconfiguring the grader of one edge
+    or node does not affect any other graph. The costly parts are shared anyway:
+    chat models are built once per configuration and output schemas are
+    converted once per model.
+
+    Args:
+        tag: The grader tag, one of the keys of `GRADER_REGISTRY`.
+
+    Returns:
+        A new instance of the grader agent registered for the tag.
+
+    Raises:
+        ValueError: If the tag is not registered.
+    """
+    grader_class = GRADER_REGISTRY.get(tag)
+    if grader_class is None:
+        raise ValueError(f"Unknown grader tag '{tag}'. Expected one of: {sorted(GRADER_REGISTRY)}.")
+    return grader_class()
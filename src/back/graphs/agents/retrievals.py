@@ -1,9 +1,12 @@
 
-from typing import Optional
-from langchain_core.language_models import BaseChatModel
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 
 from .base import BaseRetrievalAgent
-from ..prompts import BusinessLogicRetrieverPrompt, MdlRetrieverPrompt
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
 
 
 
@@ -32,6 +35,8 @@ class BusinessLogicRetriever(BaseRetrievalAgent):
             max_subqueries: The maximum number of sub-queries to generate.
                     Defaults to a predefined value in BaseRetrievalAgent.
         """
+        from ..prompts import BusinessLogicRetrieverPrompt
+
         super().__init__(
             llm= llm,
             prompt_constructor= BusinessLogicRetrieverPrompt(
@@ -72,6 +77,8 @@ class MdlRetriever(BaseRetrievalAgent):
             max_subqueries: The maximum number of sub-queries to generate.
                     Defaults to a predefined value in BaseRetrievalAgent.
         """
+        from ..prompts import MdlRetrieverPrompt
+
         super().__init__(
             llm= llm,
             prompt_constructor= MdlRetrieverPrompt(
@@ -4,12 +4,13 @@ from langgraph.typing import ContextT, InputT, NodeInputT, OutputT, StateT
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph, START, END
 
-from .base import BaseGraph
+from .base import BaseGraph, _Validated
 from .states import (
     ChunkProcessingOutputState,
     ChunkProcessingState
 )
 from .nodes import (
+    BaseNode,
     SetRetrievalGradeOutputKoNode,
     SummarizeChunkNode,
 )
@@ -19,8 +20,9 @@ from .edges import (
     GradeRetrievedChunkEdge
 )
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from ._logging import get_logger
+
+logger = get_logger('aux_graphs')
 
 
 class ChunkProcessingGraph(BaseGraph):
@@ -37,9 +39,21 @@ class ChunkProcessingGraph(BaseGraph):
     5. The process can loop to generate a better summary if needed.
     """
 
+    __slots__ = (
+        '_summarize_chunk_node',
+        '_set_output_ko_node',
+        '_grade_chunk_relevance_edge',
+        '_grade_chunk_summary_edge',
+    )
+
     _SUMMARIZE_CHUNK_STATE = 'summarize_chunk'
     _KO_STATE = 'set_output_ko'
 
+    summarize_chunk_node = _Validated(BaseNode)
+    set_output_ko_node = _Validated(BaseNode)
+    grade_chunk_relevance_edge = _Validated(BaseEdge)
+    grade_chunk_summary_edge = _Validated(BaseEdge)
+
     def __init__(
         self,
         summarize_chunk_node: Optional[NodeInputT] = None,
@@ -97,58 +111,6 @@ class ChunkProcessingGraph(BaseGraph):
         )
 
 
-    @property
-    def summarize_chunk_node(self) -> NodeInputT:
-        """Getter for the summarize_chunk_node."""
-        return self._summarize_chunk_node
-
-    @summarize_chunk_node.setter
-    def summarize_chunk_node(self, value: NodeInputT):
-        """Setter with validation for the summarize_chunk_node."""
-        if not isinstance(value, NodeInputT):
-            raise TypeError("'summarize_chunk_node' must be an instance of NodeInputT.")
-        self._summarize_chunk_node = value
-
-
-    @property
-    def set_output_ko_node(self) -> NodeInputT:
-        """Getter for the set_output_ko_node."""
-        return self._set_output_ko_node
-
-    @set_output_ko_node.setter
-    def set_output_ko_node(self, value: NodeInputT):
-        """Setter with validation for the set_output_ko_node."""
-        if not isinstance(value, NodeInputT):
-            raise TypeError("'set_output_ko_node' must be an instance of NodeInputT.")
-        self._set_output_ko_node = value
-
-
-    @property
-    def grade_chunk_relevance_edge(self) -> BaseEdge:
-        """Getter for the grade_chunk_relevance_edge."""
-        return self._grade_chunk_relevance_edge
-
-    @grade_chunk_relevance_edge.setter
-    def grade_chunk_relevance_edge(self, value: BaseEdge):
-        """Setter with validation for the grade_chunk_relevance_edge."""
-        if not isinstance(value, BaseEdge):
-            raise TypeError("'grade_chunk_relevance_edge' must be an instance of BaseEdge.")
-        self._grade_chunk_relevance_edge = value
-
-
-    @property
-    def grade_chunk_summary_edge(self) -> BaseEdge:
-        """Getter for the grade_chunk_summary_edge."""
-        return self._grade_chunk_summary_edge
-
-    @grade_chunk_summary_edge.setter
-    def grade_chunk_summary_edge(self, value: BaseEdge):
-        """Setter with validation for the grade_chunk_summary_edge."""
-        if not isinstance(value, BaseEdge):
-            raise TypeError("'grade_chunk_summary_edge' must be an instance of BaseEdge.")
-        self._grade_chunk_summary_edge = value
-
-
     def get_compiled_graph(self) -> CompiledStateGraph[Optional[Any]]:   
         """
         Builds and compiles the LangGraph graph.
@@ -156,10 +118,14 @@ class ChunkProcessingGraph(BaseGraph):
         This method defines the graph's structure by adding nodes and connecting
         them with edges, including conditional routing and parallel processing.
 
+        The node and edge functions are fetched from the components on every
+        build, so changes made in place to a component are always picked up.
+        Nodes cache their own function, so fetching it is cheap.
+
         Returns:
             The compiled LangGraph graph ready for execution.
         """
-        logging.info("--- BUILDING CHUNK PROCESSING GRAPH 🏗️ ---")
+        logger.info("--- BUILDING CHUNK PROCESSING GRAPH 🏗️ ---")
 
         workflow = StateGraph(
             state_schema= self.state_schema,
@@ -198,7 +164,7 @@ class ChunkProcessingGraph(BaseGraph):
 
 
         compiled_graph = workflow.compile()
-        logging.info("--- CHUNK PROCESSING GRAPH COMPILED SUCCESSFULLY ⚙️✅ ---")
+        logger.info("--- CHUNK PROCESSING GRAPH COMPILED SUCCESSFULLY ⚙️✅ ---")
 
         return compiled_graph
 
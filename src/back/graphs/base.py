@@ -1,8 +1,51 @@
 
-from typing import Optional, Type
+from typing import Any, Optional, Type, Union
 from langgraph.typing import ContextT, InputT, NodeInputT, OutputT, StateT
 
 
+class _Validated:
+    """
+    A data descriptor exposing a private attribute with a validated setter.
+
+    It replaces the repeated getter/setter property pairs of the graph classes.
+    The value is stored in the `_<name>` slot of the instance, and the setter
+    checks its type with a debug-only assert.
+    """
+
+    __slots__ = ('_types', '_optional', '_name', '_attr')
+
+    def __init__(
+        self,
+        types: Union[type, tuple],
+        optional: bool = False,
+    ):
+        """
+        Args:
+            types: The type, or tuple of types, accepted by the setter.
+            optional: Whether None is also accepted.
+        """
+        self._types = types
+        self._optional = optional
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+        self._attr = f'_{name}'
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj, self._attr)
+
+    def __set__(self, obj: Any, value: Any):
+        assert (
+            (self._optional and value is None)
+            or isinstance(value, self._types)
+        ), f"'{self._name}' must be an instance of {self._types}{' or None' if self._optional else ''}."
+
+        setattr(obj, self._attr, value)
+
+
+
 class BaseGraph:
     """
     A base class for building and managing a LangGraph graph.
@@ -11,6 +54,18 @@ class BaseGraph:
     for a graph's state, input, and output.
     """
 
+    __slots__ = (
+        '_state_schema',
+        '_context_schema',
+        '_input_schema',
+        '_output_schema',
+    )
+
+    state_schema = _Validated(type)
+    context_schema = _Validated(type, optional= True)
+    input_schema = _Validated(type, optional= True)
+    output_schema = _Validated(type, optional= True)
+
     def __init__(
         self,
         state_schema: Type[StateT],
@@ -33,54 +88,3 @@ class BaseGraph:
         self._input_schema = input_schema
         self._output_schema = output_schema
 
-    @property
-    def state_schema(self) -> Type[StateT]:
-        """Getter for the state schema."""
-        return self._state_schema
-
-    @state_schema.setter
-    def state_schema(self, value: Type[StateT]):
-        """Setter with validation for the state schema."""
-        if not isinstance(value, type):
-            raise TypeError("state_schema must be a class (type).")
-        self._state_schema = value
-
-
-    @property
-    def context_schema(self) -> Optional[Type[ContextT]]:
-        """Getter for the context schema."""
-        return self._context_schema
-
-    @context_schema.setter
-    def context_schema(self, value: Optional[Type[ContextT]]):
-        """Setter with validation for the context schema."""
-        if value is not None and not isinstance(value, type):
-            raise TypeError("context_schema must be a class (type) or None.")
-        self._context_schema = value
-
-
-    @property
-    def input_schema(self) -> Optional[Type[InputT]]:
-        """Getter for the input schema."""
-        return self._input_schema
-
-    @input_schema.setter
-    def input_schema(self, value: Optional[Type[InputT]]):
-        """Setter with validation for the input schema."""
-        if value is not None and not isinstance(value, type):
-            raise TypeError("input_schema must be a class (type) or None.")
-        self._input_schema = value
-
-
-    @property
-    def output_schema(self) -> Optional[Type[OutputT]]:
-        """Getter for the output schema."""
-        return self._output_schema
-
-    @output_schema.setter
-    def output_schema(self, value: Optional[Type[OutputT]]):
-        """Setter with validation for the output schema."""
-        if value is not None and not isinstance(value, type):
-            raise TypeError("output_schema must be a class (type) or None.")
-        self._output_schema = value
-
@@ -1,25 +1,48 @@
 
 #################### LIBRERIAS ####################
 
+import asyncio
 from dotenv import load_dotenv 
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Optional, Any, Tuple
 from langchain.chat_models import init_chat_model
 from langchain.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda, RunnableParallel
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 
 from ...utils.doc_generators import convert_to_markdown_table
-from ...utils.graphics import create_dashboard_from_json
+from ...utils.graphics import DashboardJsonStreamValidator, validate_dashboard_json
+from .models import http_async_client, http_client
 from .states import ConclusionsGeneratorState, ConclusionsGeneratorOutputState
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from ._logging import get_logger
 
+logger = get_logger('conclusions')
 
-def get_conclusions_generator_graph(
-        n_phrases: int = 10, 
-        max_retries: int = 5
-) -> CompiledStateGraph[Optional[Any]]:
+
+# Reintentos del cliente de OpenAI ante errores de la API (429, 5xx, timeouts), con
+# espera exponencial con jitter y respetando la cabecera Retry-After. Se aplican
+# también al abrir los streams, a diferencia de `Runnable.with_retry`
+_API_MAX_RETRIES = 4
+
+# Claves con las que se emiten los tokens parciales de cada salida de texto
+_STREAM_DELTA_KEYS = {
+    'nl': 'nl_output_delta',
+    'sql': 'sql_explanation_delta',
+}
+
+
+@lru_cache(maxsize= None)
+def _lazy_init() -> Tuple[Runnable, Tuple[Runnable, ...]]:
+    """
+    Construye una única vez los modelos y las cadenas (prompt | llm) del grafo.
+
+    Returns:
+        La cadena conjunta de conclusiones y explicación SQL y las cadenas
+        candidatas de generación de gráficos.
+    """
 
     # Nos aseguramos de cargar las variables de entorno
     load_dotenv()
@@ -29,37 +52,73 @@ def get_conclusions_generator_graph(
         model_provider= 'azure_openai',
         model= 'gpt-4.1-mini',
         temperature= 0.10,
+        max_retries= _API_MAX_RETRIES,
+        http_client= http_client,
+        http_async_client= http_async_client,
     )
 
     llm_graphics_generator = init_chat_model(
         model_provider= 'azure_openai',
         model= 'gpt-4.1-mini',
         temperature= 0.75,
+        max_retries= _API_MAX_RETRIES,
+        http_client= http_client,
+        http_async_client= http_async_client,
+    )
+
+    ## La explicación SQL es corta y muy acotada en formato, por lo que basta un modelo más ligero
+    llm_explanation_generator = init_chat_model(
+        model_provider= 'azure_openai',
+        model= 'gpt-4o-mini',
+        temperature= 0.10,
+        max_retries= _API_MAX_RETRIES,
+        http_client= http_client,
+        http_async_client= http_async_client,
+    )
+
+    ## Segundo candidato de gráficos, con más temperatura para diversificar la generación
+    llm_graphics_alt_generator = init_chat_model(
+        model_provider= 'azure_openai',
+        model= 'gpt-4.1-mini',
+        temperature= 0.90,
+        max_retries= _API_MAX_RETRIES,
+        http_client= http_client,
+        http_async_client= http_async_client,
     )
 
 
     # Definimos agentes presentes en el sistema
+    # Las instrucciones fijas van en el mensaje de sistema y las variables en el mensaje
+    # final, de modo que el prefijo común pueda reutilizarse en la caché de prompts de Azure
 
     ## NL CONCLUSIONS GENERATOR
     nl_conclusions_prompt = ChatPromptTemplate.from_messages([{
         "role": "system",
         "content": (
             "Eres un analista experto en el dominio de la base de datos consultada."
-            "\n\nLa consulta realizada por un usuario de negocio es:"
-            "\n\n{user_query}"
-            "\n\nLa salida en texto plano (markdown) de la consulta SQL ejecutada es:"
-            "\n\n{query_results}"
-            "\n\n\nTu tarea es extraer las conclusiones principales de los datos, redactadas de "
-            "forma breve y directa, sin explicaciones innecesarias ni contexto adicional."
+            "\n\nTu tarea es extraer las conclusiones principales de los datos obtenidos "
+            "por la consulta SQL ejecutada, redactadas de forma breve y directa, sin "
+            "explicaciones innecesarias ni contexto adicional."
             "\nDirígete a un usuario de negocio con conocimientos en el tema, "
             "por lo que no es necesario definir conceptos básicos."
-            "\nMáximo {n_phrases} frases concisas pero, usando terminología técnica del dominio cuando corresponda."
+            "\nUsa frases concisas pero, usando terminología técnica del dominio cuando corresponda."
             "\nNo incluyas datos sin relevancia ni interpretaciones especulativas."
+        )
+    }, {
+        "role": "human",
+        "content": (
+            "La consulta realizada por un usuario de negocio es:"
+            "\n\n{user_query}"
+            "\n\nLa salida en texto plano (markdown) de la consulta SQL ejecutada es:"
+            "\n\n{query_results}"
+            "\n\n\nMáximo {n_phrases} frases."
             "\nLa respuesta debe estar en el siguiente idioma: {language}"
         )
     }])
 
-    nl_conclusions_generator = nl_conclusions_prompt | llm_generator
+    nl_conclusions_generator = nl_conclusions_prompt | llm_generator.bind(
+        extra_body= {'prompt_cache_key': 'conclusions_nl_v1'}
+    )
 
 
     ## NL SQL EXPLANATION GENERATOR
@@ -70,11 +129,7 @@ def get_conclusions_generator_graph(
             "relacionado con la base de datos que se te consulta. Tu tarea es analizar la "
             "consulta SQL ejecutada y explicar la lógica que subyace a la misma, para que "
             "un usuario de negocio pueda entender cómo se llegó a la respuesta a su pregunta."
-            "\n\nLa consulta del usuario de negocio es:"
-            "\n\n{user_query}"
-            "\n\nLa consulta SQL que se ejecutó para responderla es:"
-            "\n\n{sql_query}"
-            "\n\n\nTu respuesta debe ser un análisis conciso y directo, sin jerga innecesaria. "
+            "\n\nTu respuesta debe ser un análisis conciso y directo, sin jerga innecesaria. "
             "Dirígete al usuario como si estuvieras explicando tu proceso de pensamiento."
             "\n\nSigue este formato:"
             "\n\n## Análisis de la Lógica de la Consulta"
@@ -88,11 +143,21 @@ def get_conclusions_generator_graph(
             "\n\nUtiliza un máximo de dos párrafos en total. Usa terminología técnica del "
             "dominio solo cuando sea estrictamente necesario para la claridad. No incluyas "
             "información irrelevante ni interpretaciones especulativas."
+        )
+    }, {
+        "role": "human",
+        "content": (
+            "La consulta del usuario de negocio es:"
+            "\n\n{user_query}"
+            "\n\nLa consulta SQL que se ejecutó para responderla es:"
+            "\n\n{sql_query}"
             "\n\nLa respuesta debe estar en el siguiente idioma: {language}"
         )
     }])
 
-    nl_sql_explanation_generator = nl_sql_explanaition_prompt | llm_generator
+    nl_sql_explanation_generator = nl_sql_explanaition_prompt | llm_explanation_generator.bind(
+        extra_body= {'prompt_cache_key': 'conclusions_sql_v1'}
+    )
 
 
     ## GRAPHICS GENERATOR
@@ -103,11 +168,7 @@ def get_conclusions_generator_graph(
             "Tu trabajo va más allá de la simple representación: cada gráfico debe ser un insight único que, en conjunto, cuente una historia completa y sin redundancia sobre los resultados de la consulta. "
             "Debes mantener una visión global de cómo los 4 gráficos se complementan entre sí para responder a diferentes facetas de la consulta del usuario."
             "La salida debe ser un único JSON válido, conteniendo el título del dashboard y una lista de 4 diccionarios de Plotly. "
-            "Todo el texto del dashboard (títulos, etiquetas, descripciones, etc.) debe estar en el idioma definido por la variable '{language}'."
-            "\n\nContexto de la consulta de negocio:"
-            "\n\n{user_query}"
-            "\n\nResultados de la consulta SQL:"
-            "\n\n{query_results}"
+            "Todo el texto del dashboard (títulos, etiquetas, descripciones, etc.) debe estar en el idioma indicado junto a la consulta."
             "\n\n**Estrategia de Visualización Creativa y Analítica:**"
             "\n- **Enfoque de la narrativa:** Cada gráfico debe abordar una faceta diferente del análisis. Combina tipos de gráficos de forma inteligente para guiar al usuario a través de un descubrimiento de datos. Por ejemplo, inicia con una visión general, luego muestra la evolución temporal, sigue con una comparación de rendimiento, y finaliza con la relación entre dos métricas clave."
             "\n- **Diversidad y sinergia:** Elige 4 tipos de gráficos distintos de la siguiente lista: barras (bar), líneas (line), tarta (pie), dispersión (scatter) e histogramas (histogram). La selección debe ser deliberada para potenciar la narrativa de los datos. Evita cualquier repetición de información entre gráficos."
@@ -141,79 +202,291 @@ def get_conclusions_generator_graph(
             " ]\n"
             "}}\n"
         )
+    }, {
+        "role": "human",
+        "content": (
+            "Contexto de la consulta de negocio:"
+            "\n\n{user_query}"
+            "\n\nResultados de la consulta SQL:"
+            "\n\n{query_results}"
+            "\n\nIdioma del dashboard: {language}"
+        )
     }])
 
-    graphics_generator = graphics_generator_prompt | llm_graphics_generator
+    ## Candidatos que se generan en paralelo en cada intento
+    graphics_generators = tuple(
+        graphics_generator_prompt | llm.bind(
+            extra_body= {'prompt_cache_key': 'conclusions_graphics_v1'}
+        )
+        for llm in (
+            llm_graphics_generator,
+            llm_graphics_alt_generator,
+        )
+    )
+
+    ## Ambas salidas de texto son independientes, por lo que se lanzan juntas
+    text_outputs_generator = RunnableParallel(
+        nl= nl_conclusions_generator,
+        sql= nl_sql_explanation_generator,
+    )
+
+    return text_outputs_generator, graphics_generators
+
+
+
+@lru_cache(maxsize= 16)
+def get_conclusions_generator_graph(
+        n_phrases: int = 10, 
+        max_retries: int = 2
+) -> CompiledStateGraph[Optional[Any]]:
+    """
+    Construye y compila el grafo de generación de conclusiones.
 
+    El grafo compilado se cachea por combinación de argumentos, por lo que las
+    llamadas repetidas lo reutilizan sin volver a compilarlo. El número de frases
+    puede variarse por ejecución a través del estado (`n_phrases`) sin recompilar.
 
+    Args:
+        n_phrases: Número máximo de frases por defecto de las conclusiones.
+        max_retries: Número máximo de intentos de generación de gráficos.
 
-    # Definimos nodos
+    Returns:
+        El grafo compilado.
+    """
 
-    def nl_conclusions_generation_node(state: ConclusionsGeneratorState):
+    # Reutilizamos los modelos y cadenas ya construidos
+    text_outputs_generator, graphics_generators = _lazy_init()
+
+
+    # Definimos nodos. Los nodos de generación tienen variante síncrona (invoke del
+    # grafo) y asíncrona (ainvoke), que solapa las llamadas concurrentes al LLM
+
+    def prepare_markdown_node(state: ConclusionsGeneratorState):
         """
-        Nodo que analiza los resultados de la consulta SQL y genera 
-        conclusiones relevantes para la consulta del usuario.
+        Nodo que convierte una única vez los resultados de la consulta SQL
+        a tabla markdown, para reutilizarla en los nodos posteriores.
         """
-        logging.info("--- INICIANDO GENERACIÓN DE CONCLUSIONES 📝 ---")
-        user_query = state['user_query']
-        _n_phrases = state.get('n_phrases', n_phrases)
-        language = state['language']
-        query_results = state['query_results']
+        logger.info("--- PREPARANDO TABLA MARKDOWN DE RESULTADOS 🧾 ---")
+        return {"query_results_md": convert_to_markdown_table(state.query_results)}
+
+
+    def build_text_outputs_inputs(state: ConclusionsGeneratorState) -> dict:
+        """Construye las entradas de la generación de conclusiones y explicación SQL."""
+        return {
+            'user_query': state.user_query,
+            'language': state.language,
+            'query_results': state.query_results_md,
+            'n_phrases': state.n_phrases or n_phrases,
+            'sql_query': state.sql_query,
+        }
 
-        nl_output = nl_conclusions_generator.invoke({
-            'user_query': user_query,
-            'language': language,
-            'query_results': convert_to_markdown_table(query_results),
-            'n_phrases': _n_phrases,
-        }).content
-        
-        return {"nl_output": nl_output}
 
+    def add_text_outputs_chunk(text_outputs: dict, chunk: dict, writer: Any) -> None:
+        """Acumula un fragmento de las salidas de texto y emite sus tokens."""
+        for output_key, message_chunk in chunk.items():
+            text_outputs[output_key] += message_chunk.content
+            writer({_STREAM_DELTA_KEYS[output_key]: message_chunk.content})
 
-    def sql_query_explanation_node(state: ConclusionsGeneratorState):
+
+    def text_outputs_generation_node(state: ConclusionsGeneratorState):
         """
-        Nodo que analiza la consulta SQL frente a la consulta del 
-        usuario y genera una breve explicación de lo desarrollado.
+        Nodo que genera en una única llamada concurrente las conclusiones
+        sobre los resultados de la consulta SQL y la explicación de la
+        propia consulta SQL frente a la consulta del usuario.
         """
-        logging.info("--- INICIANDO EXPLICACIÓN DE CONSULTA SQL 🗂️ ---")
-        user_query = state['user_query']
-        language = state['language']
-        sql_query = state['sql_query']
+        logger.info("--- INICIANDO GENERACIÓN DE CONCLUSIONES Y EXPLICACIÓN SQL 📝🗂️ ---")
+        # Emitimos los tokens según llegan (stream_mode="custom") y acumulamos la salida final
+        writer = get_stream_writer()
+        text_outputs = {'nl': '', 'sql': ''}
+        for chunk in text_outputs_generator.stream(build_text_outputs_inputs(state)):
+            add_text_outputs_chunk(text_outputs, chunk, writer)
+
+        return {
+            "nl_output": text_outputs['nl'],
+            "sql_explanation": text_outputs['sql'],
+        }
+
 
-        sql_explanation = nl_sql_explanation_generator.invoke({
-            'user_query': user_query,
-            'language': language,
-            'sql_query': sql_query,
-        }).content
-        
-        return {"sql_explanation": sql_explanation}
+    async def atext_outputs_generation_node(state: ConclusionsGeneratorState):
+        """
+        Variante asíncrona de `text_outputs_generation_node`.
+        """
+        logger.info("--- INICIANDO GENERACIÓN DE CONCLUSIONES Y EXPLICACIÓN SQL 📝🗂️ ---")
+        writer = get_stream_writer()
+        text_outputs = {'nl': '', 'sql': ''}
+        async for chunk in text_outputs_generator.astream(build_text_outputs_inputs(state)):
+            add_text_outputs_chunk(text_outputs, chunk, writer)
+
+        return {
+            "nl_output": text_outputs['nl'],
+            "sql_explanation": text_outputs['sql'],
+        }
 
 
-    def graphs_generation_node(state: ConclusionsGeneratorState) -> dict:
+    def build_graphics_inputs(state: ConclusionsGeneratorState) -> Tuple[dict, int]:
         """
-        Nodo que genera gráficos basados en los resultados de la consulta SQL, 
-        que sean relevantes para la consulta del usuario.
+        Construye las entradas de la generación de gráficos.
+
+        Returns:
+            Las entradas de los candidatos y el número de intento actual.
+        """
+        inputs = {
+            'user_query': state.user_query,
+            'language': state.language,
+            'query_results': state.query_results_md,
+        }
+        return inputs, state.graphs_retries + 1
+
+
+    def check_graphics_candidate(
+            validator: DashboardJsonStreamValidator,
+            graphics_chunks: list
+    ) -> Optional[Tuple[str, dict]]:
+        """
+        Valida un candidato de dashboard ya generado (o cortado por el validador).
+
+        Returns:
+            El JSON del dashboard y su versión decodificada si es válido,
+            o None en caso contrario.
+        """
+        if validator.violation is not None:
+            logger.error("--- ❌ Generación de gráficos abortada: %s ---", validator.violation)
+            return None
+
+        graphics_json = ''.join(graphics_chunks)
+        graphics_data = validate_dashboard_json(graphics_json)
+        if graphics_data is None:
+            logger.error("--- ❌ Error al generar gráficos ---")
+            return None
+
+        return graphics_json, graphics_data
+
+
+    def generate_graphics_candidate(
+            generator: Runnable,
+            inputs: dict
+    ) -> Optional[Tuple[str, dict]]:
+        """
+        Genera un candidato de dashboard, validando el JSON según se genera y
+        cortando la generación en cuanto sea inválido.
+
+        Returns:
+            El JSON del dashboard y su versión decodificada si es válido,
+            o None en caso contrario.
         """
-        logging.info("--- INICIANDO GENERACIÓN DE GRÁFICOS 📊 ---")
-        user_query = state['user_query']
-        language = state['language']
-        query_results = state['query_results']
-        graphs_retries = state.get('graphs_retries', 0) + 1
-        
-        graphics_json = graphics_generator.invoke({
-            'user_query': user_query,
-            'language': language,
-            'query_results': convert_to_markdown_table(query_results),
-        }).content
-
-        if create_dashboard_from_json(graphics_json) is None:
-            logging.error("--- ❌ Error al generar gráficos ---")
+        validator = DashboardJsonStreamValidator()
+        graphics_chunks = []
+        for chunk in generator.stream(inputs):
+            graphics_chunks.append(chunk.content)
+            if validator.feed(chunk.content) is not None:
+                break
+
+        return check_graphics_candidate(validator, graphics_chunks)
+
+
+    async def agenerate_graphics_candidate(
+            generator: Runnable,
+            inputs: dict
+    ) -> Optional[Tuple[str, dict]]:
+        """
+        Variante asíncrona de `generate_graphics_candidate`.
+        """
+        validator = DashboardJsonStreamValidator()
+        graphics_chunks = []
+        async for chunk in generator.astream(inputs):
+            graphics_chunks.append(chunk.content)
+            if validator.feed(chunk.content) is not None:
+                break
+
+        return check_graphics_candidate(validator, graphics_chunks)
+
+
+    def build_graphics_update(
+            graphics: Optional[Tuple[str, dict]],
+            graphs_retries: int
+    ) -> dict:
+        """Construye la actualización del estado a partir del candidato elegido."""
+        if graphics is None:
             return {
                 "graphics_json": None,
                 "graphs_retries": graphs_retries
             }
 
-        return {"graphics_json": graphics_json}
+        graphics_json, graphics_data = graphics
+        return {
+            "graphics_json": graphics_json,
+            "graphics_data": graphics_data,
+        }
+
+
+    def graphs_generation_node(state: ConclusionsGeneratorState) -> dict:
+        """
+        Nodo que genera gráficos basados en los resultados de la consulta SQL, 
+        que sean relevantes para la consulta del usuario.
+
+        En ejecución síncrona los candidatos se prueban uno tras otro y se
+        devuelve el primero válido. Un candidato que falla se descarta sin
+        descartar el resto.
+        """
+        logger.info("--- INICIANDO GENERACIÓN DE GRÁFICOS 📊 ---")
+        inputs, graphs_retries = build_graphics_inputs(state)
+
+        errors = []
+        for generator in graphics_generators:
+            try:
+                graphics = generate_graphics_candidate(generator, inputs)
+            except Exception as e:
+                logger.error("--- ❌ Error en un candidato de gráficos: %s ---", e)
+                errors.append(e)
+                continue
+
+            if graphics is not None:
+                return build_graphics_update(graphics, graphs_retries)
+
+        # Solo se propaga el error si han fallado todos los candidatos
+        if len(errors) == len(graphics_generators):
+            raise errors[-1]
+
+        return build_graphics_update(None, graphs_retries)
+
+
+    async def agraphs_generation_node(state: ConclusionsGeneratorState) -> dict:
+        """
+        Variante asíncrona de `graphs_generation_node`.
+
+        Se generan varios candidatos en paralelo y se devuelve el primero válido.
+        Un candidato que falla se descarta sin cancelar el resto.
+        """
+        logger.info("--- INICIANDO GENERACIÓN DE GRÁFICOS 📊 ---")
+        inputs, graphs_retries = build_graphics_inputs(state)
+
+        candidates = [
+            asyncio.create_task(agenerate_graphics_candidate(generator, inputs))
+            for generator in graphics_generators
+        ]
+        errors = []
+        try:
+            for candidate in asyncio.as_completed(candidates):
+                # El fallo de un candidato no debe descartar a los demás,
+                # que todavía pueden generar un dashboard válido
+                try:
+                    graphics = await candidate
+                except Exception as e:
+                    logger.error("--- ❌ Error en un candidato de gráficos: %s ---", e)
+                    errors.append(e)
+                    continue
+
+                if graphics is not None:
+                    return build_graphics_update(graphics, graphs_retries)
+        finally:
+            for candidate in candidates:
+                candidate.cancel()
+
+        # Solo se propaga el error si han fallado todos los candidatos
+        if len(errors) == len(candidates):
+            raise errors[-1]
+
+        return build_graphics_update(None, graphs_retries)
     
 
 
@@ -224,20 +497,28 @@ def get_conclusions_generator_graph(
         output_schema= ConclusionsGeneratorOutputState,
     )
 
-    workflow.add_node('generate_nl_conclusions', nl_conclusions_generation_node)
-    workflow.add_node('generate_sql_explanation', sql_query_explanation_node)
-    workflow.add_node('generate_plotly_graphs', graphs_generation_node)
+    workflow.add_node('prepare_markdown', prepare_markdown_node)
+    workflow.add_node(
+        'generate_text_outputs',
+        RunnableLambda(text_outputs_generation_node, afunc= atext_outputs_generation_node)
+    )
+    workflow.add_node(
+        'generate_plotly_graphs',
+        RunnableLambda(graphs_generation_node, afunc= agraphs_generation_node)
+    )
 
-    workflow.add_edge(START, 'generate_nl_conclusions')
-    workflow.add_edge(START, 'generate_sql_explanation')
-    workflow.add_edge('generate_nl_conclusions', 'generate_plotly_graphs')
-    workflow.add_edge('generate_sql_explanation', 'generate_plotly_graphs')
+    # Los textos y los gráficos solo dependen de la tabla markdown, por lo que
+    # se generan en ramas paralelas y la latencia es la de la rama más lenta
+    workflow.add_edge(START, 'prepare_markdown')
+    workflow.add_edge('prepare_markdown', 'generate_text_outputs')
+    workflow.add_edge('prepare_markdown', 'generate_plotly_graphs')
+    workflow.add_edge('generate_text_outputs', END)
     workflow.add_conditional_edges(
         'generate_plotly_graphs',
         lambda state: (
             'retry'
-            if state.get('graphics_json') is None
-            and state.get('graphs_retries', 0) < max_retries
+            if state.graphics_json is None
+            and state.graphs_retries < max_retries
             else 'continue'
         ),
         {
@@ -5,7 +5,7 @@ from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph, START, END
 
 from .base import BaseGraph
-from .edges import BaseEdge, RouteBooleanStateVariableEdge
+from .edges import BaseEdge, RouteBooleanStateVariableEdge, get_boolean_router
 from .nodes import (
     BaseNode,
     ExtractDbSchemaNode,
@@ -23,8 +23,9 @@ from .states import (
     ContextGeneratorState
 )
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from ._logging import get_logger
+
+logger = get_logger('context_generator')
 
 
 class ContextGeneratorGraph(BaseGraph):
@@ -121,7 +122,7 @@ class ContextGeneratorGraph(BaseGraph):
 
         self._check_relevance_edge = (
             check_relevance_edge
-            or RouteBooleanStateVariableEdge(
+            or get_boolean_router(
                 relevance_state_variable= GradeContextSummariesNode._output_property,
                 is_relevant_next_step= 'relevant',
                 no_relevance_next_step= 'not_relevant'
@@ -224,10 +225,14 @@ class ContextGeneratorGraph(BaseGraph):
         """
         Builds and compiles the LangGraph workflow for context generation.
 
+        Every call fetches the functions from the current components, so changes
+        made to them in place are picked up. Reuse of the compiled graph is left
+        to the cached factories that build it.
+
         Returns:
             The compiled LangGraph graph ready for execution.
         """
-        logging.info(f"--- BUILDING CONTEXT GENERATOR GRAPH 🏗️ ---")
+        logger.info("--- BUILDING CONTEXT GENERATOR GRAPH 🏗️ ---")
 
         workflow = StateGraph(
             state_schema= self.state_schema,
@@ -276,8 +281,8 @@ class ContextGeneratorGraph(BaseGraph):
             source= self._GRADE_SUMMARIES_NODE,
             path= self.check_relevance_edge.get_edge_function(),
             path_map= {
-                'relevant': self._GENERATE_GLOBAL_CONTEXT_NODE,
-                'not_relevant': self._NO_RELEVANCE_RESPONSE_NODE,
+                self.check_relevance_edge.is_relevant_next_step: self._GENERATE_GLOBAL_CONTEXT_NODE,
+                self.check_relevance_edge.no_relevance_next_step: self._NO_RELEVANCE_RESPONSE_NODE,
             }
         )
         workflow.add_edge(self._GENERATE_GLOBAL_CONTEXT_NODE, END)
@@ -285,6 +290,6 @@ class ContextGeneratorGraph(BaseGraph):
 
 
         compiled_graph = workflow.compile()
-        logging.info(f"--- CONTEXT GENERATOR COMPILED SUCCESSFULLY ✅ ---")
+        logger.info("--- CONTEXT GENERATOR COMPILED SUCCESSFULLY ✅ ---")
 
         return compiled_graph
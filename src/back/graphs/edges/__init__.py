@@ -9,16 +9,21 @@ from .agent_decision import (
     GradeRetrievedChunkEdge,
 )
 from .base import BaseAgenticConditionalEdge, BaseEdge
-from .fixed_routing import RouteBooleanStateVariableEdge
+from .cache import GraderCache
+from .fixed_routing import RouteBooleanStateVariableEdge, get_boolean_router
 from .parallel_processing import SendToParallelGradingEdge
+from .prefilters import EmbeddingRelevancePrefilter
 
 
 __all__ = [
     'BaseAgenticConditionalEdge',
     'BaseEdge',
+    'EmbeddingRelevancePrefilter',
     'GradeChunkSummaryGenerationEdge',
+    'GraderCache',
     'GradeRetrievedChunkEdge',
     'RouteBooleanStateVariableEdge',
     'SendToParallelGradingEdge',
+    'get_boolean_router',
 ]
 
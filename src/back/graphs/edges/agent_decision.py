@@ -1,17 +1,90 @@
 
-from typing import Any, Callable, Dict, List, Literal, Optional, Type
+import asyncio
+from operator import attrgetter, itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Type
+from langchain_core.runnables import Runnable, RunnableLambda
 
 from ..prompts import _RETRIEVAL_GRADER_DYNAMIC_PROMPT_DICT
 from .base import BaseEdge, BaseAgenticConditionalEdge
+from .cache import GraderCache
 from ..agents import (
     AnswerGrader,
     BaseAgent,
+    CompositeGrader,
     HallucinationGrader,
-    RetrievalGrader
+    RetrievalGrader,
+    get_grader,
 )
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('edges.agent_decision')
+
+# Composite grader input names, in the order of the grading inputs tuple.
+_COMPOSITE_INPUT_KEYS = ('chunk_txt', 'user_query', 'chunk_summary')
+
+
+def _cached_grade(
+    cache: GraderCache,
+    key: bytes,
+    invoke: Callable[[Dict[str, Any]], Any],
+    inputs: Dict[str, Any],
+    get_grade: Callable[[Any], bool],
+) -> bool:
+    """Returns the cached grade for `key`, calling the bound grader `invoke` only on a cache miss."""
+    grade = cache.get(key)
+    if grade is None:
+        grade = bool(get_grade(invoke(inputs)))
+        cache.set(key, grade)
+    return grade
+
+
+def _identity_query(user_query: str) -> str:
+    """Returns the user query unchanged, for entities without a prompt adjustment."""
+    return user_query
+
+
+def _build_query_adjusters(
+    prompt_adjustments: Dict[str, Any],
+    suffix: str = '',
+) -> Dict[str, Callable[[str], str]]:
+    """
+    Builds one specialized query adjuster per entity.
+
+    Each adjuster has its adjustment, and the stripped, uppercased form used for
+    matching, baked in as closure cells, so grading only does a dict lookup and
+    a single prefix check per call.
+    """
+    def make_adjuster(adjustment: str) -> Callable[[str], str]:
+        adjustment_upper = adjustment.strip().upper()
+        prefix_length = len(adjustment_upper)
+
+        def adjust_query(user_query: str) -> str:
+            # Only the leading characters can match, so uppercase just that slice.
+            if user_query.lstrip()[:prefix_length].upper().startswith(adjustment_upper):
+                return user_query
+            return f'{adjustment}"{user_query}"{suffix}'
+
+        return adjust_query
+
+    return {
+        entity: make_adjuster(adjustment['user_query'])
+        for entity, adjustment in prompt_adjustments.items()
+    }
+
+
+async def _acached_grade(
+    cache: GraderCache,
+    key: bytes,
+    ainvoke: Callable[[Dict[str, Any]], Awaitable[Any]],
+    inputs: Dict[str, Any],
+    get_grade: Callable[[Any], bool],
+) -> bool:
+    """Async variant of `_cached_grade`, coalescing concurrent requests for the same key."""
+    async def compute() -> bool:
+        return get_grade(await ainvoke(inputs))
+
+    return await cache.aget_or_compute(key, compute)
 
 
 class GradeRetrievedChunkEdge(BaseAgenticConditionalEdge):
@@ -19,12 +92,23 @@ class GradeRetrievedChunkEdge(BaseAgenticConditionalEdge):
     A conditional edge that grades the relevance of a retrieved chunk.
 
     This edge decides the next step in the graph based on whether the provided
-    chunk is relevant to the user's query.
+    chunk is relevant to the user's query. When the chunk has already been
+    graded upstream (the `relevant` state key is set), the stored grade is
+    used directly and no LLM call is made.
     """
 
-    _required_state_vars = ['user_query', 'chunk_txt']
-    _output_property = 'relevant'
-    _prompt_adjustments: Dict[str, Any] = _RETRIEVAL_GRADER_DYNAMIC_PROMPT_DICT
+    __slots__ = (
+        '_is_relevant_next_step', '_no_relevance_next_step',
+        '_prompt_adjustments', '_query_adjusters',
+        '_batch_agent', '_max_batch_size', '_max_in_flight', '_grader_cache',
+        '_prefilter',
+    )
+
+    _default_required_state_vars = ('user_query', 'chunk_txt')
+    _default_output_property = 'relevant'
+    _default_prompt_adjustments: Dict[str, Any] = _RETRIEVAL_GRADER_DYNAMIC_PROMPT_DICT
+    _default_max_batch_size: int = 8
+    _default_max_in_flight: int = 8
 
 
     def __init__(
@@ -36,6 +120,11 @@ class GradeRetrievedChunkEdge(BaseAgenticConditionalEdge):
         agent: Optional[BaseAgent] = None,
         output_property: Optional[str] = None,
         prompt_adjustments: Optional[Dict[str, Any]] = None,
+        batch_agent: Optional[BaseAgent] = None,
+        max_batch_size: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        grader_cache: Optional[GraderCache] = None,
+        prefilter: Optional[Callable[[str, str], Optional[bool]]] = None,
     ):
         """
         Initializes the GradeRetrievedChunkEdge.
@@ -48,6 +137,13 @@ class GradeRetrievedChunkEdge(BaseAgenticConditionalEdge):
             agent: An optional pre-configured agent. If not provided, a default one is created.
             output_property: The name of the property expected in the agent's structured output.
             prompt_adjustments: A dictionary for adjusting the user query based on the entity.
+            batch_agent: An optional agent that grades several labeled chunks in one call.
+            max_batch_size: The maximum number of chunks graded in a single batched call.
+            max_in_flight: The maximum number of concurrent grading requests in async runs.
+            grader_cache: An optional cache of relevance grades keyed on the query and chunk.
+            prefilter: An optional cheap check called with the user query and the chunk
+                    before grading. It returns True or False to decide the relevance
+                    without calling the grader, or None to defer to it.
         """
         super().__init__(
             state_class= state_class,
@@ -64,9 +160,26 @@ class GradeRetrievedChunkEdge(BaseAgenticConditionalEdge):
             raise TypeError("no_relevance_next_step must be a string.")
         self._no_relevance_next_step = no_relevance_next_step
 
-        self._prompt_adjustments = prompt_adjustments or self._prompt_adjustments
+        self._prompt_adjustments = prompt_adjustments or self._default_prompt_adjustments
         if not isinstance(self._prompt_adjustments, dict):
             raise TypeError("'prompt_adjustments' must be a dictionary.")
+        self._query_adjusters = _build_query_adjusters(self._prompt_adjustments)
+
+        self._batch_agent = batch_agent or get_grader('batch_retrieval')
+
+        self._max_batch_size = max_batch_size or self._default_max_batch_size
+        if not isinstance(self._max_batch_size, int) or self._max_batch_size < 1:
+            raise ValueError("'max_batch_size' must be an integer greater or equal to 1.")
+
+        self._max_in_flight = max_in_flight or self._default_max_in_flight
+        if not isinstance(self._max_in_flight, int) or self._max_in_flight < 1:
+            raise ValueError("'max_in_flight' must be an integer greater or equal to 1.")
+
+        self._grader_cache = grader_cache or GraderCache()
+
+        if prefilter is not None and not callable(prefilter):
+            raise TypeError("'prefilter' must be callable.")
+        self._prefilter = prefilter
 
 
     @property
@@ -106,56 +219,374 @@ class GradeRetrievedChunkEdge(BaseAgenticConditionalEdge):
         if not isinstance(value, dict):
             raise TypeError("'prompt_adjustments' must be a dictionary.")
         self._prompt_adjustments = value
+        self._query_adjusters = _build_query_adjusters(value)
+
+
+    @property
+    def batch_agent(self) -> BaseAgent:
+        """Getter for the 'batch_agent' property."""
+        return self._batch_agent
+
+    @batch_agent.setter
+    def batch_agent(self, value: BaseAgent):
+        """Setter for the 'batch_agent' property with validation."""
+        if not isinstance(value, BaseAgent):
+            raise TypeError("'batch_agent' must be a BaseAgent instance.")
+        self._batch_agent = value
+
+
+    @property
+    def max_batch_size(self) -> int:
+        """Getter for the 'max_batch_size' property."""
+        return self._max_batch_size
+
+    @max_batch_size.setter
+    def max_batch_size(self, value: int):
+        """Setter for the 'max_batch_size' property with validation."""
+        if not isinstance(value, int) or value < 1:
+            raise ValueError("'max_batch_size' must be an integer greater or equal to 1.")
+        self._max_batch_size = value
+
+
+    @property
+    def max_in_flight(self) -> int:
+        """Getter for the 'max_in_flight' property."""
+        return self._max_in_flight
+
+    @max_in_flight.setter
+    def max_in_flight(self, value: int):
+        """Setter for the 'max_in_flight' property with validation."""
+        if not isinstance(value, int) or value < 1:
+            raise ValueError("'max_in_flight' must be an integer greater or equal to 1.")
+        self._max_in_flight = value
+
+
+    @property
+    def grader_cache(self) -> GraderCache:
+        """Getter for the 'grader_cache' property."""
+        return self._grader_cache
+
+    @grader_cache.setter
+    def grader_cache(self, value: GraderCache):
+        """Setter for the 'grader_cache' property with validation."""
+        if not isinstance(value, GraderCache):
+            raise TypeError("'grader_cache' must be a GraderCache instance.")
+        self._grader_cache = value
+
+
+    @property
+    def prefilter(self) -> Optional[Callable[[str, str], Optional[bool]]]:
+        """Getter for the 'prefilter' property."""
+        return self._prefilter
+
+    @prefilter.setter
+    def prefilter(self, value: Optional[Callable[[str, str], Optional[bool]]]):
+        """Setter for the 'prefilter' property with validation."""
+        if value is not None and not callable(value):
+            raise TypeError("'prefilter' must be callable.")
+        self._prefilter = value
 
 
     def get_default_agent(self) -> RetrievalGrader:
         """
-        Provides the default retrieval grader agent for this edge.
+        Provides a new default retrieval grader agent for this edge.
 
         Returns:
-            An instance of the RetrievalGrader agent.
+            A new instance of the RetrievalGrader agent.
         """
-        return RetrievalGrader()
+        return get_grader('retrieval')
 
 
-    def get_edge_function(self) -> Callable[[Dict[str, Any]], str]:
+    def _get_full_user_query(self, user_query: str, entity: Optional[str]) -> str:
+        """
+        Prefixes the user query with the entity-specific adjustment, if any.
+        """
+        return self._query_adjusters.get(entity, _identity_query)(user_query)
+
+
+    def _get_cached_grades(
+        self,
+        user_query: str,
+        full_user_query: str,
+        chunks: List[str],
+    ) -> Tuple[List[bytes], Dict[int, bool], List[List[int]]]:
+        """
+        Splits the chunks into known grades and batches of pending chunk positions.
+
+        A grade is known when it is cached or when the pre-filter decides it.
+        """
+        keys = [GraderCache.make_key(full_user_query, chunk_txt) for chunk_txt in chunks]
+
+        grades: Dict[int, bool] = {}
+        for i, key in enumerate(keys):
+            grade = self.grader_cache.get(key)
+            if grade is None and self.prefilter is not None:
+                grade = self.prefilter(user_query, chunks[i])
+            if grade is not None:
+                grades[i] = grade
+
+        pending = [i for i in range(len(chunks)) if i not in grades]
+        batches = [
+            pending[start:start + self.max_batch_size]
+            for start in range(0, len(pending), self.max_batch_size)
+        ]
+
+        return keys, grades, batches
+
+
+    @staticmethod
+    def _label_chunks(chunks: List[str], batch: List[int]) -> str:
+        """
+        Renders a batch of chunks as labeled documents for the batch grader.
+        """
+        return '\n\n'.join(
+            f'[chunk {j}]\n{chunks[i]}' for j, i in enumerate(batch)
+        )
+
+
+    def _store_batch_grades(
+        self,
+        result: Any,
+        batch: List[int],
+        keys: List[bytes],
+        grades: Dict[int, bool],
+    ) -> None:
+        """
+        Maps the labeled grades of a batched response back to chunk positions.
+        """
+        for grade in result.grades:
+            if 0 <= grade.id < len(batch):
+                grades[batch[grade.id]] = grade.relevant
+                self.grader_cache.set(keys[batch[grade.id]], grade.relevant)
+
+
+    def get_batch_grading_function(self) -> Callable[[str, Optional[str], List[str]], List[bool]]:
+        """
+        Returns a callable that grades a list of chunks with batched LLM calls.
+
+        Chunks are grouped in batches of at most `max_batch_size` labeled documents
+        and each batch is graded with a single call to the batch agent. Chunks whose
+        grade is missing from the batched response, or whole batches whose response
+        cannot be parsed, fall back to the single-chunk agent. Chunks already graded
+        for the same query are served from the grader cache and never sent.
+
+        The batches, and then the single-chunk fallbacks, are sent concurrently
+        with the runnables' `batch`, at most `max_in_flight` requests at a time.
+
+        Returns:
+            A function that takes the user query, the entity and the chunks, and
+            returns one relevance flag per chunk, aligned by position.
+        """
+
+        grade_chunks = self.agent.get_runnable().batch
+        grade_batches = self.batch_agent.get_runnable().batch
+        get_relevant = attrgetter(self.output_property)
+
+        def grade_retrieved_chunks(
+            user_query: str,
+            entity: Optional[str],
+            chunks: List[str],
+        ) -> List[bool]:
+            """
+            Determines whether each retrieved document is relevant to the question.
+            """
+            logger.debug("--- GRADE %d CHUNKS RELEVANCE TO QUESTION IN BATCHES ❔ ---", len(chunks))
+
+            full_user_query = self._get_full_user_query(user_query, entity)
+            keys, grades, batches = self._get_cached_grades(user_query, full_user_query, chunks)
+            config = {'max_concurrency': self.max_in_flight}
+
+            results = grade_batches(
+                [
+                    {'user_query': full_user_query, 'chunks': self._label_chunks(chunks, chunk_batch)}
+                    for chunk_batch in batches
+                ],
+                config= config,
+                return_exceptions= True
+            )
+            for chunk_batch, result in zip(batches, results):
+                if isinstance(result, Exception):
+                    logger.warning("--- BATCH GRADING FAILED, FALLING BACK TO SINGLE CHUNKS: %s ⚠️ ---", result)
+                else:
+                    self._store_batch_grades(result, chunk_batch, keys, grades)
+
+            missing = [i for i in range(len(chunks)) if i not in grades]
+            results = grade_chunks(
+                [{'user_query': full_user_query, 'chunk_txt': chunks[i]} for i in missing],
+                config= config
+            )
+            for i, result in zip(missing, results):
+                grades[i] = bool(get_relevant(result))
+                self.grader_cache.set(keys[i], grades[i])
+
+            return [grades[i] for i in range(len(chunks))]
+
+        return grade_retrieved_chunks
+
+
+    def get_async_batch_grading_function(
+        self
+    ) -> Callable[[str, Optional[str], List[str]], Awaitable[List[bool]]]:
+        """
+        Returns the async variant of `get_batch_grading_function`.
+
+        Every batch, and then every single-chunk fallback, is sent concurrently
+        with `asyncio.gather`, bounded by a semaphore of `max_in_flight` requests
+        so the provider rate limits are respected.
+
+        Returns:
+            An async function that takes the user query, the entity and the chunks,
+            and returns one relevance flag per chunk, aligned by position.
+        """
+
+        ainvoke = self.agent.get_runnable().ainvoke
+        batch_ainvoke = self.batch_agent.get_runnable().ainvoke
+        get_relevant = attrgetter(self.output_property)
+
+        async def agrade_retrieved_chunks(
+            user_query: str,
+            entity: Optional[str],
+            chunks: List[str],
+        ) -> List[bool]:
+            """
+            Determines whether each retrieved document is relevant to the question.
+            """
+            logger.debug("--- GRADE %d CHUNKS RELEVANCE TO QUESTION IN PARALLEL BATCHES ❔ ---", len(chunks))
+
+            full_user_query = self._get_full_user_query(user_query, entity)
+            keys, grades, batches = await asyncio.to_thread(
+                self._get_cached_grades, user_query, full_user_query, chunks
+            )
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+
+            async def grade_batch(batch: List[int]) -> Any:
+                async with semaphore:
+                    return await batch_ainvoke({
+                        'user_query': full_user_query,
+                        'chunks': self._label_chunks(chunks, batch)
+                    })
+
+            async def grade_chunk(i: int) -> bool:
+                async with semaphore:
+                    return await _acached_grade(
+                        self.grader_cache,
+                        keys[i],
+                        ainvoke,
+                        {'user_query': full_user_query, 'chunk_txt': chunks[i]},
+                        get_relevant
+                    )
+
+            results = await asyncio.gather(
+                *(grade_batch(batch) for batch in batches),
+                return_exceptions= True
+            )
+            for batch, result in zip(batches, results):
+                if isinstance(result, Exception):
+                    logger.warning("--- BATCH GRADING FAILED, FALLING BACK TO SINGLE CHUNKS: %s ⚠️ ---", result)
+                else:
+                    self._store_batch_grades(result, batch, keys, grades)
+
+            missing = [i for i in range(len(chunks)) if i not in grades]
+            grades.update(zip(
+                missing,
+                await asyncio.gather(*(grade_chunk(i) for i in missing))
+            ))
+
+            return [grades[i] for i in range(len(chunks))]
+
+        return agrade_retrieved_chunks
+
+
+    def get_edge_function(self) -> Runnable[Dict[str, Any], str]:
         """
         Returns the callable function for this conditional edge.
+
+        The returned runnable grades with `invoke` in sync runs and with
+        `ainvoke` in async runs, where concurrent branches grading the same
+        chunk for the same query share a single grader call.
         """
         
         agent_runnable = self.agent.get_runnable()
+        invoke = agent_runnable.invoke
+        ainvoke = agent_runnable.ainvoke
+        get_relevant = attrgetter(self.output_property)
+        is_relevant_next_step = self.is_relevant_next_step
+        no_relevance_next_step = self.no_relevance_next_step
+        query_adjusters = self._query_adjusters
+        get_inputs = itemgetter('user_query', 'chunk_txt')
+        prefilter = self.prefilter
+
+        def route(relevant: bool) -> str:
+            if relevant:
+                logger.debug("--- GRADE: RELEVANT CHUNK ✅ ---")
+                return is_relevant_next_step
+            else:
+                logger.debug("--- GRADE: NOT RELEVANT CHUNK 🗑️ ---")
+                return no_relevance_next_step
         
         def grade_retrieved_chunk(state: Dict[str, Any]) -> str:
             """
             Determines whether the retrieved document is relevant to the question.
             """
-            logging.info("--- GRADE CHUNK RELEVANCE TO QUESTION ❔ ---")
-            
-            user_query: str = state['user_query']
-            entity = state.get('entity')
-            chunk_txt = state['chunk_txt']
-            
-            full_user_query = user_query
-            if entity and entity in self.prompt_adjustments:
-                adjustment = self.prompt_adjustments[entity]['user_query']
-                if not user_query.strip().upper().startswith(adjustment.strip().upper()):
-                    full_user_query = f'{adjustment}"{user_query}"'
-            
-            relevant = getattr(
-                agent_runnable.invoke(
-                    {'user_query': full_user_query, 'chunk_txt': chunk_txt}
-                ),
-                self.output_property
-            )
+            logger.debug("--- GRADE CHUNK RELEVANCE TO QUESTION ❔ ---")
+
+            relevant = state.get('relevant')
+
+            if relevant is None:
+                user_query, chunk_txt = get_inputs(state)
+                full_user_query = query_adjusters.get(
+                    state.get('entity'), _identity_query
+                )(user_query)
+                key = GraderCache.make_key(full_user_query, chunk_txt)
+
+                # The grade cache is consulted first, so a hit skips the pre-filter embeddings
+                relevant = self.grader_cache.get(key)
+                if relevant is None and prefilter is not None:
+                    relevant = prefilter(user_query, chunk_txt)
+
+                if relevant is None:
+                    relevant = _cached_grade(
+                        self.grader_cache,
+                        key,
+                        invoke,
+                        {'user_query': full_user_query, 'chunk_txt': chunk_txt},
+                        get_relevant
+                    )
 
-            if relevant:
-                logging.info("--- GRADE: RELEVANT CHUNK ✅ ---")
-                return self.is_relevant_next_step
-            else:
-                logging.info("--- GRADE: NOT RELEVANT CHUNK 🗑️ ---")
-                return self.no_relevance_next_step
+            return route(relevant)
+
+        async def agrade_retrieved_chunk(state: Dict[str, Any]) -> str:
+            """
+            Async variant of `grade_retrieved_chunk`.
+            """
+            logger.debug("--- GRADE CHUNK RELEVANCE TO QUESTION ❔ ---")
+
+            relevant = state.get('relevant')
+
+            if relevant is None:
+                user_query, chunk_txt = get_inputs(state)
+                full_user_query = query_adjusters.get(
+                    state.get('entity'), _identity_query
+                )(user_query)
+                key = GraderCache.make_key(full_user_query, chunk_txt)
+
+                # The grade cache is consulted first, so a hit skips the pre-filter embeddings
+                relevant = self.grader_cache.get(key)
+                if relevant is None and prefilter is not None:
+                    relevant = await asyncio.to_thread(prefilter, user_query, chunk_txt)
+
+                if relevant is None:
+                    relevant = await _acached_grade(
+                        self.grader_cache,
+                        key,
+                        ainvoke,
+                        {'user_query': full_user_query, 'chunk_txt': chunk_txt},
+                        get_relevant
+                    )
+
+            return route(relevant)
         
-        return grade_retrieved_chunk
+        return RunnableLambda(grade_retrieved_chunk, afunc= agrade_retrieved_chunk)
 
 
 
@@ -168,16 +599,29 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
     1. The number of generation iterations to prevent infinite loops.
     2. Whether the generated content is grounded in the provided context (no hallucinations).
     3. Whether the generated content addresses the user's original query.
+
+    By default both checks are answered by a single `CompositeGrader` call.
+    When custom hallucination or answer graders are provided or set instead,
+    the two checks run as separate calls, with the missing one defaulted on
+    first use.
     """
 
-    _required_state_vars = [
+    __slots__ = (
+        '_retry_next_step', '_abort_next_step', '_end_next_step',
+        '_max_iterations', '_prompt_adjustments', '_query_adjusters',
+        '_hallucination_grader', '_answer_grader', '_composite_grader',
+        '_hallucination_output_property', '_answer_grader_output_property',
+        '_grader_cache',
+    )
+
+    _default_required_state_vars = (
         'generate_iterations', 
         'user_query', 'chunk_txt', 'chunk_summary'
-    ]
-    _max_iterations: int = 3
-    _prompt_adjustments: Dict[str, Any] = _RETRIEVAL_GRADER_DYNAMIC_PROMPT_DICT
-    _hallucination_output_property = 'grounded'
-    _answer_grader_output_property = 'addresses'
+    )
+    _default_max_iterations: int = 3
+    _default_prompt_adjustments: Dict[str, Any] = _RETRIEVAL_GRADER_DYNAMIC_PROMPT_DICT
+    _default_hallucination_output_property = 'grounded'
+    _default_answer_grader_output_property = 'addresses'
 
 
     def __init__(
@@ -190,7 +634,9 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
         max_iterations: Optional[int] = None,
         hallucination_grader: Optional[BaseAgent] = None,
         answer_grader: Optional[BaseAgent] = None,
-        prompt_adjustments: Optional[Dict[str, Any]] = None
+        prompt_adjustments: Optional[Dict[str, Any]] = None,
+        grader_cache: Optional[GraderCache] = None,
+        composite_grader: Optional[BaseAgent] = None,
     ):
         """
         Initializes the edge with its dependencies.
@@ -205,6 +651,9 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
             hallucination_grader: An agent to check for ungrounded content.
             answer_grader: An agent to check if the answer addresses the question.
             prompt_adjustments: A dictionary to adjust the prompt based on entity.
+            grader_cache: An optional cache of the hallucination and answer grades.
+            composite_grader: An agent answering both checks in one call. Defaults to a
+                    CompositeGrader unless custom separate graders are provided.
         """
         super().__init__(
             state_class= state_class, 
@@ -223,27 +672,43 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
             raise TypeError("end_next_step must be a string.")
         self._end_next_step = end_next_step
 
-        self._max_iterations = max_iterations or self._max_iterations
+        self._max_iterations = max_iterations or self._default_max_iterations
         if self._max_iterations <= 1:
             raise ValueError("'max_iterations' must be an integer greater or equal to 1.")
 
-        self._prompt_adjustments = prompt_adjustments or self._prompt_adjustments
+        self._prompt_adjustments = prompt_adjustments or self._default_prompt_adjustments
         if self._prompt_adjustments is not None and not isinstance(self._prompt_adjustments, dict):
             raise TypeError("'prompt_adjustments' must be a dictionary.")
+        self._query_adjusters = _build_query_adjusters(self._prompt_adjustments or {}, suffix= '.')
+
+        self._hallucination_output_property = self._default_hallucination_output_property
+        self._answer_grader_output_property = self._default_answer_grader_output_property
+
+        # The separate graders are only built on first access, since a composite
+        # grader, the default, makes them unnecessary
+        if hallucination_grader is not None:
+            self._validate_agent(
+                hallucination_grader,
+                self._hallucination_output_property,
+                'hallucination_grader'
+            )
+        self._hallucination_grader = hallucination_grader
 
-        self._hallucination_grader = hallucination_grader or self.get_default_hallucination_grader()
-        self._validate_agent(
-            self.hallucination_grader,
-            self._hallucination_output_property,
-            'hallucination_grader'
-        )
+        if answer_grader is not None:
+            self._validate_agent(
+                answer_grader,
+                self._answer_grader_output_property,
+                'answer_grader'
+            )
+        self._answer_grader = answer_grader
 
-        self._answer_grader = answer_grader or self.get_default_answer_grader()
-        self._validate_agent(
-            self.answer_grader,
-            self._answer_grader_output_property,
-            'answer_grader'
-        )
+        self._grader_cache = grader_cache or GraderCache()
+
+        if composite_grader is None and hallucination_grader is None and answer_grader is None:
+            composite_grader = self.get_default_composite_grader()
+        if composite_grader is not None:
+            self._validate_composite_grader(composite_grader)
+        self._composite_grader = composite_grader
 
 
     @property
@@ -300,18 +765,26 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
 
     @property
     def hallucination_grader(self) -> BaseAgent:
-        """Getter for the 'hallucination_grader' property."""
+        """Getter for the 'hallucination_grader' property. The default grader is built on first access."""
+        if self._hallucination_grader is None:
+            self._hallucination_grader = self.get_default_hallucination_grader()
         return self._hallucination_grader
 
     @hallucination_grader.setter
     def hallucination_grader(self, value: BaseAgent):
-        """Setter for the 'hallucination_grader' property with validation."""
+        """
+        Setter for the 'hallucination_grader' property with validation.
+
+        Setting a separate grader discards the composite grader, so both checks
+        run as separate calls from then on.
+        """
         self._validate_agent(
             value,
             self._hallucination_output_property,
             'hallucination_grader'
         )
         self._hallucination_grader = value
+        self._composite_grader = None
 
 
     @property
@@ -327,18 +800,26 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
 
     @property
     def answer_grader(self) -> BaseAgent:
-        """Getter for the 'answer_grader' property."""
+        """Getter for the 'answer_grader' property. The default grader is built on first access."""
+        if self._answer_grader is None:
+            self._answer_grader = self.get_default_answer_grader()
         return self._answer_grader
 
     @answer_grader.setter
     def answer_grader(self, value: BaseAgent):
-        """Setter for the 'answer_grader' property with validation."""
+        """
+        Setter for the 'answer_grader' property with validation.
+
+        Setting a separate grader discards the composite grader, so both checks
+        run as separate calls from then on.
+        """
         self._validate_agent(
             value,
             self._answer_grader_output_property,
             'answer_grader'
         )
         self._answer_grader = value
+        self._composite_grader = None
 
 
     @property
@@ -363,99 +844,340 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
         if not isinstance(value, dict):
             raise TypeError("'prompt_adjustments' must be a dictionary.")
         self._prompt_adjustments = value
+        self._query_adjusters = _build_query_adjusters(value, suffix= '.')
+
+
+    @property
+    def grader_cache(self) -> GraderCache:
+        """Getter for the 'grader_cache' property."""
+        return self._grader_cache
+
+    @grader_cache.setter
+    def grader_cache(self, value: GraderCache):
+        """Setter for the 'grader_cache' property with validation."""
+        if not isinstance(value, GraderCache):
+            raise TypeError("'grader_cache' must be a GraderCache instance.")
+        self._grader_cache = value
+
+    @property
+    def composite_grader(self) -> Optional[BaseAgent]:
+        """Getter for the 'composite_grader' property."""
+        return self._composite_grader
+
+    @composite_grader.setter
+    def composite_grader(self, value: Optional[BaseAgent]):
+        """Setter for the 'composite_grader' property with validation. `None` restores the two-call grading."""
+        if value is not None:
+            self._validate_composite_grader(value)
+        self._composite_grader = value
+
+    @staticmethod
+    def get_default_composite_grader() -> CompositeGrader:
+        """
+        Provides a new default composite grader agent for this edge.
+        
+        Returns:
+            A new instance of the CompositeGrader agent.
+        """
+        return get_grader('composite')
 
     @staticmethod
     def get_default_hallucination_grader() -> HallucinationGrader:
         """
-        Provides the default hallucination grader agent for this edge.
+        Provides a new default hallucination grader agent for this edge.
         
         Returns:
-            An instance of the HallucinationGrader agent.
+            A new instance of the HallucinationGrader agent.
         """
-        return HallucinationGrader()
+        return get_grader('hallucination')
 
     @staticmethod
     def get_default_answer_grader() -> AnswerGrader:
         """
-        Provides the default answer grader agent for this edge.
+        Provides a new default answer grader agent for this edge.
         
         Returns:
-            An instance of the AnswerGrader agent.
+            A new instance of the AnswerGrader agent.
+        """
+        return get_grader('answer')
+
+
+    def _get_full_user_query(self, user_query: str, entity: Optional[str]) -> str:
+        """
+        Prefixes the user query with the entity-specific adjustment, if any.
+        """
+        return self._query_adjusters.get(entity, _identity_query)(user_query)
+
+
+    def _prepare_grading(self, state: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+        """
+        Checks the iteration budget and extracts the grading inputs from the state.
+
+        Returns:
+            A `(chunk_txt, full_user_query, chunk_summary)` tuple, or None when the
+            maximum number of iterations has been reached.
+        """
+        logger.debug("--- CHECK ITERATIONS 🔁 ---")
+        generate_iterations = state.get('generate_iterations', 0)
+
+        if generate_iterations >= self.max_iterations:
+            logger.debug("--- DECISION: MAX ITERATIONS REACHED (%d) 🔚 ---", generate_iterations)
+            return None
+
+        full_user_query = self._get_full_user_query(state['user_query'], state.get('entity'))
+        return state['chunk_txt'], full_user_query, state['chunk_summary'][0]
+
+
+    @staticmethod
+    def _hallucination_grade_args(chunk_txt: str, chunk_summary: str) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Returns the cache key and the grader inputs for the hallucination check.
+        """
+        return (
+            GraderCache.make_key('hallucination', chunk_txt, chunk_summary),
+            {'chunk_txt': chunk_txt, 'chunk_summary': chunk_summary}
+        )
+
+
+    @staticmethod
+    def _answer_grade_args(full_user_query: str, chunk_summary: str) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Returns the cache key and the grader inputs for the answer check.
+        """
+        return (
+            GraderCache.make_key('answer', full_user_query, chunk_summary),
+            {'user_query': full_user_query, 'chunk_summary': chunk_summary}
+        )
+
+
+    def _get_cached_composite_grades(
+        self,
+        chunk_txt: str,
+        full_user_query: str,
+        chunk_summary: str,
+    ) -> Tuple[Tuple[bytes, bytes], Optional[Tuple[bool, bool]]]:
+        """
+        Looks up both checks in the grader cache.
+
+        Returns:
+            The two cache keys, and the cached `(grounded, addresses)` pair, or None
+            when either grade is missing and the composite grader must be called.
         """
-        return AnswerGrader()
+        keys = (
+            GraderCache.make_key('hallucination', chunk_txt, chunk_summary),
+            GraderCache.make_key('answer', full_user_query, chunk_summary),
+        )
+        grounded, addresses = (self.grader_cache.get(key) for key in keys)
+        if grounded is None or addresses is None:
+            return keys, None
+        return keys, (grounded, addresses)
+
+
+    def _store_composite_grades(
+        self,
+        keys: Tuple[bytes, bytes],
+        result: Any,
+        get_grounded: Callable[[Any], bool],
+        get_addresses: Callable[[Any], bool],
+    ) -> Tuple[bool, bool]:
+        """
+        Stores both grades of a composite grader response and returns them.
+        """
+        grades = (bool(get_grounded(result)), bool(get_addresses(result)))
+        for key, grade in zip(keys, grades):
+            self.grader_cache.set(key, grade)
+        return grades
+
+
+    def _composite_grade(
+        self,
+        composite_invoke: Callable[[Dict[str, Any]], Any],
+        get_grounded: Callable[[Any], bool],
+        get_addresses: Callable[[Any], bool],
+        grading_inputs: Tuple[str, str, str],
+    ) -> Tuple[bool, bool]:
+        """
+        Grades both checks with one composite call, reusing cached grades when both exist.
+        """
+        keys, grades = self._get_cached_composite_grades(*grading_inputs)
+        if grades is None:
+            result = composite_invoke(dict(zip(_COMPOSITE_INPUT_KEYS, grading_inputs)))
+            grades = self._store_composite_grades(keys, result, get_grounded, get_addresses)
+        return grades
+
+
+    async def _acomposite_grade(
+        self,
+        composite_ainvoke: Callable[[Dict[str, Any]], Awaitable[Any]],
+        get_grounded: Callable[[Any], bool],
+        get_addresses: Callable[[Any], bool],
+        grading_inputs: Tuple[str, str, str],
+    ) -> Tuple[bool, bool]:
+        """
+        Async variant of `_composite_grade`.
+        """
+        keys, grades = self._get_cached_composite_grades(*grading_inputs)
+        if grades is None:
+            result = await composite_ainvoke(dict(zip(_COMPOSITE_INPUT_KEYS, grading_inputs)))
+            grades = self._store_composite_grades(keys, result, get_grounded, get_addresses)
+        return grades
 
 
-    def get_edge_function(self) -> Callable[[Dict[str, Any]], str]:
+    def _decide_on_grounding(self, grounded: bool) -> Optional[str]:
+        """
+        Returns the retry step for an ungrounded generation, or None to go on with the answer check.
+        """
+        if not grounded:
+            logger.debug("--- DECISION: GENERATION IS NOT GROUNDED (HALLUCINATIONS) 👻❌ ---")
+            return self.retry_next_step
+
+        logger.debug("--- DECISION: GENERATION IS GROUNDED IN DOCUMENTS ✅ ---")
+        return None
+
+
+    def _decide_on_answer(self, addresses: bool) -> str:
+        """
+        Returns the next step for a grounded generation, based on the answer check.
+        """
+        if addresses:
+            logger.debug("--- DECISION: GENERATION ADDRESSES QUESTION ✅ ---")
+            return self.end_next_step
+
+        logger.debug("--- DECISION: GENERATION DOES NOT ADDRESS QUESTION ❌ ---")
+        return self.retry_next_step
+
+
+    def get_edge_function(self) -> Runnable[Dict[str, Any], str]:
         """
         Returns the callable function for this graph node's edge.
+
+        With a composite grader both checks are answered by one call. Otherwise,
+        the returned runnable grades sequentially when the graph is invoked
+        synchronously, and runs both graders concurrently through
+        `get_async_edge_function` when the graph is invoked asynchronously.
         
         Returns:
-            A function that takes the state dictionary and returns the next node's name.
+            A runnable that takes the state dictionary and returns the next node's name.
         """
         
-        hallucination_grader = self.hallucination_grader.get_runnable()
-        answer_grader = self.answer_grader.get_runnable()
+        if self.composite_grader is not None:
+            composite_invoke = self.composite_grader.get_runnable().invoke
+            h_invoke = a_invoke = None
+        else:
+            composite_invoke = None
+            h_invoke = self.hallucination_grader.get_runnable().invoke
+            a_invoke = self.answer_grader.get_runnable().invoke
+        get_grounded = attrgetter(self.hallucination_output_property)
+        get_addresses = attrgetter(self.answer_grader_output_property)
 
 
         def grade_chunk_summary_generation(state: Dict[str, Any]) -> str:
             """
             Determines the next step based on the generation's quality.
             """
-            logging.info("--- CHECK ITERATIONS 🔁 ---")
-            generate_iterations = state.get('generate_iterations', 0)
-
-            if generate_iterations >= self.max_iterations:
-                logging.info(f"--- DECISION: MAX ITERATIONS REACHED ({generate_iterations}) 🔚 ---")
+            grading_inputs = self._prepare_grading(state)
+            if grading_inputs is None:
                 return self.abort_next_step
 
+            chunk_txt, full_user_query, chunk_summary = grading_inputs
 
-            logging.info("--- GRADE HALLUCINATIONS 👻 ---")
-            user_query: str = state['user_query']
-            entity = state.get('entity')
-            chunk_txt = state['chunk_txt']
-            chunk_summary = state['chunk_summary'][0]
+            if composite_invoke is not None:
+                logger.debug("--- GRADE HALLUCINATIONS AND ANSWER IN ONE CALL 👻 ---")
+                grounded, addresses = self._composite_grade(
+                    composite_invoke, get_grounded, get_addresses, grading_inputs
+                )
+            else:
+                logger.debug("--- GRADE HALLUCINATIONS 👻 ---")
+                key, inputs = self._hallucination_grade_args(chunk_txt, chunk_summary)
+                grounded = _cached_grade(self.grader_cache, key, h_invoke, inputs, get_grounded)
+                addresses = None
 
-            grounded = getattr(
-                hallucination_grader.invoke({
-                    'chunk_txt': chunk_txt,
-                    'chunk_summary': chunk_summary
-                }),
-                self.hallucination_output_property
-            )
+            next_step = self._decide_on_grounding(grounded)
+            if next_step is not None:
+                return next_step
 
-            if grounded:
-                logging.info("--- DECISION: GENERATION IS GROUNDED IN DOCUMENTS ✅ ---")
-
-                full_user_query = user_query
-                if entity and entity in self.prompt_adjustments:
-                    full_user_query = (
-                        user_query
-                        if user_query.strip().upper().startswith(
-                            self.prompt_adjustments[entity]['user_query'].strip().upper()
-                        ) else
-                        f'{self.prompt_adjustments[entity]["user_query"]}"{user_query}".'
-                    )
-                
-                addresses = getattr(
-                    answer_grader.invoke({
-                        'user_query': full_user_query,
-                        'chunk_summary': chunk_summary
-                    }),
-                    self.answer_grader_output_property
-                )
+            if addresses is None:
+                key, inputs = self._answer_grade_args(full_user_query, chunk_summary)
+                addresses = _cached_grade(self.grader_cache, key, a_invoke, inputs, get_addresses)
 
-                if addresses:
-                    logging.info("--- DECISION: GENERATION ADDRESSES QUESTION ✅ ---")
-                    return self.end_next_step
+            return self._decide_on_answer(addresses)
+        
+        return RunnableLambda(
+            grade_chunk_summary_generation,
+            afunc= self.get_async_edge_function()
+        )
 
-                else:
-                    logging.info("--- DECISION: GENERATION DOES NOT ADDRESS QUESTION ❌ ---")
+
+    def get_async_edge_function(self) -> Callable[[Dict[str, Any]], Awaitable[str]]:
+        """
+        Returns the async callable function for this graph node's edge.
+
+        With a composite grader both checks are answered by one call. Otherwise,
+        both graders only read the state, so they are launched concurrently and
+        the critical path drops to the slowest of the two calls. The answer grader
+        is cancelled as soon as the hallucination grader reports an ungrounded
+        generation, since its result would be discarded anyway.
+        
+        Returns:
+            An async function that takes the state dictionary and returns the next node's name.
+        """
+        
+        if self.composite_grader is not None:
+            composite_ainvoke = self.composite_grader.get_runnable().ainvoke
+            h_ainvoke = a_ainvoke = None
+        else:
+            composite_ainvoke = None
+            h_ainvoke = self.hallucination_grader.get_runnable().ainvoke
+            a_ainvoke = self.answer_grader.get_runnable().ainvoke
+        get_grounded = attrgetter(self.hallucination_output_property)
+        get_addresses = attrgetter(self.answer_grader_output_property)
+
+
+        async def agrade_chunk_summary_generation(state: Dict[str, Any]) -> str:
+            """
+            Async variant of `grade_chunk_summary_generation`.
+            """
+            grading_inputs = self._prepare_grading(state)
+            if grading_inputs is None:
+                return self.abort_next_step
+
+            chunk_txt, full_user_query, chunk_summary = grading_inputs
+            answer_task = None
+
+            if composite_ainvoke is not None:
+                logger.debug("--- GRADE HALLUCINATIONS AND ANSWER IN ONE CALL 👻 ---")
+                grounded, addresses = await self._acomposite_grade(
+                    composite_ainvoke, get_grounded, get_addresses, grading_inputs
+                )
             else:
-                logging.info("--- DECISION: GENERATION IS NOT GROUNDED (HALLUCINATIONS) 👻❌ ---")
+                logger.debug("--- GRADE HALLUCINATIONS AND ANSWER CONCURRENTLY 👻 ---")
+                h_key, h_inputs = self._hallucination_grade_args(chunk_txt, chunk_summary)
+                a_key, a_inputs = self._answer_grade_args(full_user_query, chunk_summary)
+                hallucination_task = asyncio.create_task(
+                    _acached_grade(self.grader_cache, h_key, h_ainvoke, h_inputs, get_grounded)
+                )
+                answer_task = asyncio.create_task(
+                    _acached_grade(self.grader_cache, a_key, a_ainvoke, a_inputs, get_addresses)
+                )
 
-            return self.retry_next_step
+                try:
+                    grounded = await hallucination_task
+                except BaseException:
+                    answer_task.cancel()
+                    raise
+
+            next_step = self._decide_on_grounding(grounded)
+            if next_step is not None:
+                if answer_task is not None:
+                    answer_task.cancel()
+                return next_step
+
+            if answer_task is not None:
+                addresses = await answer_task
+
+            return self._decide_on_answer(addresses)
         
-        return grade_chunk_summary_generation
+        return agrade_chunk_summary_generation
 
 
     def _validate_agent(
@@ -470,8 +1192,16 @@ class GradeChunkSummaryGenerationEdge(BaseEdge):
         if not agent.structured_output:
             raise ValueError(f"The agent '{agent_name}' must have a structured output.")
         
-        if output_field not in agent.structured_output.model_json_schema()['properties']:
+        if output_field not in agent.structured_output_properties:
             raise AttributeError(
                 f"The structured output of {agent_name} must have a '{output_field}' field."
             )
 
+
+    def _validate_composite_grader(self, agent: BaseAgent) -> None:
+        """
+        Validates that the composite grader outputs both the hallucination and answer fields.
+        """
+        for output_field in (self._hallucination_output_property, self._answer_grader_output_property):
+            self._validate_agent(agent, output_field, 'composite_grader')
+
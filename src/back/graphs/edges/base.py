@@ -1,8 +1,15 @@
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Literal, Optional, Type
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type
 
 from ..agents import BaseAgent
+from ..states import get_state_keys
+
+
+def _are_strings(items) -> bool:
+    """Checks that every item is a string, looping in C through `map`."""
+    return all(map(isinstance, items, repeat(str)))
 
 
 class BaseEdge(ABC):
@@ -12,31 +19,35 @@ class BaseEdge(ABC):
     This class provides common functionality for edges, including state validation
     and an abstract method for defining the routing logic.
     """
-    
-    _required_state_vars: Optional[List[str]] = None
+
+    __slots__ = ('_state_class', '_required_state_vars', '_required_set')
+
+    _default_required_state_vars: Optional[Tuple[str, ...]] = None
     
     def __init__(
         self, 
         state_class: Type[Dict],
-        required_state_vars: Optional[List[str]] = None
+        required_state_vars: Optional[Sequence[str]] = None
     ):
         """
         Initializes the base edge and validates the state class.
         
         Args:
             state_class: The TypedDict class representing the graph state.
-            required_state_vars: An optional list of required state variables.
+            required_state_vars: An optional list or tuple of required state variables.
         """
-        self._required_state_vars = required_state_vars or self._required_state_vars
+        required_state_vars = required_state_vars or self._default_required_state_vars
 
-        if self._required_state_vars is not None:
-            if not isinstance(self._required_state_vars, list):
-                raise TypeError("required_state_vars must be a list.")
-            if not all(isinstance(item, str) for item in self._required_state_vars):
+        if required_state_vars is not None:
+            if not isinstance(required_state_vars, (list, tuple)):
+                raise TypeError("required_state_vars must be a list or tuple.")
+            if not _are_strings(required_state_vars):
                 raise TypeError("All items in required_state_vars must be strings.")
         
-        if not self._required_state_vars:
+        if not required_state_vars:
             raise TypeError("A list of required state variables must be provided.")
+        self._required_state_vars = list(required_state_vars)
+        self._required_set = frozenset(required_state_vars)
 
         self._validate_state_class(state_class)
         self._state_class = state_class
@@ -59,12 +70,13 @@ class BaseEdge(ABC):
         return self._required_state_vars
 
     @required_state_vars.setter
-    def required_state_vars(self, value: List[str]):
-        if not isinstance(value, list):
-            raise TypeError("required_state_vars must be a list.")
-        if not all(isinstance(item, str) for item in value):
+    def required_state_vars(self, value: Sequence[str]):
+        if not isinstance(value, (list, tuple)):
+            raise TypeError("required_state_vars must be a list or tuple.")
+        if not _are_strings(value):
             raise TypeError("All items in required_state_vars must be strings.")
-        self._required_state_vars = value
+        self._required_state_vars = list(value)
+        self._required_set = frozenset(value)
 
 
     @abstractmethod
@@ -82,9 +94,11 @@ class BaseEdge(ABC):
         """
         Validates that the state class contains the specific keys required for this edge.
         """
-        if not all(key in state_class.__annotations__ for key in self._required_state_vars):
+        missing = self._required_set - get_state_keys(state_class)
+        if missing:
             raise AttributeError(
-                f"The state class must have the following keys with Type hints: {self._required_state_vars}"
+                f"The state class must have the following keys with Type hints: {self._required_state_vars}. "
+                f"Missing: {sorted(missing)}"
             )
 
 
@@ -96,8 +110,10 @@ class BaseAgenticConditionalEdge(BaseEdge):
     This class handles agent validation and fallback logic, inheriting
     state validation from BaseEdge.
     """
+    __slots__ = ('_agent', '_output_property')
+
     _agent_validation_Type: Literal['structured_output'] = 'structured_output'
-    _output_property: Optional[str] = None
+    _default_output_property: Optional[str] = None
 
     def __init__(
         self,
@@ -120,7 +136,7 @@ class BaseAgenticConditionalEdge(BaseEdge):
             required_state_vars= required_state_vars
         )
         
-        self._output_property = output_property or self._output_property
+        self._output_property = output_property or self._default_output_property
         if self._output_property is None:
             raise TypeError("A specific output property must be provided or defined as a class attribute.")
         
@@ -166,7 +182,7 @@ class BaseAgenticConditionalEdge(BaseEdge):
         if not agent.structured_output:
             raise ValueError("The agent must have a structured output.")
         
-        if self._output_property not in agent.structured_output.model_json_schema()['properties']:
+        if self._output_property not in agent.structured_output_properties:
             raise AttributeError(
                 f"The structured output must have a '{self._output_property}' field."
             )
@@ -0,0 +1,137 @@
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import Awaitable, Callable, Dict, Optional
+
+
+class GraderCache:
+    """
+    An exact-match LRU cache for the boolean results of grader agents.
+
+    Grades are keyed on a BLAKE2b digest of the whitespace-normalized inputs
+    of the grader, so re-running or retrying a graph over the same chunks does
+    not issue the same grading call again. The cache is shared by the parallel
+    branches of a graph, hence the lock around every access.
+
+    In async runs, concurrent requests for the same key are coalesced: only
+    the first one calls the grader and the others await its result, so
+    duplicated chunks across parallel branches cost a single grading call.
+    """
+
+    __slots__ = ('_maxsize', '_grades', '_lock', '_inflight')
+
+    _default_maxsize: int = 4096
+
+    def __init__(self, maxsize: Optional[int] = None):
+        """
+        Initializes an empty grader cache.
+
+        Args:
+            maxsize: The maximum number of cached grades. The least recently
+                    used grade is evicted once the cache is full.
+        """
+        self._maxsize = maxsize or self._default_maxsize
+        if not isinstance(self._maxsize, int) or self._maxsize < 1:
+            raise ValueError("'maxsize' must be an integer greater or equal to 1.")
+
+        self._grades: OrderedDict[bytes, bool] = OrderedDict()
+        self._lock = Lock()
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+
+
+    @property
+    def maxsize(self) -> int:
+        """Getter for the 'maxsize' property."""
+        return self._maxsize
+
+
+    @staticmethod
+    def make_key(*parts: str) -> bytes:
+        """
+        Builds the cache key for a set of grader inputs.
+
+        Args:
+            parts: The grader inputs, in a fixed order.
+
+        Returns:
+            A 16-byte digest of the normalized inputs.
+        """
+        normalized = '\x00'.join(' '.join(part.split()) for part in parts)
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size= 16).digest()
+
+
+    def get(self, key: bytes) -> Optional[bool]:
+        """
+        Returns the cached grade for a key, or None on a cache miss.
+        """
+        with self._lock:
+            grade = self._grades.get(key)
+            if grade is not None:
+                self._grades.move_to_end(key)
+            return grade
+
+
+    def set(self, key: bytes, grade: bool) -> None:
+        """
+        Stores a grade, evicting the least recently used one if needed.
+        """
+        with self._lock:
+            self._grades[key] = bool(grade)
+            self._grades.move_to_end(key)
+            if len(self._grades) > self._maxsize:
+                self._grades.popitem(last= False)
+
+
+    async def aget_or_compute(
+        self,
+        key: bytes,
+        compute: Callable[[], Awaitable[bool]],
+    ) -> bool:
+        """
+        Returns the cached grade for a key, computing it at most once at a time.
+
+        If another coroutine is already computing the same key, its result is
+        awaited instead of issuing a duplicate call. Should that computation
+        fail, the waiters compute the grade themselves.
+
+        Args:
+            key: The cache key, as built by `make_key`.
+            compute: A coroutine factory that calls the grader.
+
+        Returns:
+            The grade for the key.
+        """
+        grade = self.get(key)
+        if grade is not None:
+            return grade
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            grade = await asyncio.shield(pending)
+            if grade is not None:
+                return grade
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            grade = bool(await compute())
+            self.set(key, grade)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if not future.done():
+                future.set_result(grade)
+
+        return grade
+
+
+    def clear(self) -> None:
+        """Removes every cached grade."""
+        with self._lock:
+            self._grades.clear()
+
+
+    def __len__(self) -> int:
+        return len(self._grades)
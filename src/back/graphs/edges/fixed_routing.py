@@ -1,17 +1,30 @@
 
-from typing import Any, Callable, Dict, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict
 
 
 
 class RouteBooleanStateVariableEdge:
     """
     A conditional edge node that routes the flow based on a boolean state variable.
+
+    The routing parameters are validated once, when the edge is built, and are
+    read-only afterwards, since the graph captures them at compile time.
+    Instances are callable, so they can be passed to `add_conditional_edges`
+    directly.
     """
+
+    __slots__ = (
+        '_relevance_state_variable', '_is_relevant_next_step',
+        '_no_relevance_next_step', '_next_steps',
+    )
+
     def __init__(
         self,
         relevance_state_variable: str,
-        is_relevant_next_step: Union[str, bool],
-        no_relevance_next_step: Union[str, bool]
+        is_relevant_next_step: str,
+        no_relevance_next_step: str
     ):
         """
         Initializes the node with its dependencies and configurable routing parameters.
@@ -25,70 +38,85 @@ class RouteBooleanStateVariableEdge:
             raise TypeError("relevance_state_variable must be a string.")
         self._relevance_state_variable = relevance_state_variable
 
-        if not isinstance(is_relevant_next_step, (str, bool)):
-            raise TypeError("is_relevant_next_step must be a string or bool.")
+        if not isinstance(is_relevant_next_step, str):
+            raise TypeError("is_relevant_next_step must be a string.")
         self._is_relevant_next_step = is_relevant_next_step
 
-        if not isinstance(no_relevance_next_step, (str, bool)):
-            raise TypeError("no_relevance_next_step must be a string or bool.")
+        if not isinstance(no_relevance_next_step, str):
+            raise TypeError("no_relevance_next_step must be a string.")
         self._no_relevance_next_step = no_relevance_next_step
 
+        self._next_steps = (no_relevance_next_step, is_relevant_next_step)
+
 
     @property
     def relevance_state_variable(self) -> str:
-        """Getter for the relevance_state_variable property."""
+        """Getter for the read-only relevance_state_variable property."""
         return self._relevance_state_variable
 
-    @relevance_state_variable.setter
-    def relevance_state_variable(self, value: str):
-        """Setter for the relevance_state_variable property."""
-        if not isinstance(value, str):
-            raise TypeError("relevance_state_variable must be a string.")
-        self._relevance_state_variable = value
-
 
     @property
-    def is_relevant_next_step(self) -> Union[str, bool]:
-        """Getter for the is_relevant_next_step property."""
+    def is_relevant_next_step(self) -> str:
+        """Getter for the read-only is_relevant_next_step property."""
         return self._is_relevant_next_step
 
-    @is_relevant_next_step.setter
-    def is_relevant_next_step(self, value: Union[str, bool]):
-        """Setter for the is_relevant_next_step property."""
-        if not isinstance(value, (str, bool)):
-            raise TypeError("is_relevant_next_step must be a string or bool.")
-        self._is_relevant_next_step = value
-
 
     @property
-    def no_relevance_next_step(self) -> Union[str, bool]:
-        """Getter for the no_relevance_next_step property."""
+    def no_relevance_next_step(self) -> str:
+        """Getter for the read-only no_relevance_next_step property."""
         return self._no_relevance_next_step
 
-    @no_relevance_next_step.setter
-    def no_relevance_next_step(self, value: Union[str, bool]):
-        """Setter for the no_relevance_next_step property."""
-        if not isinstance(value, (str, bool)):
-            raise TypeError("no_relevance_next_step must be a string or bool.")
-        self._no_relevance_next_step = value
-
 
     def get_edge_function(self) -> Callable[[Dict[str, Any]], str]:
         """
         Returns the callable function for this conditional edge.
+
+        The state variable getter and a (False, True) table of next steps are
+        captured when the function is built, so routing costs a single item
+        lookup and a tuple index.
         """
+        get_relevance = itemgetter(self.relevance_state_variable)
+        next_steps = self._next_steps
+
         def route_context_relevance(state: Dict[str, Any]) -> str:
             """
             Routes the flow based on a boolean state variable.
             """
-            if not isinstance(state[self.relevance_state_variable], bool):
-                TypeError(f"'{self.relevance_state_variable}' in state must be a bool.")
-
-            return (
-                self.is_relevant_next_step
-                if state[self.relevance_state_variable] else
-                self.no_relevance_next_step
-            )
+            return next_steps[bool(get_relevance(state))]
 
         return route_context_relevance
 
+
+    def __call__(self, state: Dict[str, Any]) -> str:
+        """
+        Routes the flow based on a boolean state variable.
+        """
+        return self._next_steps[bool(state[self._relevance_state_variable])]
+
+
+
+@lru_cache(maxsize= None)
+def get_boolean_router(
+    relevance_state_variable: str,
+    is_relevant_next_step: str,
+    no_relevance_next_step: str,
+) -> RouteBooleanStateVariableEdge:
+    """
+    Returns the shared routing edge for a routing configuration.
+
+    Edges are immutable, so every graph routing on the same state variable to
+    the same next steps reuses a single instance across the process.
+
+    Args:
+        relevance_state_variable: The key in the state dictionary to check.
+        is_relevant_next_step: The node to call if the state variable is True.
+        no_relevance_next_step: The node to call if the state variable is False.
+
+    Returns:
+        The RouteBooleanStateVariableEdge for the configuration.
+    """
+    return RouteBooleanStateVariableEdge(
+        relevance_state_variable,
+        is_relevant_next_step,
+        no_relevance_next_step
+    )
@@ -1,29 +1,42 @@
 
-from typing import Any, Callable, Dict, List, Optional, Type
+from functools import partial
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Type
+from langchain_core.runnables import Runnable, RunnableLambda
 from langgraph.graph.state import Send
 
+from .agent_decision import GradeRetrievedChunkEdge
 from .base import BaseEdge
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('edges.parallel_processing')
 
 
 class SendToParallelGradingEdge(BaseEdge):
     """
     A conditional edge node that generates a list of `Send` instructions 
     for parallel execution based on retrieval results.
+
+    When a chunk grader is provided, all retrieved chunks are graded for
+    relevance with batched LLM calls before fanning out, and each `Send`
+    carries its precomputed `relevant` flag so the target graph can route
+    without grading the chunk again.
     """
 
-    _required_state_vars = [
+    __slots__ = ('_target_node_name', '_chunk_grader')
+
+    _default_required_state_vars = (
         'user_query', 'language', 
         'entity', 'retrieval_results'
-    ]
+    )
 
     def __init__(
         self,
         state_class: Type[Dict],
         target_node_name: str,
         required_state_vars: Optional[List[str]] = None,
+        chunk_grader: Optional[GradeRetrievedChunkEdge] = None,
     ):
         """
         Initializes the node with its dependencies.
@@ -31,6 +44,7 @@ class SendToParallelGradingEdge(BaseEdge):
             state_class: The TypedDict class for state validation.
             target_node_name: The name of the node to send the state to.
             required_state_vars: An optional list of required state variables.
+            chunk_grader: An optional relevance edge used to batch-grade the chunks.
         """
         super().__init__(
             state_class= state_class,
@@ -41,24 +55,64 @@ class SendToParallelGradingEdge(BaseEdge):
             raise ValueError("'target_node_name' must be a non-empty string.")
         self._target_node_name = target_node_name
 
+        if chunk_grader is not None and not isinstance(chunk_grader, GradeRetrievedChunkEdge):
+            raise TypeError("'chunk_grader' must be a GradeRetrievedChunkEdge instance.")
+        self._chunk_grader = chunk_grader
+
 
     @property
     def target_node_name(self) -> str:
-        """Getter for the 'target_node_name' property."""
+        """Getter for the read-only 'target_node_name' property."""
         return self._target_node_name
 
-    @target_node_name.setter
-    def target_node_name(self, value: str):
-        """Setter for the 'target_node_name' property with validation."""
-        if not isinstance(value, str) or not value.strip():
-            raise ValueError("'target_node_name' must be a non-empty string.")
-        self._target_node_name = value
+
+    @property
+    def chunk_grader(self) -> Optional[GradeRetrievedChunkEdge]:
+        """Getter for the 'chunk_grader' property."""
+        return self._chunk_grader
+
+    @chunk_grader.setter
+    def chunk_grader(self, value: Optional[GradeRetrievedChunkEdge]):
+        """Setter for the 'chunk_grader' property with validation."""
+        if value is not None and not isinstance(value, GradeRetrievedChunkEdge):
+            raise TypeError("'chunk_grader' must be a GradeRetrievedChunkEdge instance.")
+        self._chunk_grader = value
 
 
-    def get_edge_function(self) -> Callable[[Dict[str, Any]], List[Send]]:
+    def get_edge_function(self) -> Runnable[Dict[str, Any], List[Send]]:
         """
         Returns the callable function for this conditional edge.
+
+        When a chunk grader is set, the returned runnable grades the batches
+        sequentially in sync runs and concurrently in async runs. The fields
+        shared by every `Send` are read once per call and copied from a
+        template dict for each chunk.
         """
+        make_send = partial(Send, self.target_node_name)
+        get_inputs = itemgetter('user_query', 'language', 'entity', 'retrieval_results')
+        grade_chunks = None
+        agrade_chunks = None
+        if self.chunk_grader is not None:
+            grade_chunks = self.chunk_grader.get_batch_grading_function()
+            agrade_chunks = self.chunk_grader.get_async_batch_grading_function()
+
+        def build_sends(
+            template: Dict[str, Any],
+            retrieval_results: List[str],
+            relevances: List[Optional[bool]],
+        ) -> List[Send]:
+            # LangGraph only fans out lists or tuples of `Send`, so a list is built.
+            # The template already holds every key, so each payload is a C-level
+            # copy plus two in-place assignments, without rehashing or resizing.
+            sends: List[Send] = []
+            append = sends.append
+            for chunk_txt, relevant in zip(retrieval_results, relevances):
+                payload = template.copy()
+                payload['chunk_txt'] = chunk_txt
+                payload['relevant'] = relevant
+                append(make_send(payload))
+            return sends
+
         def send_to_parallel_grading(state: Dict[str, Any]) -> List[Send]:
             """
             Conditional edge to reach generation parallelization.
@@ -66,22 +120,41 @@ class SendToParallelGradingEdge(BaseEdge):
             Args:
                 state: The current graph state
             """
-            logging.info("--- PARALLELIZE GENERATION 🔢 ---")
-
-            user_query = state['user_query']
-            language = state['language']
-            entity = state['entity']
-            retrieval_results = state['retrieval_results']
-
-            return [
-                Send(self.target_node_name, {
-                    'user_query': user_query,
-                    'language': language,
-                    'chunk_txt': chunk_txt,
-                    'entity': entity
-                })
-                for chunk_txt in retrieval_results
-            ]
-        
-        return send_to_parallel_grading
+            logger.debug("--- PARALLELIZE GENERATION 🔢 ---")
+
+            user_query, language, entity, retrieval_results = get_inputs(state)
+            relevances = (
+                grade_chunks(user_query, entity, retrieval_results)
+                if grade_chunks is not None
+                else [None] * len(retrieval_results)
+            )
+
+            template = {
+                'user_query': user_query, 'language': language, 'entity': entity,
+                'chunk_txt': None, 'relevant': None
+            }
+            return build_sends(template, retrieval_results, relevances)
+
+        async def asend_to_parallel_grading(state: Dict[str, Any]) -> List[Send]:
+            """
+            Async variant of `send_to_parallel_grading`.
 
+            Args:
+                state: The current graph state
+            """
+            logger.debug("--- PARALLELIZE GENERATION 🔢 ---")
+
+            user_query, language, entity, retrieval_results = get_inputs(state)
+            relevances = (
+                await agrade_chunks(user_query, entity, retrieval_results)
+                if agrade_chunks is not None
+                else [None] * len(retrieval_results)
+            )
+
+            template = {
+                'user_query': user_query, 'language': language, 'entity': entity,
+                'chunk_txt': None, 'relevant': None
+            }
+            return build_sends(template, retrieval_results, relevances)
+        
+        return RunnableLambda(send_to_parallel_grading, afunc= asend_to_parallel_grading)
@@ -0,0 +1,113 @@
+
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional
+
+import numpy as np
+from langchain.embeddings.base import Embeddings
+
+from .._logging import get_logger
+
+logger = get_logger('edges.prefilters')
+
+
+class EmbeddingRelevancePrefilter:
+    """
+    A cheap relevance pre-filter for retrieved chunks, based on embedding similarity.
+
+    Called with a user query and a chunk, it returns False when the cosine
+    similarity of their embeddings is below the threshold, so the chunk can be
+    discarded without an LLM grading call, and None otherwise, leaving the
+    decision to the grader. Query and chunk embeddings are cached by content
+    digest, so each text is embedded once.
+    """
+
+    __slots__ = ('_embeddings', '_threshold', '_maxsize', '_vectors', '_lock')
+
+    _default_threshold: float = 0.18
+    _default_maxsize: int = 4096
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        threshold: Optional[float] = None,
+        maxsize: Optional[int] = None,
+    ):
+        """
+        Initializes the pre-filter.
+
+        Args:
+            embeddings: The embedding model used for queries and chunks.
+            threshold: The cosine similarity below which a chunk is discarded.
+            maxsize: The maximum number of cached embedding vectors.
+        """
+        if not isinstance(embeddings, Embeddings):
+            raise TypeError("'embeddings' must be an instance of LangChain Embeddings.")
+        self._embeddings = embeddings
+
+        self._threshold = self._default_threshold if threshold is None else threshold
+        if not isinstance(self._threshold, (int, float)) or not -1 <= self._threshold <= 1:
+            raise ValueError("'threshold' must be a number between -1 and 1.")
+
+        self._maxsize = maxsize or self._default_maxsize
+        self._vectors: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = Lock()
+
+
+    @property
+    def threshold(self) -> float:
+        """Getter for the 'threshold' property."""
+        return self._threshold
+
+
+    def _get_vector(self, text: str, is_query: bool) -> np.ndarray:
+        """Returns the normalized embedding of a text, embedding it on a cache miss."""
+        key = hashlib.blake2b(
+            (('q\x00' if is_query else 'd\x00') + text).encode('utf-8'),
+            digest_size= 16
+        ).digest()
+
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is not None:
+                self._vectors.move_to_end(key)
+                return vector
+
+        embedding: List[float] = (
+            self._embeddings.embed_query(text)
+            if is_query else
+            self._embeddings.embed_documents([text])[0]
+        )
+        vector = np.asarray(embedding, dtype= np.float32)
+        vector /= (np.linalg.norm(vector) or 1.0)
+
+        with self._lock:
+            self._vectors[key] = vector
+            if len(self._vectors) > self._maxsize:
+                self._vectors.popitem(last= False)
+
+        return vector
+
+
+    def __call__(self, user_query: str, chunk_txt: str) -> Optional[bool]:
+        """
+        Decides whether a chunk can be discarded without calling the grader.
+
+        Args:
+            user_query: The user's query.
+            chunk_txt: The retrieved chunk.
+
+        Returns:
+            False if the chunk is clearly off-topic, None if the grader must decide.
+        """
+        try:
+            similarity = float(
+                self._get_vector(user_query, is_query= True)
+                @ self._get_vector(chunk_txt, is_query= False)
+            )
+        except Exception as e:
+            logger.warning("--- RELEVANCE PREFILTER FAILED, DEFERRING TO GRADER: %s ⚠️ ---", e)
+            return None
+
+        return False if similarity < self._threshold else None
@@ -1,25 +1,61 @@
 
+import os
 from dotenv import load_dotenv
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph, START, END
+from langgraph.types import Command
 
 from .nodes import (
     DefineUserQueryLanguageNode,
     GradeBusinessRelevanceNode,
     GenerateFinalOutputNode,
 )
-from .edges import RouteBooleanStateVariableEdge
+from .edges import get_boolean_router
 from .states import MainGraphState, MainGraphOutputState
 from .conclusions_generator import get_conclusions_generator_graph
 from .context_generator import ContextGeneratorGraph
 from .query_generator import get_query_generator_graph
 from .query_validator import get_query_validator_graph
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from ._logging import get_logger
 
+logger = get_logger('main_graph')
 
+
+# Every gated stage either continues to the next stage or exits to the final
+# output, depending on a boolean flag set by the stage: (source, flag, next stage).
+# The relevance grading node routes itself with a `Command`; the subgraph
+# stages are routed by conditional edges.
+_GATED_STAGES = (
+    ('context_generator', 'relevant_context', 'query_generator'),
+    ('query_generator', 'valid_query_generated', 'query_validator'),
+    ('query_validator', 'valid_query_execution', 'conclusions_generator'),
+)
+
+
+def _with_command_routing(
+    node_function: Callable[[Dict[str, Any]], Dict[str, Any]],
+    state_variable: str,
+    next_stage: str,
+    exit_stage: str,
+) -> Callable[[Dict[str, Any]], Command]:
+    """
+    Wraps a node so it returns its update together with the next stage, in a
+    single `Command`, instead of being followed by a conditional edge.
+    """
+    def routed_node(state: Dict[str, Any]) -> Command:
+        update = node_function(state)
+        return Command(
+            update= update,
+            goto= next_stage if update[state_variable] else exit_stage
+        )
+
+    return routed_node
+
+
+@lru_cache(maxsize= 1)
 def get_main_graph() -> CompiledStateGraph[Optional[Any]]:
 
     workflow = StateGraph(
@@ -34,7 +70,13 @@ def get_main_graph() -> CompiledStateGraph[Optional[Any]]:
     )
     workflow.add_node(
         'grade_question_relevance',
-        GradeBusinessRelevanceNode(MainGraphState).get_node_function()
+        _with_command_routing(
+            GradeBusinessRelevanceNode(MainGraphState).get_node_function(),
+            'relevant_question',
+            'context_generator',
+            'structure_final_output'
+        ),
+        destinations= ('context_generator', 'structure_final_output')
     )
     workflow.add_node(
         'context_generator',
@@ -59,58 +101,26 @@ def get_main_graph() -> CompiledStateGraph[Optional[Any]]:
 
     workflow.add_edge(START, 'detect_user_query_language')
     workflow.add_edge('detect_user_query_language', 'grade_question_relevance')
-    workflow.add_conditional_edges(
-        'grade_question_relevance',
-        RouteBooleanStateVariableEdge(
-            'relevant_question',
-            'continue',
-            'exit'
-        ).get_edge_function(),
-        {
-            'continue': 'context_generator',
-            'exit': 'structure_final_output'
-        }
-    )
-    workflow.add_conditional_edges(
-        'context_generator',
-        RouteBooleanStateVariableEdge(
-            'relevant_context',
-            'continue',
-            'exit'
-        ).get_edge_function(),
-        {
-            'continue': 'query_generator',
-            'exit': 'structure_final_output'
-        }
-    )
-    workflow.add_conditional_edges(
-        'query_generator',
-        RouteBooleanStateVariableEdge(
-            'valid_query_generated',
-            'continue',
-            'exit'
-        ).get_edge_function(),
-        {
-            'continue': 'query_validator',
-            'exit': 'structure_final_output'
-        }
-    )
-    workflow.add_conditional_edges(
-        'query_validator',
-        RouteBooleanStateVariableEdge(
-            'valid_query_execution',
-            'continue',
-            'exit'
-        ).get_edge_function(),
-        {
-            'continue': 'conclusions_generator',
-            'exit': 'structure_final_output'
-        }
-    )
+    for source, state_variable, next_stage in _GATED_STAGES:
+        workflow.add_conditional_edges(
+            source,
+            get_boolean_router(state_variable, 'continue', 'exit'),
+            {
+                'continue': next_stage,
+                'exit': 'structure_final_output'
+            }
+        )
     workflow.add_edge('conclusions_generator', 'structure_final_output')
     workflow.add_edge('structure_final_output', END)
 
     compiled_graph = workflow.compile()
-    logging.info(f"--- MAIN GRAPH COMPILED SUCCESSFULLY ✅ ---")
+    logger.info("--- MAIN GRAPH COMPILED SUCCESSFULLY ✅ ---")
+
+    return compiled_graph
+
 
-    return compiled_graph
\ No newline at end of file
+# Opt-in eager compilation: compiles the main graph and, through it, every
+# subgraph when the module is imported, so the first request pays no compile cost.
+# Off by default, since compiling connects to the vector store and the database.
+if os.getenv('PRECOMPILE_GRAPHS', 'FALSE').upper() == 'TRUE':
+    get_main_graph()
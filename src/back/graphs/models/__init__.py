@@ -3,17 +3,27 @@
 It contains all the models used in differents graphs.
 """
 
+from . import base as _base
 from .base import (
-    llm_classifiers,
-    llm_generators,
-    llm_graders,
-    llm_retrievals,
+    http_async_client,
+    http_client,
 )
 
 
+def __getattr__(name: str):
+    # The chat models are built lazily by `base` on first access.
+    if name in _base._LLM_CONFIGS:
+        return getattr(_base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    'http_async_client',
+    'http_client',
     'llm_classifiers',
+    'llm_classifiers_fast',
     'llm_generators',
     'llm_graders',
+    'llm_graders_fast',
     'llm_retrievals',
 ]
\ No newline at end of file
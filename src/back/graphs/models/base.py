@@ -1,34 +1,91 @@
 
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, List, Tuple
+import httpx
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
+from langchain_core.language_models import BaseChatModel
 
 load_dotenv()
 
-llm_graders = init_chat_model(
-    model_provider= 'azure_openai',
-    model= 'gpt-4o-mini',
-    temperature= 0,
-    max_tokens= 1000
-)
 
-llm_classifiers = init_chat_model(
-    model_provider= 'azure_openai',
-    model= 'gpt-4o-mini',
-    temperature= 0,
-    max_tokens= 1000
-)
+# A single connection pool shared by every chat model client, so concurrent
+# agents reuse warm keep-alive connections instead of opening their own.
+# HTTP/2 is only enabled when the optional `h2` package is installed.
+_HTTP_LIMITS = httpx.Limits(max_connections= 128, max_keepalive_connections= 64)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect= 5.0)
+_HTTP2 = find_spec('h2') is not None
 
-llm_retrievals = init_chat_model(
-    model_provider= 'azure_openai',
-    model= 'gpt-4o-mini',
-    temperature= 0,
-    max_tokens= 1000
+http_client = httpx.Client(
+    http2= _HTTP2,
+    limits= _HTTP_LIMITS,
+    timeout= _HTTP_TIMEOUT,
 )
 
-llm_generators = init_chat_model(
-    model_provider= 'azure_openai',
-    model= 'gpt-4.1',
-    temperature= 0,
-    max_tokens= 2000
+http_async_client = httpx.AsyncClient(
+    http2= _HTTP2,
+    limits= _HTTP_LIMITS,
+    timeout= _HTTP_TIMEOUT,
 )
 
+# Azure credentials are read from the environment once and passed explicitly,
+# so building a client skips LangChain's environment discovery.
+_AZURE_CREDENTIALS: Dict[str, str] = {
+    kwarg: os.environ[env_var]
+    for kwarg, env_var in (
+        ('api_key', 'AZURE_OPENAI_API_KEY'),
+        ('azure_endpoint', 'AZURE_OPENAI_ENDPOINT'),
+        ('api_version', 'OPENAI_API_VERSION'),
+    )
+    if env_var in os.environ
+}
+
+
+# Every chat model is built lazily on first access, and configurations that are
+# identical share a single client, e.g. graders, classifiers and retrievals all
+# run on the same `gpt-4o-mini` instance. The fast agents default to that same
+# deployment; a smaller one (e.g. `gpt-4.1-nano`) is opted into per environment.
+_FAST_MODEL = os.getenv('AZURE_OPENAI_FAST_MODEL', 'gpt-4o-mini')
+
+_LLM_CONFIGS: Dict[str, Tuple[str, str, float, int]] = {
+    'llm_graders': ('azure_openai', 'gpt-4o-mini', 0, 1000),
+    'llm_classifiers': ('azure_openai', 'gpt-4o-mini', 0, 1000),
+    'llm_retrievals': ('azure_openai', 'gpt-4o-mini', 0, 1000),
+    'llm_generators': ('azure_openai', 'gpt-4.1', 0, 2000),
+    # Smaller deployments for agents whose outputs are tiny (a boolean, a language
+    # name, a couple of identifiers), once a smaller deployment is configured.
+    'llm_graders_fast': ('azure_openai', _FAST_MODEL, 0, 250),
+    'llm_classifiers_fast': ('azure_openai', _FAST_MODEL, 0, 250),
+}
+
+
+@lru_cache(maxsize= None)
+def _get_llm(
+    model_provider: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> BaseChatModel:
+    """Builds the chat model for a configuration, once per distinct configuration."""
+    return init_chat_model(
+        model_provider= model_provider,
+        model= model,
+        temperature= temperature,
+        max_tokens= max_tokens,
+        http_client= http_client,
+        http_async_client= http_async_client,
+        **(_AZURE_CREDENTIALS if model_provider == 'azure_openai' else {}),
+    )
+
+
+def __getattr__(name: str) -> BaseChatModel:
+    config = _LLM_CONFIGS.get(name)
+    if config is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _get_llm(*config)
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LLM_CONFIGS])
@@ -1,12 +1,43 @@
 
 from abc import ABC, abstractmethod
+from itertools import repeat
+import asyncio
+from functools import cached_property
+from importlib.util import find_spec
 import json
+from operator import attrgetter
 from typing import Any, Callable, Dict, List, Literal, Optional, Type
+from langchain_core.runnables import Runnable, RunnableLambda
 
 from ..agents import BaseAgent, BaseRetrievalAgent
+from ..states import get_state_keys
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('nodes.base')
+
+
+def _are_strings(items) -> bool:
+    """Checks that every item is a string, looping in C through `map`."""
+    return all(map(isinstance, items, repeat(str)))
+
+
+# `orjson`, installed with LangSmith, pretty-prints several times faster than the
+# standard library; `json` is kept as the fallback for it and for any value
+# `orjson` cannot encode.
+if find_spec('orjson') is not None:
+    import orjson
+
+    def _dumps_indented(value: Any) -> str:
+        """Serializes a retrieval result as indented JSON, keeping non-ASCII characters."""
+        try:
+            return orjson.dumps(value, option= orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return json.dumps(value, indent=2, ensure_ascii=False)
+else:
+    def _dumps_indented(value: Any) -> str:
+        """Serializes a retrieval result as indented JSON, keeping non-ASCII characters."""
+        return json.dumps(value, indent=2, ensure_ascii=False)
 
 
 
@@ -46,7 +77,7 @@ class BaseNode(ABC):
         if self._required_state_vars is not None:
             if not isinstance(self._required_state_vars, list):
                 raise TypeError("required_state_vars must be a list.")
-            if not all(isinstance(item, str) for item in self._required_state_vars):
+            if not _are_strings(self._required_state_vars):
                 raise TypeError("All items in required_state_vars must be strings.")
         
         if not self._required_state_vars:
@@ -75,7 +106,7 @@ class BaseNode(ABC):
     def required_state_vars(self, value: List[str]):
         if not isinstance(value, list):
             raise TypeError("required_state_vars must be a list.")
-        if not all(isinstance(item, str) for item in value):
+        if not _are_strings(value):
             raise TypeError("All items in required_state_vars must be strings.")
         self._required_state_vars = value
 
@@ -89,6 +120,7 @@ class BaseNode(ABC):
         if not isinstance(value, str):
             raise TypeError("output_property must be a string.")
         self._output_property = value
+        self._reset_node_function()
 
 
     @property
@@ -99,6 +131,7 @@ class BaseNode(ABC):
     def state_class(self, value: Type[Dict]):
         self._validate_state_class(value)
         self._state_class = value
+        self._reset_node_function()
 
 
     @property
@@ -109,12 +142,31 @@ class BaseNode(ABC):
     def agent(self, value: BaseAgent):
         self._validate_agent(value)
         self._agent = value
+        self._reset_node_function()
 
 
-    @abstractmethod
+    @cached_property
+    def node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        The callable node function, built once and reused until the node's
+        agent, output or state class is replaced.
+        """
+        return self._build_node_function()
+
     def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
         """
-        Abstract method to return the callable node function.
+        Returns the callable node function, building it on the first call.
+        """
+        return self.node_function
+
+    def _reset_node_function(self) -> None:
+        """Discards the cached node function, so it is rebuilt on next access."""
+        self.__dict__.pop('node_function', None)
+
+    @abstractmethod
+    def _build_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Abstract method to build the callable node function.
 
         Each subclass must implement this method to define its specific node logic.
         """
@@ -158,9 +210,11 @@ class BaseNode(ABC):
         Raises:
             AttributeError: If the state class does not contain all required keys.
         """
-        if not all(key in state_class.__annotations__ for key in self._required_state_vars):
+        missing = frozenset(self._required_state_vars) - get_state_keys(state_class)
+        if missing:
             raise AttributeError(
-                f"The state class must have the following keys with Type hints: {self._required_state_vars}"
+                f"The state class must have the following keys with Type hints: {self._required_state_vars}. "
+                f"Missing: {sorted(missing)}"
             )
 
 
@@ -175,7 +229,7 @@ class BaseNode(ABC):
         Raises:
             AttributeError: If the agent does not contain the required output.
         """
-        if self._output_property and self._output_property not in agent.structured_output.model_json_schema()['properties']:
+        if self._output_property and self._output_property not in agent.structured_output_properties:
             raise AttributeError(f"The structured output must have a '{self._output_property}' field.")
 
 
@@ -221,15 +275,32 @@ class BaseGenerateSubQueriesNode(BaseNode):
             raise TypeError("The agent must have a `max_subqueries` attribute.")
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
+
+        The runnable calls the agent with `invoke` in sync runs and with `ainvoke`
+        in async runs, so the sub-query generation of parallel retrieval graphs
+        does not block the event loop.
 
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
 
         agent_runnable = self.agent.get_runnable()
+        invoke = agent_runnable.invoke
+        ainvoke = agent_runnable.ainvoke
+        get_sub_queries = attrgetter(self.output_property)
+        entity_name = self.entity_name
+        banner = f"--- GENERATING {entity_name.upper()} SUB-QUERIES 📚 ---"
+
+        def build_update(state: Dict[str, Any], result: Any) -> Dict[str, Any]:
+            """Builds the state update from the agent result."""
+            return {
+                'entity': state.get('entity', entity_name),
+                'sub_queries': get_sub_queries(result),
+                'retieval_iterations': state.get('retieval_iterations', 0) + 1,
+            }
 
         def generate_sub_queries_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -242,23 +313,17 @@ class BaseGenerateSubQueriesNode(BaseNode):
                 An updated state dictionary containing the generated sub-queries
                 and updated retrieval iteration count.
             """
-            logging.info(f"--- GENERATING {self.entity_name.upper()} SUB-QUERIES 📚 ---")
-            user_query = state['user_query']
-            entity = state.get('entity', self.entity_name)
-            retieval_iterations = state.get('retieval_iterations', 0)
-            
-            sub_queries = getattr(
-                agent_runnable.invoke({'user_query': user_query}),
-                self.output_property
-            )
+            logger.info(banner)
+            return build_update(state, invoke({'user_query': state['user_query']}))
 
-            return {
-                'entity': entity,
-                'sub_queries': sub_queries,
-                'retieval_iterations': retieval_iterations + 1,
-            }
+        async def agenerate_sub_queries_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Async variant of `generate_sub_queries_node`.
+            """
+            logger.info(banner)
+            return build_update(state, await ainvoke({'user_query': state['user_query']}))
 
-        return generate_sub_queries_node
+        return RunnableLambda(generate_sub_queries_node, afunc= agenerate_sub_queries_node)
 
 
 
@@ -302,7 +367,7 @@ class BaseRetrieveToolNode(BaseNode):
         Raises:
             TypeError: If the provided tool is not callable.
         """
-        if not isinstance(tool, Callable):
+        if not callable(tool):
             raise TypeError("'tool' must be a callable object.")
         self._tool = tool
 
@@ -315,33 +380,47 @@ class BaseRetrieveToolNode(BaseNode):
             output_property= self._output_property
         )
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
         
         This method is now a concrete implementation, providing the common
-        retrieval logic for all subclasses.
+        retrieval logic for all subclasses. In async runs the tool is called
+        with `ainvoke` when available, or in a worker thread otherwise.
         """
-        def retrieve_queries_node(state: Dict[str, Any]) -> Dict[str, Any]:
-            logging.info(f"--- {self.entity_name.upper()} RETRIEVE TOOL 🛠️ ---")
-            queries = state['sub_queries']
-            
-            retrieval_results = self._tool.invoke({'queries': queries})
-
-            if self._json_dumps:
-                formatted_results = [
-                    json.dumps(result, indent=2, ensure_ascii=False)
-                    for result in retrieval_results
-                ]
+        banner = f"--- {self.entity_name.upper()} RETRIEVE TOOL 🛠️ ---"
+        json_dumps = self._json_dumps
+        retrieval_result_key = self.retrieval_result_key
+        tool_invoke = self._tool.invoke
+        tool_ainvoke = getattr(self._tool, 'ainvoke', None)
+
+        def build_update(retrieval_results: List[Any]) -> Dict[str, Any]:
+            """Builds the state update from the tool results."""
+            if json_dumps:
+                formatted_results = [_dumps_indented(result) for result in retrieval_results]
             else:
                 formatted_results = retrieval_results
 
             return {
                 'retrieval_results': formatted_results,
-                self.retrieval_result_key: retrieval_results
+                retrieval_result_key: retrieval_results
             }
+
+        def retrieve_queries_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            logger.info(banner)
+            return build_update(tool_invoke({'queries': state['sub_queries']}))
+
+        async def aretrieve_queries_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            logger.info(banner)
+            inputs = {'queries': state['sub_queries']}
+            retrieval_results = (
+                await tool_ainvoke(inputs)
+                if tool_ainvoke is not None
+                else await asyncio.to_thread(tool_invoke, inputs)
+            )
+            return build_update(retrieval_results)
             
-        return retrieve_queries_node
+        return RunnableLambda(retrieve_queries_node, afunc= aretrieve_queries_node)
 
 
 
@@ -353,7 +432,7 @@ class BaseMultiOutputAgentNode(BaseNode):
     output with multiple fields. It is an **abstract class** and cannot be 
     instantiated directly. Instead, concrete node classes should inherit from it, 
     define their specific `_required_state_vars` and `_output_properties`, and 
-    implement the `get_node_function` method to handle the specific logic of the node.
+    implement the `_build_node_function` method to handle the specific logic of the node.
     
     This design ensures that any multi-output agent node adheres to the same 
     validation and property-handling contract, promoting consistency across the 
@@ -398,8 +477,12 @@ class BaseMultiOutputAgentNode(BaseNode):
         if not required_state_vars:
             required_state_vars = self._output_properties
         else:
-            if not all(prop in required_state_vars for prop in self._output_properties):
-                raise ValueError("All 'output_properties' must be included in the 'required_state_vars' list.")
+            missing = set(self._output_properties).difference(required_state_vars)
+            if missing:
+                raise ValueError(
+                    "All 'output_properties' must be included in the 'required_state_vars' list. "
+                    f"Missing: {sorted(missing)}"
+                )
             
         super().__init__(
             state_class= state_class,
@@ -423,9 +506,10 @@ class BaseMultiOutputAgentNode(BaseNode):
         """
         if not isinstance(value, list):
             raise TypeError("output_properties must be a list.")
-        if not all(isinstance(item, str) for item in value):
+        if not _are_strings(value):
             raise TypeError("All items in output_properties must be strings.")
         self._output_properties = value
+        self._reset_node_function()
 
 
     @property
@@ -436,11 +520,15 @@ class BaseMultiOutputAgentNode(BaseNode):
     def required_state_vars(self, value: List[str]):
         if not isinstance(value, list):
             raise TypeError("required_state_vars must be a list.")
-        if not all(isinstance(item, str) for item in value):
+        if not _are_strings(value):
             raise TypeError("All items in required_state_vars must be strings.")
         
         # CHANGE: Add validation that the output properties are a subset of the required state vars.
-        if self._output_properties and not all(prop in value for prop in self._output_properties):
-            raise ValueError("All output_properties must be included in the required_state_vars list.")
+        missing = set(self._output_properties or ()).difference(value)
+        if missing:
+            raise ValueError(
+                "All output_properties must be included in the required_state_vars list. "
+                f"Missing: {sorted(missing)}"
+            )
         
         self._required_state_vars = value
\ No newline at end of file
@@ -1,17 +1,22 @@
 
+from operator import attrgetter
 from typing import Any, Callable, Dict
 
 from .base import BaseNode
 from ..agents import LanguageClassifier
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('nodes.classifiers')
 
 
 
 class DefineUserQueryLanguageNode(BaseNode):
     """
     A node that defines the language of a user query.
+
+    When the state already carries a language, e.g. set by the caller or by an
+    outer graph, it is kept and the classifier is not called.
     """
 
     _agent_validation_Type = 'structured_output'
@@ -29,7 +34,7 @@ class DefineUserQueryLanguageNode(BaseNode):
         return LanguageClassifier()
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
         """
         Returns the callable function for this graph node.
 
@@ -37,7 +42,8 @@ class DefineUserQueryLanguageNode(BaseNode):
             A function that takes the state dictionary and returns an updated state.
         """
         
-        agent_runnable = self.agent.get_runnable()
+        invoke = self.agent.get_runnable().invoke
+        get_language = attrgetter(self.output_property)
 
         def define_user_query_language_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -50,17 +56,14 @@ class DefineUserQueryLanguageNode(BaseNode):
                 An updated state dictionary containing the detected language and
                 an incremented iteration count.
             """
-            logging.info("--- DEFINE USER QUERY LANGUAGE 🔣 ---")
-            
-            user_query = state['user_query']
-            
-            language = getattr(
-                agent_runnable.invoke({'user_query': user_query}),
-                self.output_property
-            )
+            if state.get('language'):
+                logger.debug("--- USER QUERY LANGUAGE ALREADY DEFINED 🔣 ---")
+                return {}
 
+            logger.info("--- DEFINE USER QUERY LANGUAGE 🔣 ---")
+            
             return {
-                'language': language,
+                'language': get_language(invoke({'user_query': state['user_query']})),
             }
 
         return define_user_query_language_node
@@ -1,8 +1,13 @@
 
 from typing import Any, Callable, Dict, List
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('nodes.constants')
+
+NO_RELEVANT_CONTENT = '[NO RELEVANT CONTENT]'
+"""Placeholder output for retrieval chunks without relevant content."""
+
 
 class SetRetrievalGradeOutputKoNode:
     """
@@ -35,9 +40,9 @@ class SetRetrievalGradeOutputKoNode:
             Returns:
                 A dictionary with the generation message.
             """
-            logging.info("--- SET RETRIEVAL GRADE OUTPUT KO ❌ ---")
+            logger.info("--- SET RETRIEVAL GRADE OUTPUT KO ❌ ---")
             return {
-                'generation': ['[NO RELEVANT CONTENT]']
+                'generation': [NO_RELEVANT_CONTENT]
             }
         
         return set_retrieval_grade_output_ko_node
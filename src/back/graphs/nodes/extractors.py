@@ -1,11 +1,14 @@
 
-from typing import Any, Callable, Dict, List, Optional, Type
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Type
+from langchain_core.runnables import Runnable, RunnableLambda
 
 from .base import BaseMultiOutputAgentNode
 from ..agents import BaseAgent, DbSchemaExtractor
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('nodes.extractors')
 
 
 
@@ -60,17 +63,27 @@ class ExtractDbSchemaNode(BaseMultiOutputAgentNode):
         return DbSchemaExtractor()
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
-        
+        Returns the runnable for this graph node.
+
         This method is now a concrete implementation, providing the specific logic
-        for extracting data using the agent.
-        
+        for extracting data using the agent. The agent is called with `invoke` in
+        sync runs and with `ainvoke` in async runs.
+
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
         agent_runnable = self.agent.get_runnable()
+        output_properties = tuple(self.output_properties)
+        get_outputs = attrgetter(*output_properties)
+
+        def build_update(agent_response: Any) -> Dict[str, Any]:
+            """Builds the state update from the agent response."""
+            values = get_outputs(agent_response)
+            if len(output_properties) == 1:
+                values = (values,)
+            return dict(zip(output_properties, values))
 
         def extract_db_schema_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -82,15 +95,14 @@ class ExtractDbSchemaNode(BaseMultiOutputAgentNode):
             Returns:
                 An updated state dictionary containing the db_name and schema_name.
             """
-            logging.info("--- EXTRACT DB SCHEMA 🧮 ---")
-            
-            data_schema = state['data_schema']
-            
-            agent_response = agent_runnable.invoke({'data_schema': data_schema})
-
-            return {
-                prop: getattr(agent_response, prop)
-                for prop in self.output_properties
-            }
-
-        return extract_db_schema_node
\ No newline at end of file
+            logger.info("--- EXTRACT DB SCHEMA 🧮 ---")
+            return build_update(agent_runnable.invoke({'data_schema': state['data_schema']}))
+
+        async def aextract_db_schema_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Async variant of `extract_db_schema_node`.
+            """
+            logger.info("--- EXTRACT DB SCHEMA 🧮 ---")
+            return build_update(await agent_runnable.ainvoke({'data_schema': state['data_schema']}))
+
+        return RunnableLambda(extract_db_schema_node, afunc= aextract_db_schema_node)
\ No newline at end of file
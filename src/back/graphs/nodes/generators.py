@@ -1,7 +1,11 @@
 
-from typing import Any, Callable, Dict, List, Optional, Type
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Type
+from langchain_core.runnables import Runnable, RunnableLambda
 
 from .base import BaseNode
+from .constants import NO_RELEVANT_CONTENT
 from ..prompts import (
     _RETRIEVAL_GRADER_DYNAMIC_PROMPT_DICT,
     _NL_OUTPUT_GENERATOR_DYNAMIC_PROMPT_DICT,
@@ -16,8 +20,9 @@ from ..agents import (
     OnFailResponseGenerator
 )
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('nodes.generators')
 
 
 
@@ -74,6 +79,7 @@ class SummarizeChunkNode(BaseNode):
         if not isinstance(value, dict):
             raise TypeError("prompt_adjustments must be a dictionary.")
         self._prompt_adjustments = value
+        self._reset_node_function()
 
 
     def get_default_agent(self) -> ChunkSummaryGenerator:
@@ -86,15 +92,56 @@ class SummarizeChunkNode(BaseNode):
         return ChunkSummaryGenerator()
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
+
+        The runnable calls the agent with `invoke` in sync runs and with `ainvoke`
+        in async runs, so the parallel chunk branches summarize concurrently.
         
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
 
         agent_runnable = self.agent.get_runnable()
+        get_output = attrgetter(self.output_property)
+
+        # (query prefix, normalized query prefix, output requirements) per entity.
+        adjustments = {
+            entity: (
+                adjustment['user_query'],
+                adjustment['user_query'].strip().upper(),
+                adjustment['output'],
+            )
+            for entity, adjustment in self.prompt_adjustments.items()
+        }
+
+        def build_inputs(state: Dict[str, Any]) -> Dict[str, Any]:
+            """Builds the agent inputs, adjusting the query to the chunk entity."""
+            user_query: str = state['user_query']
+            adjustment = adjustments.get(state.get('entity'))
+
+            full_user_query = user_query
+            output_requirements = ''
+
+            if adjustment is not None:
+                query_prefix, normalized_prefix, output_requirements = adjustment
+                if not user_query.strip().upper().startswith(normalized_prefix):
+                    full_user_query = f'{query_prefix}"{user_query}".'
+
+            return {
+                "language": state['language'],
+                "user_query": full_user_query,
+                "chunk_txt": state['chunk_txt'],
+                "output_requirements": output_requirements,
+            }
+
+        def build_update(state: Dict[str, Any], result: Any) -> Dict[str, Any]:
+            """Builds the state update from the agent result."""
+            return {
+                'chunk_summary': [get_output(result)],
+                'generate_iterations': state.get('generate_iterations', 0) + 1
+            }
 
         def summarize_chunk_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -110,42 +157,17 @@ class SummarizeChunkNode(BaseNode):
                 An updated state dictionary containing the generated content and
                 an incremented iteration count.
             """
-            logging.info("--- SUMMARIZE CHUNK 📝📚 ---")
-            user_query: str = state['user_query']
-            language = state['language']
-            entity = state.get('entity')
-            chunk_txt = state['chunk_txt']
-            generate_iterations = state.get('generate_iterations', 0)
-
-            full_user_query = user_query
-            output_requirements = ''
+            logger.info("--- SUMMARIZE CHUNK 📝📚 ---")
+            return build_update(state, agent_runnable.invoke(build_inputs(state)))
 
-            if entity and entity in self.prompt_adjustments:
-                full_user_query = (
-                    user_query
-                    if user_query.strip().upper().startswith(
-                        self.prompt_adjustments[entity]['user_query'].strip().upper()
-                    ) else
-                    f'{self.prompt_adjustments[entity]["user_query"]}"{user_query}".'
-                )
-                output_requirements = self.prompt_adjustments[entity]['output']
-
-            chunk_summary = getattr(
-                agent_runnable.invoke({
-                    "language": language,
-                    "user_query": full_user_query,
-                    "chunk_txt": chunk_txt,
-                    "output_requirements": output_requirements,
-                }),
-                self.output_property
-            )
-
-            return {
-                'chunk_summary': [chunk_summary],
-                'generate_iterations': generate_iterations + 1
-            }
+        async def asummarize_chunk_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Async variant of `summarize_chunk_node`.
+            """
+            logger.info("--- SUMMARIZE CHUNK 📝📚 ---")
+            return build_update(state, await agent_runnable.ainvoke(build_inputs(state)))
         
-        return summarize_chunk_node
+        return RunnableLambda(summarize_chunk_node, afunc= asummarize_chunk_node)
 
 
 
@@ -175,15 +197,32 @@ class SummarizeBusinessLogicNode(BaseNode):
         return BusinessLogicSummarizer()
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
+
+        The runnable supports both sync and async execution. The agent is called
+        with `invoke` in sync runs and with `ainvoke` in async runs.
 
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
 
         agent_runnable = self.agent.get_runnable()
+        get_output = attrgetter(self.output_property)
+
+        def build_inputs(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            """Builds the agent inputs, or returns None if there is no relevant content."""
+            generation = list(filter(NO_RELEVANT_CONTENT.__ne__, state['chunk_summary']))
+
+            if not generation:
+                return None
+
+            return {
+                "user_query": state['user_query'],
+                "language": state['language'],
+                "context": '\n\n---\n\n'.join(generation)
+            }
 
         def summarize_business_logic_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -195,37 +234,41 @@ class SummarizeBusinessLogicNode(BaseNode):
             Returns:
                 An updated state dictionary containing the summarized business logic.
             """
-            logging.info("--- SUMMARIZE BUSINES LOGIC 📝👨‍💼 ---")
-            
-            user_query = state['user_query']
-            language = state["language"]
-            generation = [
-                generation_result
-                for generation_result in state['chunk_summary']
-                if generation_result != '[NO RELEVANT CONTENT]'
-            ]
+            logger.info("--- SUMMARIZE BUSINES LOGIC 📝👨‍💼 ---")
 
-            if not generation:
+            inputs = build_inputs(state)
+            if inputs is None:
                 return {
                     'business_logic': 'Business logic for this request was not found. Please try a different query.'
                 }
 
-            context = '\n\n---\n\n'.join(generation)
+            return {
+                'business_logic': get_output(agent_runnable.invoke(inputs))
+            }
 
-            business_logic_summary = getattr(
-                agent_runnable.invoke({
-                    "user_query": user_query,
-                    "language": language,
-                    "context": context
-                }),
-                self.output_property
-            )
+        async def asummarize_business_logic_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Consolidates and summarizes business logic context asynchronously.
+
+            Args:
+                state: The current graph state.
+
+            Returns:
+                An updated state dictionary containing the summarized business logic.
+            """
+            logger.info("--- SUMMARIZE BUSINES LOGIC 📝👨‍💼 ---")
+
+            inputs = build_inputs(state)
+            if inputs is None:
+                return {
+                    'business_logic': 'Business logic for this request was not found. Please try a different query.'
+                }
 
             return {
-                'business_logic': business_logic_summary
+                'business_logic': get_output(await agent_runnable.ainvoke(inputs))
             }
-        
-        return summarize_business_logic_node
+
+        return RunnableLambda(summarize_business_logic_node, afunc= asummarize_business_logic_node)
 
 
 
@@ -255,16 +298,32 @@ class SummarizeMdlNode(BaseNode):
         """
         return MdlSummarizer()
 
-
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
+
+        The runnable supports both sync and async execution. The agent is called
+        with `invoke` in sync runs and with `ainvoke` in async runs.
 
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
 
         agent_runnable = self.agent.get_runnable()
+        get_output = attrgetter(self.output_property)
+
+        def build_inputs(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            """Builds the agent inputs, or returns None if there is no relevant content."""
+            generation = list(filter(NO_RELEVANT_CONTENT.__ne__, state['chunk_summary']))
+
+            if not generation:
+                return None
+
+            return {
+                "user_query": state['user_query'],
+                "language": state['language'],
+                "context": '\n\n---\n\n'.join(generation)
+            }
 
         def summarize_mdl_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -276,37 +335,41 @@ class SummarizeMdlNode(BaseNode):
             Returns:
                 An updated state dictionary containing the summarized data schema.
             """
-            logging.info("--- SUMMARIZE MDL 📝🗂️ ---")
-            
-            user_query = state['user_query']
-            language = state['language']
-            generation = [
-                generation_result
-                for generation_result in state['chunk_summary']
-                if generation_result != '[NO RELEVANT CONTENT]'
-            ]
+            logger.info("--- SUMMARIZE MDL 📝🗂️ ---")
 
-            if not generation:
+            inputs = build_inputs(state)
+            if inputs is None:
                 return {
                     'data_schema': 'Relevant tables and columns for this request were not found. Please try a different query.'
                 }
 
-            context = '\n\n---\n\n'.join(generation)
+            return {
+                'data_schema': get_output(agent_runnable.invoke(inputs))
+            }
 
-            data_schema = getattr(
-                agent_runnable.invoke({
-                    "user_query": user_query,
-                    "language": language,
-                    "context": context
-                }),
-                self.output_property
-            )
+        async def asummarize_mdl_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Consolidates and summarizes MDL data context asynchronously.
+
+            Args:
+                state: The current graph state.
+
+            Returns:
+                An updated state dictionary containing the summarized data schema.
+            """
+            logger.info("--- SUMMARIZE MDL 📝🗂️ ---")
+
+            inputs = build_inputs(state)
+            if inputs is None:
+                return {
+                    'data_schema': 'Relevant tables and columns for this request were not found. Please try a different query.'
+                }
 
             return {
-                'data_schema': data_schema
+                'data_schema': get_output(await agent_runnable.ainvoke(inputs))
             }
 
-        return summarize_mdl_node
+        return RunnableLambda(summarize_mdl_node, afunc= asummarize_mdl_node)
 
 
 
@@ -339,15 +402,28 @@ class GenerateGlobalContextNode(BaseNode):
         return GlobalContextGenerator()
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
+
+        The runnable calls the agent with `invoke` in sync runs and with `ainvoke`
+        in async runs, so the LLM call does not block the event loop.
 
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
 
         agent_runnable = self.agent.get_runnable()
+        get_output = attrgetter(self.output_property)
+
+        def build_inputs(state: Dict[str, Any]) -> Dict[str, Any]:
+            """Builds the agent inputs from the business logic and data schema summaries."""
+            return {
+                "user_query": state['user_query'],
+                "language": state['language'],
+                "business_logic": state['business_logic'],
+                "data_schema": state['data_schema']
+            }
 
         def generate_global_context_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -359,28 +435,21 @@ class GenerateGlobalContextNode(BaseNode):
             Returns:
                 An updated state dictionary containing the generated global context.
             """
-            logging.info("--- GENERATE GLOBAL CONTEXT 📝🌐 ---")
-            
-            user_query = state['user_query']
-            language = state['language']
-            business_logic = state['business_logic']
-            data_schema = state['data_schema']
-
-            context = getattr(
-                agent_runnable.invoke({
-                    "user_query": user_query,
-                    "language": language,
-                    "business_logic": business_logic,
-                    "data_schema": data_schema
-                }),
-                self.output_property
-            )
+            logger.info("--- GENERATE GLOBAL CONTEXT 📝🌐 ---")
+            return {
+                'context': get_output(agent_runnable.invoke(build_inputs(state)))
+            }
 
+        async def agenerate_global_context_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Async variant of `generate_global_context_node`.
+            """
+            logger.info("--- GENERATE GLOBAL CONTEXT 📝🌐 ---")
             return {
-                'context': context
+                'context': get_output(await agent_runnable.ainvoke(build_inputs(state)))
             }
-        
-        return generate_global_context_node
+
+        return RunnableLambda(generate_global_context_node, afunc= agenerate_global_context_node)
 
 
 
@@ -412,16 +481,39 @@ class GenerateNoContextResponseNode(BaseNode):
         return NoRelevantContextGenerator()
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
+
+        The runnable calls the agent with `invoke` in sync runs and with `ainvoke`
+        in async runs, so the LLM call does not block the event loop.
 
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
 
         agent_runnable = self.agent.get_runnable()
-        
+        get_output = attrgetter(self.output_property)
+
+        def build_inputs(state: Dict[str, Any]) -> Dict[str, Any]:
+            """Builds the agent inputs from the retrieved business logic and tables."""
+            context_retrieved_summary = '\n\n---\n\n'.join(chain(
+                ('### Business Logic Context',),
+                state['business_logic_retrieval_results'],
+                ('### Tables Context',),
+                # The first two lines of a table summary are its header
+                (
+                    table['table_summary'].partition('\n')[2].partition('\n')[2]
+                    for table in state['mdl_retrieval_results']
+                ),
+            ))
+
+            return {
+                "user_query": state['user_query'],
+                "language": state['language'],
+                "context": context_retrieved_summary,
+            }
+
         def generate_no_context_response_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
             Generates an explanation for the user with examples when no relevant context is found.
@@ -432,37 +524,25 @@ class GenerateNoContextResponseNode(BaseNode):
             Returns:
                 An updated state dictionary containing the no-context message.
             """
-            logging.info("--- GENERATE NO RELEVANT CONTEXT RESPONSE 📝⛔ ---")
-            
-            user_query = state['user_query']
-            language = state['language']
-            business_logic_retrieval_results = state['business_logic_retrieval_results']
-            mdl_retrieval_results = state['mdl_retrieval_results']
-
-            context_list = ['### Business Logic Context']
-            context_list.extend([business_logic_txt for business_logic_txt in business_logic_retrieval_results])
-            context_list.append('### Tables Context')
-            context_list.extend([
-                '\n'.join(table['table_summary'].split('\n')[2:])
-                for table in mdl_retrieval_results
-            ])
-
-            context_retrieved_summary = '\n\n---\n\n'.join(context_list)
-
-            no_relevant_context_msg = getattr(
-                agent_runnable.invoke({
-                    "user_query": user_query,
-                    "language": language,
-                    "context": context_retrieved_summary,
-                }),
-                self.output_property
-            )
+            logger.info("--- GENERATE NO RELEVANT CONTEXT RESPONSE 📝⛔ ---")
+            return {
+                'no_relevant_context_msg': get_output(
+                    agent_runnable.invoke(build_inputs(state))
+                )
+            }
 
+        async def agenerate_no_context_response_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Async variant of `generate_no_context_response_node`.
+            """
+            logger.info("--- GENERATE NO RELEVANT CONTEXT RESPONSE 📝⛔ ---")
             return {
-                'no_relevant_context_msg': no_relevant_context_msg
+                'no_relevant_context_msg': get_output(
+                    await agent_runnable.ainvoke(build_inputs(state))
+                )
             }
-        
-        return generate_no_context_response_node
+
+        return RunnableLambda(generate_no_context_response_node, afunc= agenerate_no_context_response_node)
 
 
 
@@ -475,7 +555,7 @@ class GenerateFinalOutputNode(BaseNode):
         'relevant_context', 'no_relevant_context_msg',
         'valid_query_generated', 'sql_query',
         'valid_query_execution', 'query_results',
-        'nl_output', 'sql_explanation', 'graphics_json',
+        'nl_output', 'sql_explanation', 'graphics_json', 'graphics_data',
         'global_execution_ok',
     ]
     _output_property = 'nl_output'
@@ -491,16 +571,68 @@ class GenerateFinalOutputNode(BaseNode):
         return OnFailResponseGenerator()
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Runnable[Dict[str, Any], Dict[str, Any]]:
         """
-        Returns the callable function for this graph node.
+        Returns the runnable for this graph node.
+
+        The runnable calls the agent with `invoke` in sync runs and with `ainvoke`
+        in async runs. The agent is only called when the execution failed.
 
         Returns:
-            A function that takes the state dictionary and returns an updated state.
+            A runnable that takes the state dictionary and returns an updated state.
         """
 
         agent_runnable = self.agent.get_runnable()
-        
+        get_output = attrgetter(self.output_property)
+
+        def get_fail_motive(state: Dict[str, Any]) -> Optional[str]:
+            """Returns the reason why the execution failed, or None if it did not."""
+            if not state['relevant_question']:
+                return 'no_relevant_question'
+            if not state.get('relevant_context', False):
+                return None
+            if not state.get('valid_query_generated', False):
+                return 'no_sql_query_generated'
+            if not state.get('valid_query_execution', False):
+                return 'query_execution_error'
+            return None
+
+        def build_inputs(state: Dict[str, Any], fail_motive: str) -> Dict[str, Any]:
+            """Builds the agent inputs for a failed execution."""
+            logger.error("--- ❌ FAIL DETECTED: '%s' ❌ ---", fail_motive)
+            return {
+                "language": state['language'],
+                "complementary_instructions": _NL_OUTPUT_GENERATOR_DYNAMIC_PROMPT_DICT[fail_motive],
+            }
+
+        def build_update(
+            state: Dict[str, Any],
+            fail_motive: Optional[str],
+            nl_output: Optional[str],
+        ) -> Dict[str, Any]:
+            """Builds the final state update."""
+            no_relevant_context_msg = state.get('no_relevant_context_msg')
+
+            if (
+                fail_motive is None
+                and state['relevant_question']
+                and not state.get('relevant_context', False)
+            ):
+                nl_output = no_relevant_context_msg
+
+            return {
+                'global_execution_ok': (
+                    fail_motive is None
+                    and no_relevant_context_msg is None
+                ),
+                'nl_output': nl_output,
+                'sql_query': state.get('sql_query'),
+                'query_results': state.get('query_results'),
+                'sql_explanation': state.get('sql_explanation'),
+                'graphics_json': state.get('graphics_json'),
+                'graphics_data': state.get('graphics_data'),
+            }
+
         def generate_final_output_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
             Route or generate the final natural language output for the user.
@@ -509,55 +641,33 @@ class GenerateFinalOutputNode(BaseNode):
                 state: The current graph state.
 
             Returns:
-                An updated state dictionary containing the no-context message.
+                An updated state dictionary containing the final output.
             """
-            logging.info("--- 🥁 GENERATE FINAL RESPONSE 🥁 ---")
-            
-            language = state['language']
-            relevant_question = state['relevant_question']
-            relevant_context = state.get('relevant_context', False)
-            no_relevant_context_msg = state.get('no_relevant_context_msg')
-            valid_query_generated = state.get('valid_query_generated', False)
-            sql_query = state.get('sql_query')
-            valid_query_execution = state.get('valid_query_execution', False)
-            query_results = state.get('query_results')
+            logger.info("--- 🥁 GENERATE FINAL RESPONSE 🥁 ---")
+
+            fail_motive = get_fail_motive(state)
             nl_output = state.get('nl_output')
-            sql_explanation = state.get('sql_explanation')
-            graphics_json = state.get('graphics_json')
+            if fail_motive:
+                nl_output = get_output(
+                    agent_runnable.invoke(build_inputs(state, fail_motive))
+                )
 
-            fail_motive = None
-            if not relevant_question:
-                fail_motive = 'no_relevant_question'
-            elif not relevant_context:
-                nl_output = no_relevant_context_msg
-            elif not valid_query_generated:
-                fail_motive = 'no_sql_query_generated'
-            elif not valid_query_execution:
-                fail_motive = 'query_execution_error'
+            return build_update(state, fail_motive, nl_output)
 
+        async def agenerate_final_output_node(state: Dict[str, Any]) -> Dict[str, Any]:
+            """
+            Async variant of `generate_final_output_node`.
+            """
+            logger.info("--- 🥁 GENERATE FINAL RESPONSE 🥁 ---")
+
+            fail_motive = get_fail_motive(state)
+            nl_output = state.get('nl_output')
             if fail_motive:
-                logging.error(f"--- ❌ FAIL DETECTED: '{fail_motive}' ❌ ---")
-                complementary_instructions = _NL_OUTPUT_GENERATOR_DYNAMIC_PROMPT_DICT[fail_motive]
-
-                nl_output = getattr(
-                    agent_runnable.invoke({
-                        "language": language,
-                        "complementary_instructions": complementary_instructions,
-                    }),
-                    self.output_property
+                nl_output = get_output(
+                    await agent_runnable.ainvoke(build_inputs(state, fail_motive))
                 )
 
-            return {
-                'global_execution_ok': (
-                    fail_motive is None 
-                    and no_relevant_context_msg is None
-                ),
-                'nl_output': nl_output,
-                'sql_query': sql_query,
-                'query_results': query_results,
-                'sql_explanation': sql_explanation,
-                'graphics_json': graphics_json,
-            }
-        
-        return generate_final_output_node
+            return build_update(state, fail_motive, nl_output)
+
+        return RunnableLambda(generate_final_output_node, afunc= agenerate_final_output_node)
 
@@ -1,14 +1,17 @@
 
+from operator import attrgetter
 from typing import Any, Callable, Dict
 
 from .base import BaseNode
 from ..agents import (
     BusinessRelevanceGrader,
-    GlobalRetrievalGrader
+    GlobalRetrievalGrader,
+    get_grader,
 )
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from .._logging import get_logger
+
+logger = get_logger('nodes.graders')
 
 
 
@@ -35,10 +38,10 @@ class GradeBusinessRelevanceNode(BaseNode):
         Returns:
             A new instance of BusinessRelevanceGrader.
         """
-        return BusinessRelevanceGrader()
+        return get_grader('business_relevance')
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
         """
         Returns the callable function for this graph node.
 
@@ -47,6 +50,7 @@ class GradeBusinessRelevanceNode(BaseNode):
         """
 
         agent_runnable = self.agent.get_runnable()
+        get_output = attrgetter(self.output_property)
 
         def grade_business_relevance_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -58,15 +62,14 @@ class GradeBusinessRelevanceNode(BaseNode):
             Returns:
                 An updated state dictionary containing the relevance grading result.
             """
-            logging.info("--- GRADE BUSINESS RELEVANCE 🏢 ---")
+            logger.info("--- GRADE BUSINESS RELEVANCE 🏢 ---")
             
             user_query = state['user_query']
 
-            relevant_question = getattr(
+            relevant_question = get_output(
                 agent_runnable.invoke({
                     'user_query': user_query,
-                }),
-                self.output_property
+                })
             )
 
             return {
@@ -98,15 +101,15 @@ class GradeContextSummariesNode(BaseNode):
 
     def get_default_agent(self) -> GlobalRetrievalGrader:
         """
-        Provides a new default retrieval grader agent for this node.
+        Provides a new default global retrieval grader agent for this node.
         
         Returns:
-            A new instance of RetrievalGrader.
+            A new instance of GlobalRetrievalGrader.
         """
-        return GlobalRetrievalGrader()
+        return get_grader('global_retrieval')
 
 
-    def get_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    def _build_node_function(self) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
         """
         Returns the callable function for this graph node.
 
@@ -115,6 +118,7 @@ class GradeContextSummariesNode(BaseNode):
         """
 
         agent_runnable = self.agent.get_runnable()
+        get_output = attrgetter(self.output_property)
 
         def grade_context_summaries_node(state: Dict[str, Any]) -> Dict[str, Any]:
             """
@@ -126,19 +130,18 @@ class GradeContextSummariesNode(BaseNode):
             Returns:
                 An updated state dictionary containing the consolidated context summary and the grading result.
             """
-            logging.info("--- GRADE CONTEXT SUMMARIES 🔍 ---")
+            logger.info("--- GRADE CONTEXT SUMMARIES 🔍 ---")
             
             user_query = state['user_query']
             business_logic = state['business_logic']
             data_schema = state['data_schema']
 
-            relevant_context = getattr(
+            relevant_context = get_output(
                 agent_runnable.invoke({
                     'user_query': user_query,
                     'business_logic': business_logic,
                     'data_schema': data_schema,
-                }),
-                self.output_property
+                })
             )
 
             return {
@@ -20,7 +20,9 @@ from .generators import (
 )
 from .graders import (
     AnswerGraderPrompt,
+    BatchRetrievalGraderPrompt,
     BusinessRelevanceGraderPrompt,
+    CompositeGraderPrompt,
     GlobalRetrievalGraderPrompt,
     HallucinationGraderPrompt,
     RetrievalGraderPrompt,
@@ -36,10 +38,12 @@ __all__ = [
     '_NL_OUTPUT_GENERATOR_DYNAMIC_PROMPT_DICT',
     'AnswerGraderPrompt',
     'BasePrompt',
+    'BatchRetrievalGraderPrompt',
     'BusinessLogicRetrieverPrompt',
     'BusinessLogicSummarizerPrompt',
     'BusinessRelevanceGraderPrompt',
     'ChunkSummaryGeneratorPrompt',
+    'CompositeGraderPrompt',
     'DbSchemaExtractorPrompt',
     'GlobalContextGeneratorPrompt',
     'GlobalRetrievalGraderPrompt',
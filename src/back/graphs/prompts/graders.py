@@ -7,10 +7,14 @@ from .templates import (
     _business_relevance_grader_system_prompt,
     _retrieval_grader_system_prompt,
     _retrieval_grader_human_message,
+    _batch_retrieval_grader_system_prompt,
+    _batch_retrieval_grader_human_message,
     _hallucination_grader_system_prompt,
     _hallucination_grader_human_message,
     _answer_grader_system_prompt,
     _answer_grader_human_message,
+    _composite_grader_system_prompt,
+    _composite_grader_human_message,
     _global_retrieval_grader_system_prompt,
 )
 
@@ -74,6 +78,36 @@ class RetrievalGraderPrompt(BasePrompt):
 
 
 
+class BatchRetrievalGraderPrompt(BasePrompt):
+    """
+    A specific implementation of a prompt for a batched retrieval grader.
+
+    This class encapsulates the system and human messages required to grade
+    the relevance of several labeled documents against an user's query in
+    a single call, sharing the system prompt across all of them.
+    """
+
+    def __init__(
+        self,
+        system_prompt: Optional[str] = None,
+        human_message: Optional[str] = None,
+    ):
+        """
+        Initializes the BatchRetrievalGraderPrompt with default or custom messages.
+
+        Args:
+            system_prompt: The system message for the grader.
+                    Defaults to a predefined message if not provided.
+            human_message: The human message template for the grader.
+                    Defaults to a predefined message if not provided.
+        """
+        super().__init__(
+            system_prompt= system_prompt or _batch_retrieval_grader_system_prompt,
+            human_message= human_message or _batch_retrieval_grader_human_message
+        )
+
+
+
 class HallucinationGraderPrompt(BasePrompt):
     """
     A specific implementation of a prompt for a hallucination grader.
@@ -132,6 +166,36 @@ class AnswerGraderPrompt(BasePrompt):
 
 
 
+class CompositeGraderPrompt(BasePrompt):
+    """
+    A specific implementation of a prompt for a composite generation grader.
+
+    This class provides default system and human messages to grade, in a
+    single call, whether a generated answer is grounded in its source
+    documents and whether it addresses the user's query.
+    """
+
+    def __init__(
+        self,
+        system_prompt: Optional[str] = None,
+        human_message: Optional[str] = None,
+    ):
+        """
+        Initializes the CompositeGraderPrompt with default or custom messages.
+
+        Args:
+            system_prompt: The system message for the grader.
+                    Defaults to a predefined message if not provided.
+            human_message: The human message template for the grader.
+                    Defaults to a predefined message if not provided.
+        """
+        super().__init__(
+            system_prompt= system_prompt or _composite_grader_system_prompt,
+            human_message= human_message or _composite_grader_human_message
+        )
+
+
+
 class GlobalRetrievalGraderPrompt(BasePrompt):
     """
     A specific implementation of a prompt for a business context grader.
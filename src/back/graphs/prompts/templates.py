@@ -66,6 +66,25 @@ Provide a binary result 'true' or 'false' to indicate whether the document is re
 _retrieval_grader_human_message = "Retrieved document:\n{chunk_txt}\n\nUser query:\n{user_query}"
 
 
+########## BatchRetrievalGrader ##########
+
+_batch_retrieval_grader_system_prompt = """
+You are a grader assessing the relevance of several retrieved documents to a user's business question.
+
+Each document is labeled with a numeric identifier, like `[chunk 0]`. Compare the user's query against \
+the business context of every document, which includes business rules and data schemas. The test for \
+relevance is not stringent; its main purpose is to discard erroneous retrievals.
+
+If at least one topic, keyword, or semantic concept from the user's question is found within the \
+business context of a document, that document should be considered relevant.
+
+Grade every document independently and return exactly one result per identifier, \
+with a binary 'true' or 'false' to indicate whether that document is relevant.
+"""
+
+_batch_retrieval_grader_human_message = "Retrieved documents:\n{chunks}\n\nUser query:\n{user_query}"
+
+
 ########## HallucinationGrader ##########
 
 _hallucination_grader_system_prompt = """
@@ -104,6 +123,27 @@ Return strictly a binary result:
 _answer_grader_human_message = "User query:\n{user_query}\n\nLLM generation:\n{chunk_summary}"
 
 
+########## CompositeGrader ##########
+
+_composite_grader_system_prompt = """
+You are a grader assessing an LLM generation that summarizes a retrieved context for a user's business question. \
+Give two independent binary results, 'true' or 'false':
+
+1. grounded: whether the generation is grounded in / supported by the set of facts.
+ENSSURE THAT GENERATION MUST ONLY USE INFORMATION DIRECTLY FROM THE PROVIDED CONTEXT. \
+Pay special attention to the names of fields and tables; the generation must use the exact names as they appear in the context. \
+Any deviation, fabrication, or hallucination of field or table names will result in a 'false' score.
+
+2. addresses: whether the generation contains information relevant to the user's question.
+Your goal is not to check whether the generation fully solves the question, but whether it provides any \
+partial contribution, hint, or useful detail related to the query: concepts, entities or data sources, \
+a query, formula, rule or business logic, or the correct timeframe, metric or domain. \
+It is 'false' only if the generation is completely unrelated to the query.
+"""
+
+_composite_grader_human_message = "Set of facts:\n{chunk_txt}\n\nUser query:\n{user_query}\n\nLLM generation:\n{chunk_summary}"
+
+
 ########## GlobalRetrievalGrader ##########
 
 _global_retrieval_grader_system_prompt = """
@@ -7,9 +7,12 @@ structured inputs and outputs system.
 from .inputs import create_retriever_input_class
 from .outputs import (
     AnswerGraderResult,
+    BatchRetrievalGraderResult,
     BusinessLogicSummarizerResult,
     BusinessRelevanceGraderResult,
+    ChunkRelevanceResult,
     ChunkSummaryGeneratorResult,
+    CompositeGraderResult,
     DbSchemaExtractionResult,
     GlobalContextGeneratorResult,
     GlobalRetrievalGraderResult,
@@ -26,9 +29,12 @@ from .outputs import (
 
 __all__ = [
     'AnswerGraderResult',
+    'BatchRetrievalGraderResult',
     'BusinessLogicSummarizerResult',
     'BusinessRelevanceGraderResult',
+    'ChunkRelevanceResult',
     'ChunkSummaryGeneratorResult',
+    'CompositeGraderResult',
     'DbSchemaExtractionResult',
     'create_retriever_input_class',
     'GlobalContextGeneratorResult',
@@ -29,6 +29,21 @@ class RetrievalGraderResult(BaseModel):
         description= "The document is relevant to the question, `true` or `false`"
     )
 
+class ChunkRelevanceResult(BaseModel):
+    """Relevance grade of a single labeled chunk inside a batched grading call."""
+    id: int = Field(
+        description= "The identifier of the graded chunk, as labeled in the input."
+    )
+    relevant: bool = Field(
+        description= "The chunk is relevant to the question, `true` or `false`"
+    )
+
+class BatchRetrievalGraderResult(BaseModel):
+    """Relevance grades for a batch of labeled chunks, one per chunk."""
+    grades: List[ChunkRelevanceResult] = Field(
+        description= "One relevance grade per labeled chunk in the input."
+    )
+
 class HallucinationGraderResult(BaseModel):
     """Boolean score for hallucination present in generation answer."""
     grounded: bool = Field(
@@ -41,6 +56,15 @@ class AnswerGraderResult(BaseModel):
         description= "Answer addresses the question, `true` or `false`"
     )
 
+class CompositeGraderResult(BaseModel):
+    """Boolean scores for hallucination and question addressing of a generation answer."""
+    grounded: bool = Field(
+        description= "Answer is grounded in the facts, `true` or `false`"
+    )
+    addresses: bool = Field(
+        description= "Answer addresses the question, `true` or `false`"
+    )
+
 class GlobalRetrievalGraderResult(BaseModel):
     """Boolean score for relevance check on business context to user query."""
     relevant_context: bool = Field(
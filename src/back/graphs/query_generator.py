@@ -3,6 +3,7 @@
 import os
 import re
 from dotenv import load_dotenv 
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -15,8 +16,9 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.state import CompiledStateGraph
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from ._logging import get_logger
+
+logger = get_logger('query_generator')
 
 
 #################### IMPORTS de GASTON -> query_examples_retireval ####################
@@ -25,9 +27,11 @@ from ..embeddings import GenAIExtendedEmbeddingFunction
 from ..chroma_collections import (
     ExamplesChromaCollection
 )
+from .models import http_async_client, http_client
 from .states import QueryGeneratorState, QueryGeneratorOutputState
 
 
+@lru_cache(maxsize= 16)
 def get_query_generator_graph(model: str = 'gpt-4.1') -> CompiledStateGraph[Optional[Any]]:
 
     #################### SETTINGS ####################
@@ -112,7 +116,7 @@ def get_query_generator_graph(model: str = 'gpt-4.1') -> CompiledStateGraph[Opti
         Args:
             state (dict): The current graph state
         """
-        logging.info("---QUERY EXAMPLES RETRIEVE TOOL---")
+        logger.info("---QUERY EXAMPLES RETRIEVE TOOL---")
 
         query = state['user_query'] 
         lang_raw = state.get("language")
@@ -213,6 +217,8 @@ def get_query_generator_graph(model: str = 'gpt-4.1') -> CompiledStateGraph[Opti
         model_provider= 'azure_openai',
         model= model,
         temperature= 0,
+        http_client= http_client,
+        http_async_client= http_async_client,
     )
 
     #PROMPT LLM
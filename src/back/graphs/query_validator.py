@@ -2,6 +2,7 @@
 #################### LIBRERIAS ####################
 
 from dotenv import load_dotenv 
+from functools import lru_cache
 from typing import Optional, Any
 from sqlalchemy import create_engine, text
 from langchain_community.utilities import SQLDatabase
@@ -12,14 +13,17 @@ from langgraph.graph import StateGraph, START, END
 
 
 from config import get_pg_config
+from .models import http_async_client, http_client
 from .states import QueryValidatorState, QueryValidatorOutputState
 from .pydantic_models import TablesExtractionResult, QueryCoherenceGraderResult
 
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from ._logging import get_logger
 
+logger = get_logger('query_validator')
 
+
+@lru_cache(maxsize= 16)
 def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Optional[Any]]:
 
     # Nos aseguramos de cargar las variables de entorno
@@ -30,14 +34,18 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
         model_provider= 'azure_openai',
         model= 'gpt-4o-mini',
         temperature= 0,
-        max_tokens= 1000
+        max_tokens= 1000,
+        http_client= http_client,
+        http_async_client= http_async_client,
     )
 
     llm_query_corrector = init_chat_model(
         model_provider= 'azure_openai',
         model= 'gpt-4.1',
         temperature= 0,
-        max_tokens=2048
+        max_tokens=2048,
+        http_client= http_client,
+        http_async_client= http_async_client,
     )
 
 
@@ -154,7 +162,7 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
     # Definimos nodos
 
     def check_db_connection_node(state: QueryValidatorState):
-        logging.info("--- INICIANDO COMPROBACIÓN DE CONEXIÓN A BBDD ⚙️ ---")
+        logger.info("--- INICIANDO COMPROBACIÓN DE CONEXIÓN A BBDD ⚙️ ---")
 
         db_name = state['db_name']
         schema_name = state['schema_name']
@@ -167,12 +175,12 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
                 'engine': create_engine(db_uri)
             }
 
-            logging.info("✅ Conexión a la base de datos establecida correctamente.")
+            logger.info("✅ Conexión a la base de datos establecida correctamente.")
 
             return {'db': db}
 
         except Exception as e:
-            logging.error(f"❌ Error al conectar a la base de datos: {e}")
+            logger.error("❌ Error al conectar a la base de datos: %s", e)
             return {
                 'valid_query_execution': False,
                 'db': None
@@ -180,7 +188,7 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
 
 
     def table_name_extraction_node(state: QueryValidatorState):
-        logging.info("--- INICIANDO FASE DE EXTRACCIÓN DE TABLAS CON LLM 🧮 ---")
+        logger.info("--- INICIANDO FASE DE EXTRACCIÓN DE TABLAS CON LLM 🧮 ---")
         sql_query = state['sql_query']
 
         table_names = tables_extractor.invoke({'sql_query': sql_query}).table_names
@@ -197,13 +205,13 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
         retries = state.get('retries', 0) + 1
         
         if retries > max_retries:
-            logging.error(f"❌🔚 Límite de {max_retries} reintentos alcanzado. Finalizando.")
+            logger.error("❌🔚 Límite de %d reintentos alcanzado. Finalizando.", max_retries)
             return {
                 'valid_query_execution': False,
                 "query_validation_error_type": "limit_reached"
             }
 
-        logging.info("--- INICIANDO FASE DE JUEZ DE COHERENCIA 👩‍⚖️ ---")
+        logger.info("--- INICIANDO FASE DE JUEZ DE COHERENCIA 👩‍⚖️ ---")
 
         coherent = coherence_grader.invoke({
             'user_query': user_query,
@@ -211,16 +219,16 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
             'sql_query': sql_query,
         }).coherent
 
-        logging.info(f"--- Veredicto del juez: {'COHERENTE ✅' if coherent else 'INCOHERENTE ❌'} ---")
+        logger.info("--- Veredicto del juez: %s ---", 'COHERENTE ✅' if coherent else 'INCOHERENTE ❌')
         
         if not coherent:
-            logging.warning("❌ La query es incoherente. No se ejecutará en la BBDD.")
+            logger.warning("❌ La query es incoherente. No se ejecutará en la BBDD.")
             return {
                 "query_validation_error_type": "error_coherence", 
                 "retries": retries
             }
         
-        logging.info("--- PASANDO A FASE DE EJECUCIÓN EN POSTGRESQL 🐘 ---")
+        logger.info("--- PASANDO A FASE DE EJECUCIÓN EN POSTGRESQL 🐘 ---")
 
         try:
             # Usamos la lista de tablas que nos ha dado el extractor
@@ -231,7 +239,7 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
                 query_results = [row for row in result.mappings()]
 
             
-            logging.info(f"--- ✅ Query ejecutada correctamente. ---")
+            logger.info("--- ✅ Query ejecutada correctamente. ---")
             return {
                 "tables_info": tables_info,
                 "query_results": query_results,
@@ -239,7 +247,7 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
             }
 
         except Exception as e:
-            logging.error(f"❌ Error de PostgreSQL detectado: {e}")
+            logger.error("❌ Error de PostgreSQL detectado: %s", e)
             return {
                 "query_validation_error_type": "error_db",
                 "query_validation_error_msg": e,
@@ -258,10 +266,10 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
         prompt_content = DYNAMIC_PROMPT_CONTENT.get(error_type, 'N/A')
 
         if prompt_content == 'N/A':
-            logging.error("--- ❌ Error no reconocido. Saliendo del corrector. ---")
+            logger.error("--- ❌ Error no reconocido. Saliendo del corrector. ---")
             return {"sql_query": original_sql_query}
         
-        logging.info("--- INICIANDO FASE DE CORRECIÓN 📝 ---")
+        logger.info("--- INICIANDO FASE DE CORRECIÓN 📝 ---")
         corrected_query = query_corrector.invoke({
             'prompt_content': prompt_content.format(
                 user_query= user_query,
@@ -272,7 +280,7 @@ def get_query_validator_graph(max_retries: int = 5) -> CompiledStateGraph[Option
             )
         }).content
             
-        logging.info(f"✅  > Query corregida recibida: {corrected_query[:70]}...")
+        logger.info("✅  > Query corregida recibida: %.70s...", corrected_query)
         
         return {"sql_query": corrected_query}
     
@@ -45,8 +45,9 @@ __VALID_CHROMA_COLLECTIONS = (
 
 embedding_function = GenAIExtendedEmbeddingFunction('gemini-embedding-001')
 
-import logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+from ._logging import get_logger
+
+logger = get_logger('rag')
 
 
 class BaseRetrievalGraph(BaseGraph, ABC):
@@ -173,7 +174,8 @@ class BaseRetrievalGraph(BaseGraph, ABC):
             parallel_chunk_processing_edge
             or SendToParallelGradingEdge(
                 state_class= self.state_schema,
-                target_node_name= self._grade_retrieval_state_name
+                target_node_name= self._grade_retrieval_state_name,
+                chunk_grader= self._process_chunks_node.grade_chunk_relevance_edge
             )
         )
 
@@ -286,7 +288,7 @@ class BaseRetrievalGraph(BaseGraph, ABC):
         """
         Builds and compiles the LangGraph workflow.
         """
-        logging.info(f"--- BUILDING {self.__class__.__name__.upper()} GRAPH 🏗️ ---")
+        logger.info("--- BUILDING %s GRAPH 🏗️ ---", self.__class__.__name__.upper())
 
         workflow = StateGraph(
             state_schema= self.state_schema,
@@ -323,7 +325,7 @@ class BaseRetrievalGraph(BaseGraph, ABC):
         workflow.add_edge(self._SUMMARIZE_STATE, END)
         
         compiled_graph = workflow.compile()
-        logging.info(f"--- {self.__class__.__name__.upper()} COMPILED SUCCESSFULLY ✅ ---")
+        logger.info("--- %s COMPILED SUCCESSFULLY ✅ ---", self.__class__.__name__.upper())
 
         return compiled_graph
 
@@ -14,6 +14,7 @@ from .input import (
     QueryGeneratorState,
     QueryValidatorState,
 )
+from .keys import get_state_keys
 from .output import (
     BusinessLogicOutputState,
     ConclusionsGeneratorOutputState,
@@ -43,4 +44,5 @@ __all__ = [
     'QueryGeneratorState',
     'QueryValidatorOutputState',
     'QueryValidatorState',
+    'get_state_keys',
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 
 import operator
+from dataclasses import dataclass, field
 from typing import Annotated, Any, Dict, List, Optional, TypedDict
 
 from .auxs import DbStateVar
@@ -10,6 +11,7 @@ class ChunkProcessingState(TypedDict):
     language: str
     entity: str
     chunk_txt: str
+    relevant: Optional[bool]
     generate_iterations: int
     chunk_summary: List[str]
 
@@ -83,16 +85,19 @@ class QueryValidatorState(TypedDict):
     valid_query_execution: bool
 
 
-class ConclusionsGeneratorState(TypedDict):
-    user_query: str
-    n_phrases: int
-    sql_query: str
-    language: str
-    query_results: str
-    graphs_retries: int
-    nl_output: str
-    sql_explanation: str
-    graphics_json: str
+@dataclass(slots= True)
+class ConclusionsGeneratorState:
+    user_query: str = ''
+    n_phrases: Optional[int] = None
+    sql_query: str = ''
+    language: str = ''
+    query_results: List[Dict[str, Any]] = field(default_factory= list)
+    query_results_md: str = ''
+    graphs_retries: int = 0
+    nl_output: Optional[str] = None
+    sql_explanation: Optional[str] = None
+    graphics_json: Optional[str] = None
+    graphics_data: Optional[Dict[str, Any]] = None
 
 
 class MainGraphState(TypedDict):
@@ -114,4 +119,5 @@ class MainGraphState(TypedDict):
     nl_output: str
     sql_explanation: str
     graphics_json: Optional[str]
+    graphics_data: Optional[Dict[str, Any]]
     global_execution_ok: bool
\ No newline at end of file
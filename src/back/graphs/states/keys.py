@@ -0,0 +1,31 @@
+
+from typing import Dict, FrozenSet, Type
+from weakref import WeakKeyDictionary
+
+
+_STATE_KEYS: 'WeakKeyDictionary[type, FrozenSet[str]]' = WeakKeyDictionary()
+"""Keys of every state class inspected so far, computed once per class."""
+
+
+def get_state_keys(state_class: Type[Dict]) -> FrozenSet[str]:
+    """
+    Returns the keys declared by a state class, caching them per class.
+
+    TypedDicts expose their keys, inherited ones included, through
+    `__required_keys__` and `__optional_keys__`; other classes fall back
+    to their annotations.
+
+    Args:
+        state_class: The state class to inspect.
+
+    Returns:
+        The set of keys declared by the state class.
+    """
+    keys = _STATE_KEYS.get(state_class)
+    if keys is None:
+        if hasattr(state_class, '__required_keys__'):
+            keys = frozenset(state_class.__required_keys__ | state_class.__optional_keys__)
+        else:
+            keys = frozenset(state_class.__annotations__)
+        _STATE_KEYS[state_class] = keys
+    return keys
@@ -41,6 +41,7 @@ class ConclusionsGeneratorOutputState(TypedDict):
     nl_output: str
     sql_explanation: str
     graphics_json: str
+    graphics_data: Optional[Dict[str, Any]]
 
 
 class MainGraphOutputState(TypedDict):
@@ -51,4 +52,5 @@ class MainGraphOutputState(TypedDict):
     sql_query: Optional[str]
     query_results: Optional[List[Dict[str, Any]]]
     sql_explanation: Optional[str]
-    graphics_json: Optional[str]
\ No newline at end of file
+    graphics_json: Optional[str]
+    graphics_data: Optional[Dict[str, Any]]
\ No newline at end of file
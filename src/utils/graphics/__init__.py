@@ -3,9 +3,17 @@
 It contains functions to create graphical content.
 """
 
-from .plotly_graphs import create_dashboard_from_json
+from .plotly_graphs import (
+    create_dashboard_from_json,
+    render_dashboard_from_json,
+    validate_dashboard_json,
+)
+from .stream_validation import DashboardJsonStreamValidator
 
 
 __all__ = [
     'create_dashboard_from_json',
+    'DashboardJsonStreamValidator',
+    'render_dashboard_from_json',
+    'validate_dashboard_json',
 ]
\ No newline at end of file
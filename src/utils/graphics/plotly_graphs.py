@@ -1,8 +1,79 @@
 
-import json
 import logging
+from typing import Any, Dict, List, Union
+from typing_extensions import NotRequired, TypedDict
+
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from pydantic import TypeAdapter, ValidationError
+
+
+_DOMAIN_CHART_TYPES = ('pie', 'funnelarea', 'sunburst', 'treemap')
+
+
+class _ChartSpec(TypedDict):
+    data: Union[List[Dict[str, Any]], Dict[str, Any]]
+    layout: Dict[str, Any]
+
+
+class _Dashboard(TypedDict):
+    dashboard_title: NotRequired[str]
+    charts: List[_ChartSpec]
+
+
+# Decodifica y valida el esquema del dashboard en una única pasada (pydantic-core)
+_DASHBOARD_ADAPTER = TypeAdapter(_Dashboard)
+
+
+def validate_dashboard_json(json_str: str) -> None | Dict[str, Any]:
+    """
+    Decodifica y valida la estructura del JSON de un dashboard sin renderizarlo.
+
+    La decodificación y la validación del esquema se hacen en una única pasada
+    sobre la cadena. Se comprueba únicamente lo necesario para poder construir
+    el dashboard: una lista 'charts' no vacía en la que cada gráfico tiene un
+    'layout' y al menos una traza con 'type'.
+
+    Args:
+        json_str: Una cadena JSON con el título del dashboard y la lista de
+                diccionarios de Plotly, opcionalmente envuelta en un bloque markdown.
+
+    Returns:
+        El diccionario decodificado si la estructura es válida, o None en otro caso.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
+    if not json_str:
+        logging.info("No hay datos de gráficos para procesar. Saliendo.")
+        return None
+
+    _json_str = json_str.strip()
+    if _json_str.lower().startswith('```json'):
+        _json_str = _json_str[len('```json'):]
+
+    if _json_str.endswith('```'):
+        _json_str = _json_str[:-len('```')]
+
+    try:
+        data = _DASHBOARD_ADAPTER.validate_json(_json_str)
+    except ValidationError as e:
+        logging.error(f"Error al decodificar el JSON: {e}")
+        return None
+
+    if not data['charts']:
+        logging.info("No hay datos de gráficos para procesar. Saliendo.")
+        return None
+
+    for graph in data['charts']:
+        graph_data = graph['data']
+        if isinstance(graph_data, dict):
+            graph_data = [graph_data]
+
+        if not graph_data or 'type' not in graph_data[0]:
+            logging.error("Gráfico sin trazas válidas en el JSON del dashboard.")
+            return None
+
+    return data
 
 
 def create_dashboard_from_json(
@@ -19,30 +90,28 @@ def create_dashboard_from_json(
         height: Alto total del conjunto de gráficos.
         width: Ancho total del conjunto de gráficos.
     """
-    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
-
-    if not json_str:
-        logging.info("No hay datos de gráficos para procesar. Saliendo.")
+    data = validate_dashboard_json(json_str)
+    if data is None:
         return None
 
-    _json_str = json_str
-    if json_str.strip().lower().startswith('```json'):
-        _json_str= json_str.strip()[len('```json'):]
+    return render_dashboard_from_json(data, height, width)
 
-    if json_str.strip().endswith('```'):
-        _json_str= json_str.strip()[:-len('```')]
 
-    try:
-        data = json.loads(_json_str)
-        main_title = data.get('dashboard_title', 'Dashboard de Análisis')
-        json_graphs = data.get('charts', [])
-    except json.JSONDecodeError as e:
-        logging.error(f"Error al decodificar el JSON: {e}")
-        return None
+def render_dashboard_from_json(
+        data: Dict[str, Any],
+        height: int = 900,
+        width: int = 1600,
+    ) -> go.Figure:
+    """
+    Crea un dashboard interactivo de Plotly a partir de un JSON ya validado.
 
-    if not json_graphs:
-        logging.info("No hay datos de gráficos para procesar. Saliendo.")
-        return None
+    Args:
+        data: El diccionario devuelto por `validate_dashboard_json`.
+        height: Alto total del conjunto de gráficos.
+        width: Ancho total del conjunto de gráficos.
+    """
+    main_title = data.get('dashboard_title', 'Dashboard de Análisis')
+    json_graphs = data['charts']
 
     subplot_titles = []
     specs = []
@@ -60,7 +129,7 @@ def create_dashboard_from_json(
         if isinstance(graph_data, dict):
             graph_data = [graph_data]
             
-        is_domain_chart = graph_data[0]['type'] in ['pie', 'funnelarea', 'sunburst', 'treemap']
+        is_domain_chart = graph_data[0]['type'] in _DOMAIN_CHART_TYPES
         row_specs.append({"type": "domain"} if is_domain_chart else {"type": "xy"})
         
         if len(row_specs) == 2:
@@ -0,0 +1,191 @@
+from typing import List, Optional
+
+
+# Caracteres con los que puede empezar un valor JSON
+_VALUE_START = '"-0123456789tfn{['
+
+# Caracteres admitidos tras un valor completo dentro de un objeto o lista
+_AFTER_VALUE = ',}]'
+
+# Operadores aritméticos que el modelo escribe a veces tras un número (p. ej. `20+5`)
+_ARITHMETIC_OPERATORS = '+-*/'
+
+
+class DashboardJsonStreamValidator:
+    """
+    Valida de forma incremental el JSON de un dashboard mientras se genera.
+
+    Recorre los fragmentos según llegan con una pequeña máquina de estados
+    (cadenas, escapes, números y literales, y anidamiento de llaves/corchetes),
+    sin esperar al JSON completo, y detecta en cuanto aparecen las violaciones
+    que harían descartar la generación: un gráfico de tipo no permitido, más
+    gráficos de los esperados en la lista 'charts' o un token inesperado, como
+    una expresión aritmética o una coma antes del cierre de un objeto o lista.
+    """
+
+    def __init__(
+            self,
+            max_charts: int = 4,
+            forbidden_types: frozenset = frozenset({'heatmap'}),
+        ):
+        """
+        Args:
+            max_charts: Número máximo de gráficos admitidos en 'charts'.
+            forbidden_types: Tipos de traza de Plotly que invalidan el dashboard.
+        """
+        self.max_charts = max_charts
+        self.forbidden_types = forbidden_types
+
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_chars: List[str] = []
+        self._in_bare_value = False
+        self._last_bare_char = ''
+        self._expected: Optional[str] = None
+        self._after_comma = False
+        self._expect_key = False
+        self._last_key: Optional[str] = None
+        self._charts_depth: Optional[int] = None
+        self._n_charts = 0
+        self.violation: Optional[str] = None
+
+
+    def feed(self, text: str) -> Optional[str]:
+        """
+        Procesa un nuevo fragmento del JSON.
+
+        Args:
+            text: Fragmento recibido del modelo.
+
+        Returns:
+            La descripción de la primera violación detectada, o None si el
+            JSON parcial sigue siendo válido.
+        """
+        if self.violation is not None:
+            return self.violation
+
+        for char in text:
+            if self._in_string:
+                self._feed_string_char(char)
+                continue
+
+            if self._in_bare_value and self._feed_bare_char(char):
+                continue
+
+            if char.isspace():
+                continue
+
+            self._check_token(char)
+            if self.violation is not None:
+                break
+
+            if char == '"':
+                self._in_string = True
+                self._string_chars = []
+            elif char in '{[':
+                self._open_container(char)
+            elif char in '}]':
+                self._close_container()
+            elif char == ',':
+                self._expect_key = bool(self._stack) and self._stack[-1] == '{'
+                self._expected = '"' if self._expect_key else _VALUE_START
+                self._after_comma = True
+            elif char == ':':
+                self._expected = _VALUE_START
+            elif self._stack:
+                self._in_bare_value = True
+                self._last_bare_char = char
+                self._expected = None
+
+            if self.violation is not None:
+                break
+
+        return self.violation
+
+
+    def _check_token(self, char: str):
+        """Comprueba que el siguiente token significativo puede aparecer en esta posición."""
+        after_comma = self._after_comma
+        self._after_comma = False
+
+        if self._expected is None or char in self._expected:
+            return
+
+        if after_comma and char in '}]':
+            self.violation = f"Coma sobrante antes de '{char}'."
+        elif self._expected == _AFTER_VALUE and char in _ARITHMETIC_OPERATORS:
+            self.violation = f"Expresión aritmética en un valor: '{char}'."
+        else:
+            self.violation = f"Token inesperado: '{char}'."
+
+
+    def _feed_bare_char(self, char: str) -> bool:
+        """
+        Avanza la máquina de estados dentro de un número o literal (true, false, null).
+
+        Returns:
+            True si el carácter forma parte del valor, False si lo cierra y
+            debe procesarse como el siguiente token.
+        """
+        if char.isalnum() or char == '.' or (char in '+-' and self._last_bare_char in 'eE'):
+            self._last_bare_char = char
+            return True
+
+        self._in_bare_value = False
+        self._expected = _AFTER_VALUE
+        return False
+
+
+    def _feed_string_char(self, char: str):
+        """Avanza la máquina de estados dentro de una cadena."""
+        if self._escaped:
+            self._escaped = False
+            self._string_chars.append(char)
+        elif char == '\\':
+            self._escaped = True
+        elif char == '"':
+            self._in_string = False
+            self._close_string(''.join(self._string_chars))
+        else:
+            self._string_chars.append(char)
+
+
+    def _close_string(self, value: str):
+        """Clasifica una cadena recién cerrada como clave o como valor."""
+        if self._expect_key:
+            self._last_key = value
+            self._expect_key = False
+            self._expected = ':'
+            return
+
+        self._expected = _AFTER_VALUE if self._stack else None
+        if self._last_key == 'type' and value.strip().lower() in self.forbidden_types:
+            self.violation = f"Tipo de gráfico no permitido: '{value}'."
+
+
+    def _open_container(self, char: str):
+        """Registra la apertura de un objeto o lista."""
+        if (
+            char == '{'
+            and self._charts_depth is not None
+            and len(self._stack) == self._charts_depth
+        ):
+            self._n_charts += 1
+            if self._n_charts > self.max_charts:
+                self.violation = f"Se han generado más de {self.max_charts} gráficos."
+
+        if char == '[' and self._last_key == 'charts' and len(self._stack) == 1:
+            self._charts_depth = len(self._stack) + 1
+
+        self._stack.append(char)
+        self._expect_key = char == '{'
+        self._expected = '"}' if char == '{' else _VALUE_START + ']'
+
+
+    def _close_container(self):
+        """Registra el cierre de un objeto o lista."""
+        if self._stack:
+            self._stack.pop()
+        self._expect_key = False
+        self._expected = _AFTER_VALUE if self._stack else None